@@ -1,7 +1,18 @@
-from . import anix_images, models, errors
+from . import anix_images, models, errors, jsonlib
+from .cache import ResponseCache, MemoryBackend, DiskBackend
+from .ratelimit import RateLimiter, TokenBucket, endpoint_group
+from .mirrors import MirrorPool, request_not_sent
+from .retry import RetryPolicy, CircuitBreakers, RequestStats, RequestAttempts, breaker_guard, parse_retry_after
+from .store import SQLiteStore
+from .columnar import ColumnarSink
+from .checkpoints import ChannelCheckpoint, MemoryCheckpointStore, FileCheckpointStore, PageCursor
+from .watch import ArticleWatcher, AsyncArticleWatcher
+from .metrics import Hooks, MetricsCollector, RequestEvent, LatencyHistogram, TimingAdapter, pop_connect_time
 from .utils import ArticleBuilder, Style
-from typing import Optional
+from . import utils
+from typing import Any, Callable, Optional, Union, Iterable, Iterator
 import os
+import time
 try:
     import requests
 except ImportError:
@@ -17,8 +28,15 @@ class AnixartAPI:
         'tv2': "https://api-s3.anixart.tv",
         'tv3': "https://api-s4.anixart.tv",
     }
+    HEADERS = {
+        'User-Agent': f'AnixartApp/9.0 BETA 1-24121614 (Android 12; SDK 31; arm64-v8a; Xiaomi M2102J20SG; ru)',
+        'API-Version': 'v2',
+        'sign': 'U1R9MFRYVUdOQWcxUFp4OENja1JRb8xjZFdvQVBjWDdYR07BUkgzNllxRWJPOFB3ZkhvdU9JYVJSR9g2UklRcVk1SW3QV8xjMzc2fWYzMmdmZDc2NTloN0g0OGUwN0ZlOGc8N0hjN0U9Y0M3Z1NxLndhbWp2d1NqeC3lcm9iZXZ2aEdsOVAzTnJX2zqZpyRX',
+    }
 
-    def __init__(self, token: Optional[str] = None, server: str = 'com2', base_url: Optional[str] = None):
+    def __init__(self, token: Optional[str] = None, server: str = 'com2', base_url: Optional[str] = None, identity_map: bool = False, cache: Union[bool, ResponseCache] = False, rate_limit: Union[bool, RateLimiter] = False, mirrors: Union[bool, MirrorPool] = False,
+                 retry: Union[bool, RetryPolicy] = True, timeout: Union[None, float, tuple] = (5, 30), circuit_breaker: Union[bool, CircuitBreakers] = True,
+                 json_decoder: Union[None, str, Callable[[bytes], Any]] = None, metrics: Union[bool, MetricsCollector] = False):
         """
         Инициализирует клиент Anixart API.
 
@@ -30,6 +48,27 @@ class AnixartAPI:
                 - 'com2' (по умолчанию) - anixart-app.com
                 - 'tv' - anixart.tv (недоступен в РФ)
                 - 'tv1', 'tv2', 'tv3' - альтернативные зеркала
+            base_url (Optional[str]): Явный адрес API (имеет приоритет над server).
+            identity_map (bool): Если True, одинаковые Channel/Profile/Article (по id) из разных
+                ответов разделяют один экземпляр, который обновляется свежими данными.
+            cache (Union[bool, ResponseCache]): Кэш ответов читающих эндпоинтов. True — ResponseCache()
+                в памяти с TTL по умолчанию; можно передать настроенный ResponseCache (например, с DiskBackend).
+            rate_limit (Union[bool, RateLimiter]): Ограничитель частоты запросов, общий для всех потоков клиента
+                (запросы к API и загрузки в редактор). False (по умолчанию) — без ограничения,
+                True — RateLimiter() с бюджетами по умолчанию; можно передать RateLimiter со своими бюджетами групп.
+            mirrors (Union[bool, MirrorPool]): Пул зеркал с выбором по задержке и переключением при сбоях.
+                True — все SERVERS (выбранный сервер первым) с фоновыми проверками; base_url тогда
+                указывает на последнее ответившее зеркало.
+            retry (Union[bool, RetryPolicy]): Повторы запросов с экспоненциальной задержкой. True — RetryPolicy()
+                по умолчанию, False — без повторов. Изменяющие запросы повторяются, только если не дошли до сервера.
+            timeout (Union[None, float, tuple]): Таймаут запроса в секундах или (соединение, чтение); None — без таймаута.
+            circuit_breaker (Union[bool, CircuitBreakers]): Предохранитель по хостам: после серии сбоев подряд
+                запросы к хосту сразу завершаются errors.CircuitOpenError, пока хост не восстановится.
+            json_decoder (Union[None, str, Callable]): Разбор тела ответа из bytes: "orjson", "json" или своя
+                функция. По умолчанию orjson, если он установлен, иначе стандартный json.
+            metrics (Union[bool, MetricsCollector]): Сбор метрик по эндпоинтам (гистограммы задержек, статусы,
+                трафик) в self.metrics; True — MetricsCollector(). Сырые события попыток доступны через
+                self.hooks.subscribe(callback) независимо от этого параметра.
         """
         if server not in self.SERVERS:
             available = ", ".join(self.SERVERS.keys())
@@ -37,49 +76,179 @@ class AnixartAPI:
         
         self.base_url = base_url or self.SERVERS[server]
         anix_images.API_INSTANCE = self
+        self.media_tokens = anix_images.MediaTokenCache()
+        self.identity_map = models.IdentityMap() if identity_map else None
+        self.cache = ResponseCache() if cache is True else (cache or None)
+        self.rate_limiter = RateLimiter() if rate_limit is True else (rate_limit or None)
+        self.mirrors = MirrorPool([self.base_url, *self.SERVERS.values()]) if mirrors is True else (mirrors or None)
+        if self.mirrors is not None:
+            self.mirrors.start()
+        self.retry = RetryPolicy() if retry is True else (retry or None)
+        self.timeout = timeout
+        self.breakers = CircuitBreakers() if circuit_breaker is True else (circuit_breaker or None)
+        self.request_stats = RequestStats()
+        self.loads = jsonlib.get_decoder(json_decoder)
+        self.hooks = Hooks()
+        self.metrics = MetricsCollector() if metrics is True else (metrics or None)
+        if self.metrics is not None:
+            self.hooks.subscribe(self.metrics)
         self.session = requests.Session()
+        self.session.mount("http://", TimingAdapter())
+        self.session.mount("https://", TimingAdapter())
         self.token = token
-        self.session.headers.update({
-            'User-Agent': f'AnixartApp/9.0 BETA 1-24121614 (Android 12; SDK 31; arm64-v8a; Xiaomi M2102J20SG; ru)',
-            'API-Version': 'v2',
-            'sign': 'U1R9MFRYVUdOQWcxUFp4OENja1JRb8xjZFdvQVBjWDdYR07BUkgzNllxRWJPOFB3ZkhvdU9JYVJSR9g2UklRcVk1SW3QV8xjMzc2fWYzMmdmZDc2NTloN0g0OGUwN0ZlOGc8N0hjN0U9Y0M3Z1NxLndhbWp2d1NqeC3lcm9iZXZ2aEdsOVAzTnJX2zqZpyRX',
-        })
+        self.session.headers.update(self.HEADERS)
         if token:
             self.session.params = {"token": token}
 
+    def _request(self, method: str, endpoint: str, data=None, use_cache: bool = True) -> dict:
+        if self.cache is not None and use_cache:
+            cached = self.cache.get(method, endpoint, data)
+            if cached is not None:
+                return cached
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(self.rate_limiter.group_for(method, endpoint))
+        response = self._send(method, endpoint, data)
+        if self.cache is not None:
+            self.cache.store(method, endpoint, data, response)
+        return response
+
+    def request_raw(self, method: str, endpoint: str, data=None) -> bytes:
+        """
+        Выполняет запрос к API и возвращает тело ответа без разбора (например, для
+        пересылки клиентам как есть). Ограничение частоты, повторы и пул зеркал
+        применяются как обычно, кэш ответов — нет.
+        """
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(self.rate_limiter.group_for(method, endpoint))
+        return self._send(method, endpoint, data, raw=True)
+
+    def _send(self, method: str, endpoint: str, data=None, raw: bool = False) -> Union[dict, bytes]:
+        """
+        Отправляет запрос с повторами по self.retry и возвращает JSON, разобранный
+        self.loads (или тело ответа как есть при raw=True).
+        Если запрос так и не удался, выбрасывает errors.RequestError.
+        """
+        attempts = RequestAttempts(self, method, endpoint)
+        while True:
+            event = attempts.start()
+            try:
+                status, body, retry_after = self._send_once(method, endpoint, data, attempts.is_write, event)
+            except errors.CircuitOpenError:
+                attempts.circuit_open()
+                raise
+            except requests.RequestException as e:
+                attempts.failed(e, isinstance(e, requests.Timeout), request_not_sent(e))
+            else:
+                if attempts.completed(status, body, retry_after, raw):
+                    return attempts.result
+            delay = attempts.retry_delay()
+            if delay is None:
+                raise attempts.error from attempts.cause
+            time.sleep(delay)
+
+    def _send_once(self, method: str, endpoint: str, data, is_write: bool, event: Optional[RequestEvent] = None) -> tuple:
+        """
+        Одна попытка запроса. В режиме пула зеркал запрос уходит на лучшее зеркало,
+        а при ошибке соединения, ответе 5xx или разомкнутом предохранителе — на
+        следующее (см. MirrorPool.record_error и record_reply).
+        """
+        if self.mirrors is None:
+            return self._send_to(self.base_url, method, endpoint, data, event)
+        candidates = self.mirrors.candidates()
+        for base_url in candidates:
+            is_last = base_url == candidates[-1]
+            start = time.monotonic()
+            try:
+                reply = self._send_to(base_url, method, endpoint, data, event)
+            except errors.CircuitOpenError:
+                if is_last:
+                    raise
+                continue
+            except requests.RequestException as e:
+                if not self.mirrors.record_error(base_url, is_last, is_write, request_not_sent(e)):
+                    raise
+                continue
+            if not self.mirrors.record_reply(base_url, reply[0], time.monotonic() - start, is_last, is_write):
+                self.base_url = base_url
+                return reply
+
+    def _send_to(self, base_url: str, method: str, endpoint: str, data=None, event: Optional[RequestEvent] = None) -> tuple:
+        """Отправляет запрос на base_url и возвращает (статус, тело ответа, Retry-After)."""
+        if event is not None:
+            event.mirror = base_url
+        with breaker_guard(self.breakers, base_url, requests.RequestException) as breaker:
+            self.request_stats.add("attempts")
+            if event is not None:
+                pop_connect_time()
+            try:
+                response = self.session.request(method, f"{base_url}{endpoint}", json=data, timeout=self.timeout)
+            finally:
+                if event is not None:
+                    event.connect = pop_connect_time()
+            if breaker is not None:
+                breaker.record_status(response.status_code)
+        if event is not None:
+            event.status = response.status_code
+            event.ttfb = response.elapsed.total_seconds()
+            event.bytes_out = len(response.request.body or b"")
+            event.bytes_in = len(response.content)
+        return response.status_code, response.content, response.headers.get("Retry-After")
+
     def _get(self, endpoint) -> dict:
-        url = f"{self.base_url}{endpoint}"
-        response = self.session.get(url)
-        return response.json()
+        return self._request("GET", endpoint)
 
     def _post(self, endpoint, data=None) -> dict:
-        url = f"{self.base_url}{endpoint}"
-        response = self.session.post(url, json=data)
-        return response.json()
+        return self._request("POST", endpoint, data)
     
     def get_channel(self, channel_id: int) -> models.Channel:
         response = self._get(f"/channel/{channel_id}")
         if response["code"] == 0:
-            return models.Channel(response["channel"], self)
+            return models.resolve(models.Channel, response["channel"], self)
         else:
             raise errors.ChannelGetError(response["code"])
     
-    def get_article(self, article_id: int) -> models.Article:
+    def get_article(self, article_id: int, fields: Optional[Iterable[str]] = None) -> models.Article:
+        """
+        Args:
+            article_id: id статьи.
+            fields: Загрузить только эти поля статьи, например ("vote_count", "channel.title")
+                (см. utils.projector). Остальное содержимое ответа не сохраняется в модели.
+        """
         response = self._post(f"/article/{article_id}")
         if response["code"] == 0:
-            return models.Article(response["article"], self)
+            data = response["article"] if fields is None else utils.projector(fields)(response["article"])
+            return models.resolve(models.Article, data, self)
         else:
             raise errors.ArticleGetError(response["code"])
     
+    def get_articles(self, article_ids: Iterable[int], max_workers: int = 8, stream: bool = False) -> Union[list[Union[models.Article, errors.AnixartError]], Iterator[tuple[int, Union[models.Article, errors.AnixartError]]]]:
+        """
+        Загружает несколько статей параллельно (повторяющиеся id запрашиваются один раз).
+
+        Returns:
+            - stream=False: список в порядке article_ids; для неудачных id вместо статьи
+              стоит исключение (например, ArticleGetError с кодом 3 — статья удалена).
+            - stream=True: итератор пар (id, статья или исключение) по мере готовности.
+        """
+        if stream:
+            return utils.iter_fetch_many(self.get_article, article_ids, max_workers)
+        return utils.fetch_many(self.get_article, article_ids, max_workers)
+
+    def get_channels(self, channel_ids: Iterable[int], max_workers: int = 8, stream: bool = False) -> Union[list[Union[models.Channel, errors.AnixartError]], Iterator[tuple[int, Union[models.Channel, errors.AnixartError]]]]:
+        """Загружает несколько каналов параллельно, см. get_articles."""
+        if stream:
+            return utils.iter_fetch_many(self.get_channel, channel_ids, max_workers)
+        return utils.fetch_many(self.get_channel, channel_ids, max_workers)
+    
     def get_article_suggestion(self, article_id: int) -> models.ArticleSuggestion:
         response = self._post(f"/article/suggestion/{article_id}")
         if response["code"] == 0:
-            return models.ArticleSuggestion(response["articleSuggestion"], self)
+            return models.resolve(models.ArticleSuggestion, response["articleSuggestion"], self)
         else:
             raise errors.ArticleGetError(response["code"])
     
-    def get_latest_article_id(self) -> int:
-        response = self._get(f"/article/latest")
+    def get_latest_article_id(self, use_cache: bool = True) -> int:
+        response = self._request("GET", "/article/latest", use_cache=use_cache)
         if response["code"] == 0:
             return response["articleId"]
         else:
@@ -87,3 +256,14 @@ class AnixartAPI:
     
     def get_latest_article(self) -> models.Article:
         return self.get_article(self.get_latest_article_id())
+
+    def watch_articles(self, since: Optional[int] = None, min_interval: float = 1.0, max_interval: float = 60.0, max_workers: int = 8) -> ArticleWatcher:
+        """
+        Итератор новых статей: опрашивает /article/latest с интервалом, подстроенным
+        под частоту публикаций, и выдаёт каждую новую статью один раз в порядке id,
+        включая id, появившиеся между опросами. См. ArticleWatcher.
+        """
+        return ArticleWatcher(self, since, min_interval, max_interval, max_workers)
+
+
+from .aio import AsyncAnixartAPI
@@ -0,0 +1,619 @@
+import asyncio
+import time
+from datetime import datetime
+from functools import partial
+from typing import Any, Callable, Optional, Union, Iterable, AsyncIterator, TYPE_CHECKING
+from . import anix_images, checkpoints, enums, errors, jsonlib, models, utils
+from .cache import ResponseCache
+from .ratelimit import RateLimiter
+from .mirrors import MirrorPool
+from .retry import RetryPolicy, CircuitBreakers, RequestStats, RequestAttempts, breaker_guard
+from .metrics import Hooks, MetricsCollector, RequestEvent
+from .watch import AsyncArticleWatcher
+from .models.base import lazy
+from .models.payload import Payload
+from .models.user_vote import UserVote
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+if TYPE_CHECKING:
+    from .utils import AsyncPaginator
+
+
+def _timing_trace_config() -> "aiohttp.TraceConfig":
+    """Заполняет RequestEvent (trace_request_ctx запроса) временами DNS, соединения и первого байта."""
+    trace = aiohttp.TraceConfig()
+
+    def phase_start(name):
+        async def callback(session, context, params):
+            if context.trace_request_ctx is not None:
+                setattr(context, name, time.perf_counter())
+        return callback
+
+    def phase_end(name):
+        async def callback(session, context, params):
+            event = context.trace_request_ctx
+            if event is not None and hasattr(context, name):
+                setattr(event, name, time.perf_counter() - getattr(context, name))
+        return callback
+
+    async def on_chunk_sent(session, context, params):
+        if context.trace_request_ctx is not None:
+            context.trace_request_ctx.bytes_out += len(params.chunk)
+
+    async def on_headers_received(session, context, params):
+        event = context.trace_request_ctx
+        if event is not None:
+            event.ttfb = time.perf_counter() - event._start
+
+    trace.on_dns_resolvehost_start.append(phase_start("dns"))
+    trace.on_dns_resolvehost_end.append(phase_end("dns"))
+    trace.on_connection_create_start.append(phase_start("connect"))
+    trace.on_connection_create_end.append(phase_end("connect"))
+    trace.on_request_chunk_sent.append(on_chunk_sent)
+    trace.on_request_end.append(on_headers_received)
+    return trace
+
+
+async def _run_sync(func, *args, **kwargs):
+    """Выполняет блокирующую функцию (загрузка медиа, сборка статьи) в пуле потоков."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, partial(func, *args, **kwargs))
+
+
+async def _run_uploads(api, func, *args, **kwargs):
+    """_run_sync для загрузок через anix_images от имени асинхронного клиента api (см. anix_images.use_api)."""
+    def run():
+        with anix_images.use_api(api):
+            return func(*args, **kwargs)
+    return await _run_sync(run)
+
+
+class AsyncChannelMember(models.ChannelMember):
+    __slots__ = ("__api",)
+
+    def __init__(self, data: dict, api):
+        super().__init__(data, api)
+        self.__api = api
+
+    async def block(self, reason: str, expire_date: Union[datetime, int] = None, show_reason: bool = True) -> "AsyncChannelMember":
+        response = await self.__api._post(f"/channel/{self.channel_id}/block/manage", {"target_profile_id": self.id, "is_blocked": True, "reason": reason, "expire_date": expire_date, "is_reason_showing_enabled": show_reason, "is_perm_blocked": expire_date == None})
+        if response["code"] == 0:
+            self.is_blocked = True
+            self.block_reason = reason
+            self.block_expire_date = expire_date
+        else:
+            raise errors.ChannelBlockError(response["code"])
+        return self
+
+    async def unblock(self) -> "AsyncChannelMember":
+        response = await self.__api._post(f"/channel/{self.channel_id}/block/manage", {"target_profile_id": self.id, "is_blocked": False, "is_perm_blocked": False})
+        if response["code"] == 0:
+            self.is_blocked = False
+            self.is_perm_blocked = False
+            self.block_reason = None
+            self.block_expire_date = None
+        else:
+            raise errors.ChannelBlockError(response["code"])
+        return self
+
+    async def set_permission(self, permission: Optional[Union[enums.ChannelMemberPermission, int]]) -> "AsyncChannelMember":
+        if permission == enums.ChannelMemberPermission.MEMBER:
+            permission = None
+        response = await self.__api._post(f"/channel/{self.channel_id}/permission/manage", {"target_profile_id": self.id, "permission": permission})
+        if response["code"] == 0:
+            self.permission = enums.ChannelMemberPermission(permission or 0)
+            self.permission_creation_date = datetime.now() if permission else None
+            if permission == enums.ChannelMemberPermission.ADMINISTRATOR:
+                self.is_blocked = False
+                self.is_perm_blocked = False
+                self.block_reason = None
+                self.block_expire_date = None
+        else:
+            raise errors.ChannelPermissionManageError(response["code"])
+        return self
+
+
+class AsyncChannel(models.Channel):
+    __slots__ = ("__api",)
+
+    def __init__(self, data: dict, api):
+        super().__init__(data, api)
+        self.__api = api
+
+    async def update_settings(self, title: Optional[str] = None, description: Optional[str] = None, is_commenting_enabled: Optional[bool] = None, is_article_suggestion_enabled: Optional[bool] = None) -> "AsyncChannel":
+        """Обновляет настройки канала."""
+        payload = {
+            "title": title or self.title,
+            "description": description or self.description,
+            "is_commenting_enabled": is_commenting_enabled or self.is_commenting_enabled,
+            "is_article_suggestion_enabled": is_article_suggestion_enabled or self.is_article_suggestion_enabled
+        }
+        response = await self.__api._post(f"/channel/edit/{self.id}", payload)
+        if response["code"] == 0:
+            self.title = payload["title"]
+            self.description = payload["description"]
+            self.is_commenting_enabled = payload["is_commenting_enabled"]
+            self.is_article_suggestion_enabled = payload["is_article_suggestion_enabled"]
+        else:
+            raise errors.ChannelCreateEditError(response["code"])
+        return self
+
+    async def create_article(self, article_data: Union[utils.ArticleBuilder, dict], repost_article_id: Optional[int] = None) -> "AsyncArticle":
+        if isinstance(article_data, utils.ArticleBuilder):
+            article_data = await _run_uploads(self.__api, article_data.build, channel_id=self.id)
+        if repost_article_id is not None:
+            article_data["repost_article_id"] = repost_article_id
+        response = await self.__api._post(f"/article/create/{self.id}", article_data)
+        if response["code"] == 0:
+            return models.resolve(AsyncArticle, response["article"], self.__api)
+        else:
+            raise errors.ArticleCreateEditError(response["code"])
+
+    async def suggest_article(self, article_data: Union[utils.ArticleBuilder, dict]) -> "AsyncArticleSuggestion":
+        if isinstance(article_data, utils.ArticleBuilder):
+            article_data = await _run_uploads(self.__api, article_data.build, channel_id=self.id, is_suggestion=True)
+        response = await self.__api._post(f"/article/suggestion/create/{self.id}", article_data)
+        if response["code"] == 0:
+            return models.resolve(AsyncArticleSuggestion, response["article"], self.__api)
+        else:
+            raise errors.ArticleCreateEditError(response["code"])
+
+    async def subscribe(self) -> "AsyncChannel":
+        response = await self.__api._post(f"/channel/subscribe/{self.id}")
+        if response["code"] == 0:
+            self.is_subscribed = True
+        else:
+            raise errors.ChannelSubscribeError(response["code"])
+        return self
+
+    async def unsubscribe(self) -> "AsyncChannel":
+        response = await self.__api._post(f"/channel/unsubscribe/{self.id}")
+        if response["code"] == 0:
+            self.is_subscribed = False
+        else:
+            raise errors.ChannelUnsubscribeError(response["code"])
+        return self
+
+    async def _fetch_suggestions_page(self, page: int, build: Optional[Callable[[list], list]] = None) -> tuple[list["AsyncArticleSuggestion"], int]:
+        response = await self.__api._post(f"/article/suggestion/all/{page}", {"channel_id": self.id})
+        if response["code"] == 0:
+            items = build(response["content"]) if build else [models.resolve(AsyncArticleSuggestion, suggestion, self.__api) for suggestion in response["content"]]
+            return items, response["total_page_count"]
+        raise errors.AnixartError(response["code"], "Ошибка загрузки предложенных записей канала")
+
+    def get_suggestions(self, page: Union[int, range, None] = None, prefetch: int = 0, raw: bool = False, factory: Optional[Callable[[dict], Any]] = None, fields: Optional[Iterable[str]] = None) -> "AsyncPaginator":
+        build = utils.item_builder(raw, factory, fields, lambda data: AsyncArticleSuggestion(data, self.__api))
+        return utils.async_paginate(lambda pg: self._fetch_suggestions_page(pg, build), page, prefetch, "/article/suggestion/all", {"channel_id": self.id})
+
+    async def _fetch_members_page(self, page: int, build: Optional[Callable[[list], list]] = None) -> tuple[list[AsyncChannelMember], int]:
+        response = await self.__api._get(f"/channel/{self.id}/subscriber/all/{page}")
+        if response["code"] == 0:
+            items = build(response["content"]) if build else [AsyncChannelMember(member, self.__api) for member in response["content"]]
+            return items, response["total_page_count"]
+        raise errors.AnixartError(response["code"], "Ошибка загрузки участников канала")
+
+    def get_members(self, page: Union[int, range, None] = None, prefetch: int = 0, raw: bool = False, factory: Optional[Callable[[dict], Any]] = None, fields: Optional[Iterable[str]] = None) -> "AsyncPaginator":
+        build = utils.item_builder(raw, factory, fields, lambda data: AsyncChannelMember(data, self.__api))
+        return utils.async_paginate(lambda pg: self._fetch_members_page(pg, build), page, prefetch, f"/channel/{self.id}/subscriber/all", None)
+
+    async def _fetch_administrators_page(self, permission: Union[enums.ChannelMemberPermission, int], page: int, build: Optional[Callable[[list], list]] = None) -> tuple[list[AsyncChannelMember], int]:
+        response = await self.__api._post(f"/channel/{self.id}/permission/all/{page}", {"permission": permission})
+        if response["code"] == 0:
+            items = build(response["content"]) if build else [AsyncChannelMember(member, self.__api) for member in response["content"]]
+            return items, response["total_page_count"]
+        raise errors.AnixartError(response["code"], "Ошибка загрузки администраторов")
+
+    def get_administrators(self,
+                        permission: Union[enums.ChannelMemberPermission, int] = enums.ChannelMemberPermission.ADMINISTRATOR,
+                        page: Union[int, range, None] = None, prefetch: int = 0, raw: bool = False, factory: Optional[Callable[[dict], Any]] = None, fields: Optional[Iterable[str]] = None) -> "AsyncPaginator":
+        build = utils.item_builder(raw, factory, fields, lambda data: AsyncChannelMember(data, self.__api))
+        return utils.async_paginate(lambda pg: self._fetch_administrators_page(permission, pg, build), page, prefetch, f"/channel/{self.id}/permission/all", {"permission": permission})
+
+    async def _fetch_blocked_members_page(self, page: int, build: Optional[Callable[[list], list]] = None) -> tuple[list[AsyncChannelMember], int]:
+        response = await self.__api._get(f"/channel/{self.id}/block/all/{page}")
+        if response["code"] == 0:
+            items = build(response["content"]) if build else [AsyncChannelMember(member, self.__api) for member in response["content"]]
+            return items, response["total_page_count"]
+        raise errors.AnixartError(response["code"], "Ошибка загрузки заблокированных пользователей")
+
+    def get_blocked_members(self, page: Union[int, range, None] = None, prefetch: int = 0, raw: bool = False, factory: Optional[Callable[[dict], Any]] = None, fields: Optional[Iterable[str]] = None) -> "AsyncPaginator":
+        build = utils.item_builder(raw, factory, fields, lambda data: AsyncChannelMember(data, self.__api))
+        return utils.async_paginate(lambda pg: self._fetch_blocked_members_page(pg, build), page, prefetch, f"/channel/{self.id}/block/all", None)
+
+    async def _fetch_articles_page(self, date_filter: Union[enums.DateFilter, int], page: int, build: Optional[Callable[[list], list]] = None) -> tuple[list["AsyncArticle"], int]:
+        response = await self.__api._post(f"/article/all/{page}", {"channel_id": self.id, "date": date_filter})
+        if response["code"] == 0:
+            items = build(response["content"]) if build else [models.resolve(AsyncArticle, article, self.__api) for article in response["content"]]
+            return items, response["total_page_count"]
+        raise errors.AnixartError(response["code"], "Ошибка загрузки статей канала")
+
+    def get_articles(self, date_filter: Union[enums.DateFilter, int] = enums.DateFilter.NONE, page: Union[int, range, None] = None, prefetch: int = 0, raw: bool = False, factory: Optional[Callable[[dict], Any]] = None, fields: Optional[Iterable[str]] = None) -> "AsyncPaginator":
+        build = utils.item_builder(raw, factory, fields, lambda data: AsyncArticle(data, self.__api))
+        return utils.async_paginate(lambda pg: self._fetch_articles_page(date_filter, pg, build), page, prefetch, "/article/all", {"channel_id": self.id, "date": date_filter})
+
+    async def sync_articles(self, since: Union[checkpoints.ChannelCheckpoint, dict, None] = None, store=None, max_pages: Optional[int] = None) -> tuple[list["AsyncArticle"], checkpoints.ChannelCheckpoint]:
+        store = checkpoints.get_store(store)
+        checkpoint = checkpoints.load_channel_checkpoint(self.id, since, store)
+        fresh, seen = [], {}
+        page, total_pages = 0, 1
+        while page < total_pages and (max_pages is None or page < max_pages):
+            items, total_pages = await self._fetch_articles_page(enums.DateFilter.NONE, page)
+            changed = checkpoint.diff(items, seen)
+            fresh.extend(changed)
+            page += 1
+            if not items or (len(checkpoint) and not changed):
+                break
+        checkpoint.update(seen)
+        if store is not None:
+            await _run_sync(store.save, checkpoint.key(self.id), checkpoint.to_dict())
+        return fresh, checkpoint
+
+    async def set_avatar(self, file: str) -> "AsyncChannel":
+        response = await _run_uploads(self.__api, anix_images.upload_avatar, self.id, file, self.is_blog)
+        if response["code"] == 0:
+            self.avatar = response["url"] if not self.is_blog else response["avatar"]
+        else:
+            raise errors.ChannelUploadCoverAvatarError(response["code"])
+        return self
+
+    async def set_cover(self, file: str) -> "AsyncChannel":
+        response = await _run_uploads(self.__api, anix_images.upload_cover, self.id, file)
+        if response["code"] == 0:
+            self.cover = response["url"]
+        else:
+            raise errors.ChannelUploadCoverAvatarError(response["code"])
+        return self
+
+
+class AsyncArticle(models.Article):
+    __slots__ = ("__api",)
+
+    def __init__(self, data: dict, api):
+        super().__init__(data, api)
+        self.__api = api
+
+    @lazy
+    def channel(self, data: dict) -> AsyncChannel:
+        return models.resolve(AsyncChannel, data["channel"], self.__api)
+
+    @lazy
+    def repost_article(self, data: dict) -> Optional["AsyncArticle"]:
+        return models.resolve(AsyncArticle, data["repost_article"], self.__api) if data.get("repost_article") else None
+
+    async def edit(self, article_data: Union[utils.ArticleBuilder, dict], repost_article_id: Optional[int] = None) -> "AsyncArticle":
+        if isinstance(article_data, utils.ArticleBuilder):
+            article_data = await _run_uploads(self.__api, article_data.build, channel_id=self.channel.id, is_edit_mode=True)
+        if repost_article_id is not None:
+            article_data["repost_article_id"] = repost_article_id
+        response = await self.__api._post(f"/article/edit/{self.id}", article_data)
+        if response["code"] == 0:
+            self.payload = Payload(article_data["payload"])
+            self.repost_article = models.resolve(AsyncArticle, response["article"]["repost_article"], self.__api) if response["article"]["repost_article"] else None
+        else:
+            raise errors.ArticleCreateEditError(response["code"])
+        return self
+
+    async def delete(self) -> "AsyncArticle":
+        response = await self.__api._post(f"/article/delete/{self.id}")
+        if response["code"] == 0:
+            self.is_deleted = True
+        else:
+            raise errors.AnixartError(response["code"], "Статья не найдена.")
+        return self
+
+    async def set_vote(self, vote: Union[enums.Vote, int]) -> dict:
+        response = await self.__api._get(f"/article/vote/{self.id}/{vote}")
+        if response["code"] == 0:
+            self.vote = enums.Vote(vote)
+        else:
+            raise errors.DefaultError(response["code"])
+        return response
+
+    async def _fetch_votes_page(self, sort: enums.Sorting, page: int, build: Optional[Callable[[list], list]] = None) -> tuple[list[UserVote], int]:
+        response = await self.__api._get(f"/article/votes/{self.id}/{page}?sort={sort}")
+        if response["code"] == 0:
+            items = build(response["content"]) if build else [UserVote(vote) for vote in response["content"]]
+            return items, response["total_page_count"]
+        raise errors.AnixartError(response["code"], "Ошибка загрузки голосов")
+
+    def get_votes(self, sort: enums.Sorting, page: Union[int, range, None] = None, prefetch: int = 0, raw: bool = False, factory: Optional[Callable[[dict], Any]] = None, fields: Optional[Iterable[str]] = None) -> "AsyncPaginator":
+        build = utils.item_builder(raw, factory, fields, UserVote)
+        return utils.async_paginate(lambda pg: self._fetch_votes_page(sort, pg, build), page, prefetch, f"/article/votes/{self.id}", {"sort": sort})
+
+    async def _fetch_reposts_page(self, sort: enums.Sorting, page: int, build: Optional[Callable[[list], list]] = None) -> tuple[list["AsyncArticle"], int]:
+        response = await self.__api._get(f"/article/reposts/{self.id}/{page}?sort={sort}")
+        if response["code"] == 0:
+            items = build(response["content"]) if build else [models.resolve(AsyncArticle, repost, self.__api) for repost in response["content"]]
+            return items, response["total_page_count"]
+        raise errors.AnixartError(response["code"], "Ошибка загрузки репостов")
+
+    def get_reposts(self, sort: enums.Sorting, page: Union[int, range, None] = None, prefetch: int = 0, raw: bool = False, factory: Optional[Callable[[dict], Any]] = None, fields: Optional[Iterable[str]] = None) -> "AsyncPaginator":
+        build = utils.item_builder(raw, factory, fields, lambda data: AsyncArticle(data, self.__api))
+        return utils.async_paginate(lambda pg: self._fetch_reposts_page(sort, pg, build), page, prefetch, f"/article/reposts/{self.id}", {"sort": sort})
+
+    async def _fetch_comments_page(self, sort: enums.Sorting, page: int, build: Optional[Callable[[list], list]] = None) -> tuple[list["AsyncArticleComment"], int]:
+        response = await self.__api._get(f"/article/comment/all/{self.id}/{page}?sort={sort}")
+        if response["code"] == 0:
+            items = build(response["content"]) if build else [AsyncArticleComment(comment, self.__api) for comment in response["content"]]
+            return items, response["total_page_count"]
+        raise errors.AnixartError(response["code"], "Ошибка загрузки комментариев")
+
+    def get_comments(self, sort: enums.Sorting, page: Union[int, range, None] = 0, prefetch: int = 0, raw: bool = False, factory: Optional[Callable[[dict], Any]] = None, fields: Optional[Iterable[str]] = None) -> "AsyncPaginator":
+        build = utils.item_builder(raw, factory, fields, lambda data: AsyncArticleComment(data, self.__api))
+        return utils.async_paginate(lambda pg: self._fetch_comments_page(sort, pg, build), page, prefetch, f"/article/comment/all/{self.id}", {"sort": sort})
+
+
+class AsyncArticleSuggestion(models.ArticleSuggestion):
+    __slots__ = ("__api",)
+
+    def __init__(self, data: dict, api):
+        super().__init__(data, api)
+        self.__api = api
+
+    @lazy
+    def channel(self, data: dict) -> AsyncChannel:
+        return models.resolve(AsyncChannel, data["channel"], self.__api)
+
+    @lazy
+    def repost_article(self, data: dict) -> Optional["AsyncArticle"]:
+        return models.resolve(AsyncArticle, data["repost_article"], self.__api) if data.get("repost_article") else None
+
+    async def edit(self, article_data: Union[utils.ArticleBuilder, dict]) -> "AsyncArticleSuggestion":
+        if isinstance(article_data, utils.ArticleBuilder):
+            article_data = await _run_uploads(self.__api, article_data.build, channel_id=self.channel.id, is_suggestion=True, is_edit_mode=True)
+        response = await self.__api._post(f"/article/suggestion/edit/{self.id}", article_data)
+        if response["code"] == 0:
+            self.payload = Payload(article_data["payload"])
+        else:
+            raise errors.ArticleCreateEditError(response["code"])
+        return self
+
+    async def delete(self) -> "AsyncArticleSuggestion":
+        response = await self.__api._post(f"/article/suggestion/delete/{self.id}")
+        if response["code"] == 0:
+            self.is_deleted = True
+        else:
+            raise errors.ArticleSuggestionDeleteError(response["code"])
+        return self
+
+    async def publish(self) -> "AsyncArticleSuggestion":
+        response = await self.__api._post(f"/article/suggestion/publish/{self.id}")
+        if response["code"] == 0:
+            self.creation_date = int(datetime.now().timestamp())
+        else:
+            raise errors.ArticleSuggestionPublishError(response["code"])
+        return self
+
+
+class AsyncArticleComment(models.ArticleComment):
+    __slots__ = ("__api",)
+
+    def __init__(self, data: dict, api):
+        super().__init__(data, api)
+        self.__api = api
+
+    @lazy
+    def article(self, data: dict) -> AsyncArticle:
+        return models.resolve(AsyncArticle, data["article"], self.__api)
+
+
+class AsyncAnixartAPI:
+    def __init__(self, token: Optional[str] = None, server: str = 'com2', base_url: Optional[str] = None, max_connections: int = 100, identity_map: bool = False, cache: Union[bool, ResponseCache] = False, rate_limit: Union[bool, RateLimiter] = False, mirrors: Union[bool, MirrorPool] = False,
+                 retry: Union[bool, RetryPolicy] = True, timeout: Union[None, float, tuple] = (5, 30), circuit_breaker: Union[bool, CircuitBreakers] = True,
+                 json_decoder: Union[None, str, Callable[[bytes], Any]] = None, metrics: Union[bool, MetricsCollector] = False):
+        """
+        Инициализирует асинхронный клиент Anixart API.
+
+        Args:
+            token (Optional[str]): Токен аутентификации для Anixart API.
+            server (str): Выбор сервера, см. AnixartAPI.SERVERS.
+            base_url (Optional[str]): Явный адрес API (имеет приоритет над server).
+            max_connections (int): Размер пула соединений aiohttp.
+            identity_map (bool): Общие экземпляры моделей по id, см. AnixartAPI.
+            cache (Union[bool, ResponseCache]): Кэш ответов читающих эндпоинтов, см. AnixartAPI.
+            rate_limit (Union[bool, RateLimiter]): Ограничитель частоты запросов, см. AnixartAPI.
+            mirrors (Union[bool, MirrorPool]): Пул зеркал с переключением при сбоях, см. AnixartAPI.
+            retry (Union[bool, RetryPolicy]): Повторы запросов, см. AnixartAPI.
+            timeout (Union[None, float, tuple]): Таймаут запроса в секундах или (соединение, чтение).
+            circuit_breaker (Union[bool, CircuitBreakers]): Предохранитель по хостам, см. AnixartAPI.
+            json_decoder (Union[None, str, Callable]): Разбор тела ответа из bytes, см. AnixartAPI.
+            metrics (Union[bool, MetricsCollector]): Сбор метрик по эндпоинтам, см. AnixartAPI.
+        """
+        if aiohttp is None:
+            raise ImportError("Для AsyncAnixartAPI требуется aiohttp: pip install anixartpy[async]")
+        from . import AnixartAPI
+        if server not in AnixartAPI.SERVERS:
+            available = ", ".join(AnixartAPI.SERVERS.keys())
+            raise ValueError(f"Неизвестный сервер. Доступные варианты: {available}")
+
+        self.base_url = base_url or AnixartAPI.SERVERS[server]
+        self.media_tokens = anix_images.MediaTokenCache()
+        self.identity_map = models.IdentityMap() if identity_map else None
+        self.cache = ResponseCache() if cache is True else (cache or None)
+        self.rate_limiter = RateLimiter() if rate_limit is True else (rate_limit or None)
+        self.mirrors = MirrorPool([self.base_url, *AnixartAPI.SERVERS.values()]) if mirrors is True else (mirrors or None)
+        if self.mirrors is not None:
+            self.mirrors.start()
+        self.retry = RetryPolicy() if retry is True else (retry or None)
+        self.timeout = timeout
+        self.breakers = CircuitBreakers() if circuit_breaker is True else (circuit_breaker or None)
+        self.request_stats = RequestStats()
+        self.loads = jsonlib.get_decoder(json_decoder)
+        self.hooks = Hooks()
+        self.metrics = MetricsCollector() if metrics is True else (metrics or None)
+        if self.metrics is not None:
+            self.hooks.subscribe(self.metrics)
+        self.token = token
+        self.max_connections = max_connections
+        self.headers = dict(AnixartAPI.HEADERS)
+        self.params = {"token": token} if token else {}
+        self.session: Optional["aiohttp.ClientSession"] = None
+
+    @property
+    def _timeout(self) -> "aiohttp.ClientTimeout":
+        if isinstance(self.timeout, tuple):
+            return aiohttp.ClientTimeout(sock_connect=self.timeout[0], sock_read=self.timeout[1])
+        return aiohttp.ClientTimeout(total=self.timeout)
+
+    async def _get_session(self) -> "aiohttp.ClientSession":
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                headers=self.headers,
+                connector=aiohttp.TCPConnector(limit=self.max_connections),
+                trace_configs=[_timing_trace_config()],
+            )
+        return self.session
+
+    async def close(self):
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+
+    async def __aenter__(self) -> "AsyncAnixartAPI":
+        await self._get_session()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def _request(self, method: str, endpoint: str, data=None, use_cache: bool = True) -> dict:
+        if self.cache is not None and use_cache:
+            cached = self.cache.get(method, endpoint, data)
+            if cached is not None:
+                return cached
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async(self.rate_limiter.group_for(method, endpoint))
+        result = await self._send(method, endpoint, data)
+        if self.cache is not None:
+            self.cache.store(method, endpoint, data, result)
+        return result
+
+    async def request_raw(self, method: str, endpoint: str, data=None) -> bytes:
+        """Выполняет запрос к API и возвращает тело ответа без разбора, см. AnixartAPI.request_raw."""
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async(self.rate_limiter.group_for(method, endpoint))
+        return await self._send(method, endpoint, data, raw=True)
+
+    async def _send(self, method: str, endpoint: str, data=None, raw: bool = False) -> Union[dict, bytes]:
+        """Запрос с повторами по self.retry, см. AnixartAPI._send."""
+        attempts = RequestAttempts(self, method, endpoint)
+        while True:
+            event = attempts.start()
+            try:
+                status, body, retry_after = await self._send_once(method, endpoint, data, attempts.is_write, event)
+            except errors.CircuitOpenError:
+                attempts.circuit_open()
+                raise
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                attempts.failed(e, isinstance(e, asyncio.TimeoutError), isinstance(e, aiohttp.ClientConnectorError))
+            else:
+                if attempts.completed(status, body, retry_after, raw):
+                    return attempts.result
+            delay = attempts.retry_delay()
+            if delay is None:
+                raise attempts.error from attempts.cause
+            await asyncio.sleep(delay)
+
+    async def _send_once(self, method: str, endpoint: str, data, is_write: bool, event: Optional[RequestEvent] = None) -> tuple:
+        """Одна попытка запроса (через пул зеркал, если он задан), см. AnixartAPI._send_once."""
+        if self.mirrors is None:
+            return await self._send_to(self.base_url, method, endpoint, data, event)
+        candidates = self.mirrors.candidates()
+        for base_url in candidates:
+            is_last = base_url == candidates[-1]
+            start = time.monotonic()
+            try:
+                reply = await self._send_to(base_url, method, endpoint, data, event)
+            except errors.CircuitOpenError:
+                if is_last:
+                    raise
+                continue
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if not self.mirrors.record_error(base_url, is_last, is_write, isinstance(e, aiohttp.ClientConnectorError)):
+                    raise
+                continue
+            if not self.mirrors.record_reply(base_url, reply[0], time.monotonic() - start, is_last, is_write):
+                self.base_url = base_url
+                return reply
+
+    async def _send_to(self, base_url: str, method: str, endpoint: str, data=None, event: Optional[RequestEvent] = None) -> tuple:
+        """Отправляет запрос на base_url и возвращает (статус, тело ответа, Retry-After)."""
+        if event is not None:
+            event.mirror = base_url
+        with breaker_guard(self.breakers, base_url, (aiohttp.ClientError, asyncio.TimeoutError)) as breaker:
+            self.request_stats.add("attempts")
+            session = await self._get_session()
+            async with session.request(method, f"{base_url}{endpoint}", json=data, params=self.params,
+                                       timeout=self._timeout, trace_request_ctx=event) as response:
+                body = await response.read()
+                reply = (response.status, body, response.headers.get("Retry-After"))
+            if breaker is not None:
+                breaker.record_status(response.status)
+        if event is not None:
+            event.status = response.status
+            event.bytes_in = len(body)
+        return reply
+
+    async def _get(self, endpoint) -> dict:
+        return await self._request("GET", endpoint)
+
+    async def _post(self, endpoint, data=None) -> dict:
+        return await self._request("POST", endpoint, data)
+
+    async def get_channel(self, channel_id: int) -> AsyncChannel:
+        response = await self._get(f"/channel/{channel_id}")
+        if response["code"] == 0:
+            return models.resolve(AsyncChannel, response["channel"], self)
+        else:
+            raise errors.ChannelGetError(response["code"])
+
+    async def get_article(self, article_id: int, fields: Optional[Iterable[str]] = None) -> AsyncArticle:
+        response = await self._post(f"/article/{article_id}")
+        if response["code"] == 0:
+            data = response["article"] if fields is None else utils.projector(fields)(response["article"])
+            return models.resolve(AsyncArticle, data, self)
+        else:
+            raise errors.ArticleGetError(response["code"])
+
+    async def get_articles(self, article_ids: Iterable[int], concurrency: int = 32) -> list[Union[AsyncArticle, errors.AnixartError]]:
+        """
+        Загружает несколько статей конкурентно (повторяющиеся id запрашиваются один раз).
+        Возвращает список в порядке article_ids; для неудачных id вместо статьи стоит исключение.
+        """
+        return await utils.async_fetch_many(self.get_article, article_ids, concurrency)
+
+    def iter_articles(self, article_ids: Iterable[int], concurrency: int = 32) -> AsyncIterator[tuple[int, Union[AsyncArticle, errors.AnixartError]]]:
+        """Как get_articles, но выдаёт пары (id, статья или исключение) по мере готовности."""
+        return utils.async_iter_fetch_many(self.get_article, article_ids, concurrency)
+
+    async def get_channels(self, channel_ids: Iterable[int], concurrency: int = 32) -> list[Union[AsyncChannel, errors.AnixartError]]:
+        """Загружает несколько каналов конкурентно, см. get_articles."""
+        return await utils.async_fetch_many(self.get_channel, channel_ids, concurrency)
+
+    def iter_channels(self, channel_ids: Iterable[int], concurrency: int = 32) -> AsyncIterator[tuple[int, Union[AsyncChannel, errors.AnixartError]]]:
+        """Как get_channels, но выдаёт пары (id, канал или исключение) по мере готовности."""
+        return utils.async_iter_fetch_many(self.get_channel, channel_ids, concurrency)
+
+    async def get_article_suggestion(self, article_id: int) -> AsyncArticleSuggestion:
+        response = await self._post(f"/article/suggestion/{article_id}")
+        if response["code"] == 0:
+            return models.resolve(AsyncArticleSuggestion, response["articleSuggestion"], self)
+        else:
+            raise errors.ArticleGetError(response["code"])
+
+    async def get_latest_article_id(self, use_cache: bool = True) -> int:
+        response = await self._request("GET", "/article/latest", use_cache=use_cache)
+        if response["code"] == 0:
+            return response["articleId"]
+        else:
+            raise errors.AnixartError(response["code"], "Не удалось получить ID последнего поста.")
+
+    async def get_latest_article(self) -> AsyncArticle:
+        return await self.get_article(await self.get_latest_article_id())
+
+    def watch_articles(self, since: Optional[int] = None, min_interval: float = 1.0, max_interval: float = 60.0, concurrency: int = 8) -> AsyncArticleWatcher:
+        """Асинхронный итератор новых статей, см. AnixartAPI.watch_articles."""
+        return AsyncArticleWatcher(self, since, min_interval, max_interval, concurrency)
@@ -1,12 +1,20 @@
+import io
 import mimetypes
 import os
-import imghdr
+import tempfile
 from uuid import uuid4
 from urllib.parse import urlparse
-from requests import post, get
+from requests import Session
 from re import findall
+from contextlib import contextmanager
+from contextvars import ContextVar
+from threading import Lock
+from concurrent.futures import ThreadPoolExecutor
 import time
 from . import errors
+from .ratelimit import TokenBucket
+from .metrics import RequestEvent, mirror_of
+from requests import RequestException
 
 BASE_HEADERS = {
     'User-Agent': 'AnixartApp/9.0 BETA 1-24121614 (Android 12; SDK 31; arm64-v8a; Xiaomi M2102J20SG; ru)',
@@ -19,107 +27,382 @@ BASE_HEADERS = {
     'Accept-Encoding': 'gzip, deflate',
     'Accept-Language': 'ru-RU,ru;q=0.9,en-US;q=0.8,en;q=0.7',
 }
-API_INSTANCE = None
+API_INSTANCE = None  # последний созданный синхронный клиент AnixartAPI
+_current_api = ContextVar("anixartpy_api", default=None)
+EDITOR_URL = 'https://editor.anixsekai.com'
+AUTH_ERROR_STATUSES = (401, 403)
+
+def current_api():
+    """Клиент, от имени которого выполняются загрузки: заданный use_api или API_INSTANCE."""
+    api = _current_api.get()
+    return api if api is not None else API_INSTANCE
+
+
+@contextmanager
+def use_api(api):
+    """
+    Внутри блока функции модуля используют клиент api вместо API_INSTANCE (адрес,
+    токен, ограничитель, hooks и кэш токенов редактора). Так асинхронный клиент
+    выполняет загрузки в потоке, не подменяя API_INSTANCE синхронного клиента.
+    """
+    reset_token = _current_api.set(api)
+    try:
+        yield api
+    finally:
+        _current_api.reset(reset_token)
+
+
+def throttle(group):
+    """Ждёт разрешения ограничителя частоты клиента (current_api().rate_limiter) для группы эндпоинтов."""
+    limiter = getattr(current_api(), 'rate_limiter', None)
+    if limiter is not None:
+        limiter.acquire(group)
+
+
+def instrumented(method, url, send):
+    """
+    Выполняет send() (запрос requests к url) и отправляет RequestEvent подписчикам
+    current_api().hooks, если они есть. Запросы к редактору помечаются source="editor".
+    """
+    hooks = getattr(current_api(), 'hooks', None)
+    if not hooks:
+        return send()
+    mirror = mirror_of(url)
+    event = RequestEvent("editor" if mirror == EDITOR_URL else "api", method, urlparse(url).path)
+    event.mirror = mirror
+    try:
+        response = send()
+    except RequestException as e:
+        event.complete(error=type(e).__name__)
+        hooks.emit("request", event)
+        raise
+    event.status = response.status_code
+    event.ttfb = response.elapsed.total_seconds()
+    event.bytes_out = int(response.request.headers.get('Content-Length') or 0)
+    event.bytes_in = len(response.content)
+    try:
+        result = response.json()
+    except ValueError:
+        result = None
+    event.complete(result)
+    hooks.emit("request", event)
+    return response
+
+
+def _run_ordered(func, items, max_workers=1):
+    """Применяет func к items (параллельно при max_workers > 1), сохраняя исходный порядок результатов."""
+    if max_workers <= 1 or len(items) <= 1:
+        return [func(item) for item in items]
+    api = _current_api.get()
+
+    def run(item):
+        # Клиент из use_api переносится в потоки пула
+        with use_api(api):
+            return func(item)
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items)), thread_name_prefix="anixartpy-upload") as executor:
+        return list(executor.map(run, items))
+
+class MediaTokenCache:
+    """
+    Кэш media_upload_token по ключу (channel_id, is_suggestion, is_edit_mode).
+    Токен живёт ttl секунд; один экземпляр хранится на клиенте и общий для всех ArticleBuilder.
+    """
+
+    def __init__(self, ttl: float = 300):
+        self.ttl = ttl
+        self._tokens = {}
+        self._locks = {}
+        self._lock = Lock()
+
+    def get(self, key, fetch, refresh=False):
+        """Возвращает токен из кэша или получает новый через fetch() (не более одного запроса на ключ)."""
+        with self._lock:
+            key_lock = self._locks.setdefault(key, Lock())
+        with key_lock:
+            entry = self._tokens.get(key)
+            if not refresh and entry and entry[1] > time.monotonic():
+                return entry[0]
+            token = fetch()
+            self._tokens[key] = (token, time.monotonic() + self.ttl)
+            return token
+
+    def invalidate(self, key=None):
+        """Сбрасывает токен для ключа (или все токены)."""
+        with self._lock:
+            if key is None:
+                self._tokens.clear()
+            else:
+                self._tokens.pop(key, None)
 
 def get_base_url():
-    """Получает базовый URL из API_INSTANCE"""
-    if API_INSTANCE is None:
+    """Получает базовый URL из current_api()"""
+    api = current_api()
+    if api is None:
         return "https://api.anixart.app"
-    return API_INSTANCE.base_url
+    return api.base_url
 
-def prepare_file_data(file_input):
+CHUNK_SIZE = 64 * 1024
+RELAY_TIMEOUT = (5, 30)  # (соединение, чтение) для скачивания файлов по ссылке
+UPLOAD_TIMEOUT = (5, 60)  # (соединение, ожидание ответа) для загрузок в редактор
+RELAY_SPOOL_SIZE = 8 * 1024 * 1024  # сколько держать в памяти, если сервер не сообщил размер
+FILE_SIGNATURES = [
+    (0, b"\x89PNG\r\n\x1a\n", "image/png", "png"),
+    (0, b"\xff\xd8\xff", "image/jpeg", "jpg"),
+    (0, b"GIF87a", "image/gif", "gif"),
+    (0, b"GIF89a", "image/gif", "gif"),
+    (8, b"WEBP", "image/webp", "webp"),
+    (0, b"BM", "image/bmp", "bmp"),
+    (0, b"II*\x00", "image/tiff", "tiff"),
+    (0, b"MM\x00*", "image/tiff", "tiff"),
+    (4, b"ftyp", "video/mp4", "mp4"),
+    (0, b"\x1aE\xdf\xa3", "video/webm", "webm"),
+]
+_relay_session = None
+_relay_session_lock = Lock()
+
+def sniff_file_type(head: bytes):
+    """Определяет (mime, расширение) по первым байтам файла или возвращает (None, None)."""
+    for offset, signature, mime, extension in FILE_SIGNATURES:
+        if head[offset:offset + len(signature)] == signature:
+            return mime, extension
+    return None, None
+
+def get_relay_session():
+    """Общая сессия с пулом соединений для скачивания файлов по ссылке и загрузок в редактор."""
+    global _relay_session
+    with _relay_session_lock:
+        if _relay_session is None:
+            _relay_session = Session()
+            _relay_session.headers['User-Agent'] = BASE_HEADERS['User-Agent']
+        return _relay_session
+
+
+class RelayStream:
+    """Читает тело HTTP-ответа блоками, начиная с уже прочитанных первых байтов."""
+
+    def __init__(self, response, chunks, head: bytes):
+        self._response = response
+        self._chunks = chunks
+        self._pending = head
+
+    def read(self, size=-1):
+        if not self._pending:
+            self._pending = next(self._chunks, b"")
+        if size is None or size < 0 or size >= len(self._pending):
+            chunk, self._pending = self._pending, b""
+        else:
+            chunk, self._pending = self._pending[:size], self._pending[size:]
+        return chunk
+
+    def close(self):
+        self._response.close()
+
+
+def open_remote_file(url):
+    """
+    Открывает файл по ссылке для ретрансляции в загрузку без буферизации целиком.
+    Если сервер не сообщил размер (или сжимает ответ), тело сбрасывается во
+    временный файл, в памяти остаётся не больше RELAY_SPOOL_SIZE.
+    Возвращает кортеж: (stream, file_size, file_name, file_mime)
+    """
+    response = get_relay_session().get(url, stream=True, timeout=RELAY_TIMEOUT)
+    if response.status_code != 200:
+        response.close()
+        raise ValueError(f"Ошибка при получении файла по URL: {url}")
+    chunks = response.iter_content(CHUNK_SIZE)
+    head = next(chunks, b"")
+    stream = RelayStream(response, chunks, head)
+
+    sniffed_mime, extension = sniff_file_type(head)
+    file_name = os.path.basename(urlparse(url).path) or f"{uuid4().hex}.{extension or 'bin'}"
+    if extension and not os.path.splitext(file_name)[1]:
+        file_name = f"{file_name}.{extension}"
+    file_mime = sniffed_mime or response.headers.get("Content-Type") or mimetypes.guess_type(file_name)[0] or 'application/octet-stream'
+
+    content_length = response.headers.get("Content-Length")
+    if content_length is not None and not response.headers.get("Content-Encoding"):
+        return stream, int(content_length), file_name, file_mime
+
+    spool = tempfile.SpooledTemporaryFile(max_size=RELAY_SPOOL_SIZE)
+    try:
+        for chunk in iter(lambda: stream.read(CHUNK_SIZE), b""):
+            spool.write(chunk)
+    finally:
+        stream.close()
+    file_size = spool.tell()
+    spool.seek(0)
+    return spool, file_size, file_name, file_mime
+
+def open_file_data(file_input):
     """
-    Подготавливает данные файла для загрузки.
+    Открывает источник файла для потоковой загрузки, не читая его целиком.
     file_input может быть:
       - Путём к файлу (строка)
       - Битовым содержимым (bytes)
-      - Ссылкой из интернета (строка, начинающаяся с http:// или https://)
-    Возвращает кортеж: (file_data, file_name, file_mime)
+      - Ссылкой из интернета (строка, начинающаяся с http:// или https://),
+        тело ответа ретранслируется в загрузку по мере скачивания
+    Возвращает кортеж: (stream, file_size, file_name, file_mime)
     """
     if isinstance(file_input, bytes):
-        file_data = file_input
-        img_type = imghdr.what(None, h=file_data)
-        extension = img_type if img_type else 'bin'
-        file_name = f"{uuid4().hex}.{extension}"
-        file_mime = mimetypes.types_map.get(f".{extension}", "application/octet-stream")
-        return file_data, file_name, file_mime
+        file_mime, extension = sniff_file_type(file_input[:16])
+        file_name = f"{uuid4().hex}.{extension or 'bin'}"
+        return io.BytesIO(file_input), len(file_input), file_name, file_mime or "application/octet-stream"
 
     elif isinstance(file_input, str):
         if file_input.startswith("http://") or file_input.startswith("https://"):
-            response = get(file_input)
-            if response.status_code != 200:
-                raise ValueError(f"Ошибка при получении файла по URL: {file_input}")
-            file_data = response.content
-            parsed_url = urlparse(file_input)
-            file_name = os.path.basename(parsed_url.path)
-            if not file_name:
-                file_name = f"{uuid4().hex}.bin"
-            file_mime = response.headers.get("Content-Type") or mimetypes.guess_type(file_name)[0] or 'application/octet-stream'
-            return file_data, file_name, file_mime
+            return open_remote_file(file_input)
         else:
             # Считаем, что это путь к файлу
             if not os.path.exists(file_input):
                 raise ValueError(f"Файл не найден: {file_input}")
-            with open(file_input, 'rb') as f:
-                file_data = f.read()
             file_name = os.path.basename(file_input)
             file_mime = mimetypes.guess_type(file_input)[0] or 'application/octet-stream'
-            return file_data, file_name, file_mime
+            return open(file_input, 'rb'), os.path.getsize(file_input), file_name, file_mime
 
     else:
         raise TypeError("Неподдерживаемый тип данных для загрузки файла.")
 
+def prepare_file_data(file_input):
+    """
+    Подготавливает данные файла для загрузки целиком в памяти.
+    Возвращает кортеж: (file_data, file_name, file_mime)
+    """
+    stream, _, file_name, file_mime = open_file_data(file_input)
+    with stream:
+        return stream.read(), file_name, file_mime
+
+
+class MultipartBody:
+    """
+    Потоковое тело multipart/form-data: заголовок части, содержимое файла
+    блоками по CHUNK_SIZE прямо из источника и завершающая граница.
+    Длина известна заранее, поэтому requests отправляет тело с Content-Length,
+    а в памяти одновременно находится не больше одного блока файла.
+    """
+
+    def __init__(self, stream, file_size, file_name, file_mime, boundary, field_name):
+        self._parts = [
+            io.BytesIO((
+                f"--{boundary}\r\n"
+                f"Content-Disposition: form-data; name=\"{field_name}\"; filename=\"{file_name}\"\r\n"
+                f"Content-Type: {file_mime}\r\n\r\n"
+            ).encode()),
+            stream,
+            io.BytesIO(f"\r\n--{boundary}--\r\n".encode()),
+        ]
+        self.len = len(self._parts[0].getvalue()) + file_size + len(self._parts[2].getvalue())
+        self._stream = stream
+
+    def __len__(self):
+        return self.len
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            size = CHUNK_SIZE
+        while self._parts:
+            chunk = self._parts[0].read(size)
+            if chunk:
+                return chunk
+            self._parts.pop(0)
+        return b""
+
+    def close(self):
+        self._stream.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
 def prepare_multipart_body(file_input, boundary, field_name):
-    """Формирует тело запроса для загрузки файла."""
-    file_data, file_name, file_mime = prepare_file_data(file_input)
-    body = (
-        f"--{boundary}\r\n"
-        f"Content-Disposition: form-data; name=\"{field_name}\"; filename=\"{file_name}\"\r\n"
-        f"Content-Type: {file_mime}\r\n\r\n"
-    ).encode() + file_data + f"\r\n--{boundary}--\r\n".encode()
-    return body
+    """Формирует тело запроса для загрузки файла целиком в памяти (bytes)."""
+    with open_multipart_body(file_input, boundary, field_name) as body:
+        return b"".join(iter(lambda: body.read(CHUNK_SIZE), b""))
 
-def send_file_request(url, file_input, headers, field_name):
-    """Отправляет файл на сервер."""
+def open_multipart_body(file_input, boundary, field_name):
+    """Формирует потоковое тело запроса для загрузки файла (MultipartBody, закрывается после отправки)."""
+    stream, file_size, file_name, file_mime = open_file_data(file_input)
+    return MultipartBody(stream, file_size, file_name, file_mime, boundary, field_name)
+
+def post_file(url, file_input, headers, field_name):
+    """Отправляет файл на сервер потоково и возвращает объект ответа."""
     boundary = f"----WebKitFormBoundary{uuid4().hex}"
+    headers = dict(headers)
     headers['Content-Type'] = f"multipart/form-data; boundary={boundary}"
-    body = prepare_multipart_body(file_input, boundary, field_name)
-    headers['Content-Length'] = str(len(body))
-    response = post(url, headers=headers, data=body, params={'token': API_INSTANCE.token})
-    return response.json()
+    with open_multipart_body(file_input, boundary, field_name) as body:
+        headers['Content-Length'] = str(len(body))
+        return instrumented('POST', url, lambda: get_relay_session().post(url, headers=headers, data=body, params={'token': current_api().token}, timeout=UPLOAD_TIMEOUT))
 
-def get_media_upload_token(cid, is_suggestion=False, is_edit_mode=False):
-    """Получает media_upload_token с учетом режима работы"""
+def send_file_request(url, file_input, headers, field_name):
+    """Отправляет файл на сервер."""
+    return post_file(url, file_input, headers, field_name).json()
+
+def fetch_media_upload_token(cid, is_suggestion=False, is_edit_mode=False):
+    """Запрашивает новый media_upload_token с учетом режима работы (без кэша)"""
     url = f'{get_base_url()}/channel/{cid}/editor/available'
     params = {
-        'token': API_INSTANCE.token if API_INSTANCE else None,
+        'token': getattr(current_api(), 'token', None),
         'is_suggestion': str(is_suggestion).lower(),
         'is_edit_mode': str(is_edit_mode).lower()
     }
-    response = get(url, headers=BASE_HEADERS, params=params).json()
+    throttle('editor')
+    response = instrumented('GET', url, lambda: get_relay_session().get(url, headers=BASE_HEADERS, params=params, timeout=UPLOAD_TIMEOUT)).json()
     if response['code'] == 0:
         return response.get('media_upload_token')
     else:
         raise errors.EditorAvailableError(response['code'])
 
-def upload_media_files(cid, files, is_suggestion=False, is_edit_mode=False, delay=0.25):
-    """Загружает несколько файлов с задержкой"""
-    media_token = get_media_upload_token(cid, is_suggestion, is_edit_mode)
-    headers = BASE_HEADERS.copy()
-    headers['Authorization'] = f"Bearer {media_token}"
-    url = 'https://editor.anixsekai.com/content/upload'
-    
-    results = []
-    for file in files:
-        result = send_file_request(url, file, headers, 'file')
-        results.append(result)
-        if delay > 0:
-            time.sleep(delay)
-    return results
+def get_media_upload_token(cid, is_suggestion=False, is_edit_mode=False, refresh=False):
+    """Получает media_upload_token из кэша клиента; refresh=True принудительно запрашивает новый"""
+    cache = getattr(current_api(), 'media_tokens', None)
+    if cache is None:
+        return fetch_media_upload_token(cid, is_suggestion, is_edit_mode)
+    return cache.get(
+        (cid, is_suggestion, is_edit_mode),
+        lambda: fetch_media_upload_token(cid, is_suggestion, is_edit_mode),
+        refresh=refresh
+    )
+
+def send_with_media_token(cid, is_suggestion, is_edit_mode, send):
+    """
+    Выполняет send(headers) с заголовком авторизации редактора.
+    Если редактор отклонил токен (401/403), токен обновляется и запрос повторяется один раз.
+    """
+    for refresh in (False, True):
+        headers = BASE_HEADERS.copy()
+        headers['Authorization'] = f"Bearer {get_media_upload_token(cid, is_suggestion, is_edit_mode, refresh=refresh)}"
+        throttle('editor')
+        response = send(headers)
+        if response.status_code not in AUTH_ERROR_STATUSES:
+            break
+    return response.json()
+
+def _upload_interval(delay):
+    """Дополнительный минимальный интервал между загрузками (поверх ограничителя клиента) или None."""
+    return TokenBucket(1 / delay, 1) if delay else None
+
+def upload_media_files(cid, files, is_suggestion=False, is_edit_mode=False, delay=None, max_workers=1):
+    """
+    Загружает несколько файлов.
+    При max_workers > 1 файлы читаются и отправляются параллельно. Частоту
+    запросов ограничивает группа "editor" ограничителя клиента; delay задаёт
+    дополнительный общий для всех потоков минимальный интервал между запросами.
+    Результаты возвращаются в исходном порядке файлов.
+    """
+    url = f'{EDITOR_URL}/content/upload'
+    interval = _upload_interval(delay)
+
+    def upload(file):
+        if interval is not None:
+            interval.acquire()
+        return send_with_media_token(cid, is_suggestion, is_edit_mode, lambda headers: post_file(url, file, headers, 'file'))
+
+    return _run_ordered(upload, list(files), max_workers)
 
 def upload_embed_content(cid, link, is_suggestion=False, is_edit_mode=False):
     """Загружает вложение с учетом режима работы"""
-    media_token = get_media_upload_token(cid, is_suggestion, is_edit_mode)
     is_youtube = findall(
         r'(?:https?:\/\/)?(?:www\.)?(?:youtube\.com\/\S*(?:(?:\/embed)?\/|watch\?\S*?&?v=)|youtu\.be\/)([a-zA-Z0-9_-]{6,11})((?:[?&][A-Za-z0-9._-]+=[A-Za-z0-9._-]+)*)',
         link
@@ -130,20 +413,30 @@ def upload_embed_content(cid, link, is_suggestion=False, is_edit_mode=False):
     if not service:
         raise ValueError("Неизвестный сервис для внедрения.")
     
-    url = f'https://editor.anixsekai.com/embed/{service}?url={link}'
-    headers = BASE_HEADERS.copy()
-    headers['Authorization'] = f"Bearer {media_token}"
-    response = post(url, headers=headers)
-    response = response.json()
+    url = f'{EDITOR_URL}/embed/{service}?url={link}'
+    response = send_with_media_token(cid, is_suggestion, is_edit_mode, lambda headers: instrumented('POST', url, lambda: get_relay_session().post(url, headers=headers, timeout=UPLOAD_TIMEOUT)))
     response.update({'service': service, 'url': link})
     return response
 
+def upload_embeds(cid, links, is_suggestion=False, is_edit_mode=False, delay=None, max_workers=1):
+    """Загружает несколько вложений, сохраняя исходный порядок результатов."""
+    interval = _upload_interval(delay)
+
+    def upload(link):
+        if interval is not None:
+            interval.acquire()
+        return upload_embed_content(cid, link, is_suggestion, is_edit_mode)
+
+    return _run_ordered(upload, list(links), max_workers)
+
 def upload_cover(cid, file_input):
     """Загружает обложку канала."""
-    url = f'https://api.anixart.app/channel/cover/upload/{cid}'
+    url = f'{get_base_url()}/channel/cover/upload/{cid}'
+    throttle('write')
     return send_file_request(url, file_input, BASE_HEADERS.copy(), 'image')
 
 def upload_avatar(cid, file_input, is_blog: bool = False):
     """Загружает аватарку пользователя."""
-    url = f'https://api.anixart.app/' + (f'channel/avatar/upload/{cid}' if not is_blog else f'profile/preference/avatar/edit')
+    url = f'{get_base_url()}/' + (f'channel/avatar/upload/{cid}' if not is_blog else f'profile/preference/avatar/edit')
+    throttle('write')
     return send_file_request(url, file_input, BASE_HEADERS.copy(), 'image')
\ No newline at end of file
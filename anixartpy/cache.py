@@ -0,0 +1,241 @@
+import json
+import re
+import sqlite3
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Optional, Any
+from . import jsonlib
+from .ratelimit import endpoint_group
+
+
+class MemoryBackend:
+    """
+    LRU-хранилище ответов в памяти процесса. Ответы хранятся сериализованными
+    в JSON, поэтому каждое попадание отдаёт новый словарь: изменения, которые
+    внесёт вызывающий код или модель, не попадут в кэш.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self.evictions = 0
+        self._loads = jsonlib.get_decoder()
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[tuple[float, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+        return entry[0], self._loads(entry[1])
+
+    def set(self, key: str, value: Any, expires_at: float):
+        body = jsonlib.dumps(value)
+        with self._lock:
+            self._entries[key] = (expires_at, body)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: str):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def delete_prefix(self, prefix: str) -> int:
+        with self._lock:
+            keys = [key for key in self._entries if key.startswith(prefix)]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class DiskBackend:
+    """LRU-хранилище ответов в файле SQLite; переживает перезапуск процесса."""
+
+    def __init__(self, path: str, maxsize: int = 100_000):
+        self.maxsize = maxsize
+        self.evictions = 0
+        self._lock = Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS response_cache ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS response_cache_accessed ON response_cache (accessed_at)")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM response_cache").fetchone()[0]
+
+    def get(self, key: str) -> Optional[tuple[float, Any]]:
+        with self._lock:
+            row = self._db.execute("SELECT value, expires_at FROM response_cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            self._db.execute("UPDATE response_cache SET accessed_at = ? WHERE key = ?", (time.time(), key))
+        return row[1], json.loads(row[0])
+
+    def set(self, key: str, value: Any, expires_at: float):
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO response_cache (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value, ensure_ascii=False), expires_at, time.time())
+            )
+            overflow = self._db.execute("SELECT COUNT(*) FROM response_cache").fetchone()[0] - self.maxsize
+            if overflow > 0:
+                self._db.execute(
+                    "DELETE FROM response_cache WHERE key IN "
+                    "(SELECT key FROM response_cache ORDER BY accessed_at LIMIT ?)", (overflow,)
+                )
+                self.evictions += overflow
+
+    def delete(self, key: str):
+        with self._lock:
+            self._db.execute("DELETE FROM response_cache WHERE key = ?", (key,))
+
+    def delete_prefix(self, prefix: str) -> int:
+        with self._lock:
+            return self._db.execute(
+                "DELETE FROM response_cache WHERE substr(key, 1, ?) = ?", (len(prefix), prefix)
+            ).rowcount
+
+    def clear(self):
+        with self._lock:
+            self._db.execute("DELETE FROM response_cache")
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+class ResponseCache:
+    """
+    Кэш ответов читающих эндпоинтов AnixartAPI.
+
+    Ключ — метод, путь и тело запроса. TTL задаётся регулярным выражением по
+    строке "МЕТОД /путь" (первое совпадение); ответы остальных эндпоинтов не
+    кэшируются, как и ответы с ненулевым code. Запросы групп "write" и "editor"
+    (см. ratelimit.endpoint_group) не кэшируются никогда, даже при default_ttl. Изменяющие запросы (редактирование,
+    подписка, голос и т.п.) сбрасывают затронутые ключи по правилам INVALIDATIONS.
+
+    backend — любой объект с методами get/set/delete/delete_prefix/clear,
+    например MemoryBackend (по умолчанию) или DiskBackend.
+    """
+
+    DEFAULT_TTLS = [
+        (r"GET /article/latest", 5),
+        (r"GET /channel/\d+", 60),
+        (r"POST /article/\d+", 60),
+        (r"POST /article/suggestion/\d+", 30),
+        (r"POST /article/all/\d+", 30),
+        (r"POST /article/suggestion/all/\d+", 30),
+        (r"GET /article/(votes|reposts|comment/all)/\d+/\d+", 30),
+        (r"GET /channel/\d+/(subscriber|block)/all/\d+", 60),
+        (r"POST /channel/\d+/permission/all/\d+", 60),
+    ]
+    INVALIDATIONS = [
+        (r"POST /article/(?:edit|delete)/(\d+)", ["POST /article/{0}|", "POST /article/all/", "GET /article/reposts/"]),
+        (r"GET /article/vote/(\d+)/\d+", ["POST /article/{0}|", "GET /article/votes/{0}/", "POST /article/all/"]),
+        (r"POST /article/create/(\d+)", ["POST /article/all/", "GET /article/latest|", "GET /channel/{0}|"]),
+        (r"POST /article/suggestion/(?:create|edit|delete|publish)/\d+", ["POST /article/suggestion/", "POST /article/all/", "GET /article/latest|"]),
+        (r"POST /channel/(?:edit|subscribe|unsubscribe)/(\d+)", ["GET /channel/{0}|", "GET /channel/{0}/subscriber/all/"]),
+        (r"POST /channel/(\d+)/block/manage", ["GET /channel/{0}/block/all/", "GET /channel/{0}/subscriber/all/"]),
+        (r"POST /channel/(\d+)/permission/manage", ["POST /channel/{0}/permission/all/", "GET /channel/{0}/subscriber/all/"]),
+    ]
+
+    def __init__(self, backend=None, ttls: Optional[dict] = None, default_ttl: Optional[float] = None):
+        """
+        Args:
+            backend: Хранилище ответов (по умолчанию MemoryBackend()).
+            ttls: Дополнительные или переопределённые TTL: {"МЕТОД регулярное_выражение": секунды}.
+                TTL 0 отключает кэширование эндпоинта.
+            default_ttl: TTL для прочих читающих GET-запросов (None — не кэшировать).
+        """
+        self.backend = backend if backend is not None else MemoryBackend()
+        rules = list((ttls or {}).items()) + self.DEFAULT_TTLS
+        self._ttls = [(re.compile(pattern + r"(?:\?.*)?$"), ttl) for pattern, ttl in rules]
+        self._invalidations = [(re.compile(pattern), prefixes) for pattern, prefixes in self.INVALIDATIONS]
+        self.default_ttl = default_ttl
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._lock = Lock()
+
+    @property
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "evictions": getattr(self.backend, "evictions", 0),
+            "size": len(self.backend),
+        }
+
+    @staticmethod
+    def make_key(method: str, endpoint: str, data=None) -> str:
+        body = json.dumps(data, sort_keys=True, separators=(",", ":")) if data is not None else ""
+        return f"{method} {endpoint}|{body}"
+
+    def ttl_for(self, method: str, endpoint: str) -> Optional[float]:
+        if endpoint_group(method, endpoint) != "read":
+            return None
+        target = f"{method} {endpoint}"
+        for pattern, ttl in self._ttls:
+            if pattern.match(target):
+                return ttl or None
+        return self.default_ttl if method == "GET" else None
+
+    def get(self, method: str, endpoint: str, data=None) -> Optional[dict]:
+        if self.ttl_for(method, endpoint) is None:
+            return None
+        key = self.make_key(method, endpoint, data)
+        entry = self.backend.get(key)
+        with self._lock:
+            if entry is not None and entry[0] > time.time():
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+        if entry is not None:
+            self.backend.delete(key)
+        return None
+
+    def store(self, method: str, endpoint: str, data, response: dict):
+        """Сохраняет успешный ответ читающего эндпоинта или сбрасывает ключи после изменяющего запроса."""
+        self.invalidate_for(method, endpoint)
+        ttl = self.ttl_for(method, endpoint)
+        if ttl is None or not isinstance(response, dict) or response.get("code") != 0:
+            return
+        self.backend.set(self.make_key(method, endpoint, data), response, time.time() + ttl)
+
+    def invalidate_for(self, method: str, endpoint: str):
+        target = f"{method} {endpoint}"
+        for pattern, prefixes in self._invalidations:
+            match = pattern.match(target)
+            if match:
+                for prefix in prefixes:
+                    self.invalidate(prefix.format(*match.groups()))
+
+    def invalidate(self, prefix: str = "") -> int:
+        """Удаляет все ключи, начинающиеся с prefix ("МЕТОД /путь"); пустой prefix очищает кэш."""
+        if not prefix:
+            self.backend.clear()
+            removed = 1
+        else:
+            removed = self.backend.delete_prefix(prefix)
+        with self._lock:
+            self.invalidations += removed
+        return removed
+
+    def clear(self):
+        self.backend.clear()
@@ -0,0 +1,231 @@
+import json
+import os
+import tempfile
+import time
+from enum import IntEnum
+from threading import Lock
+from typing import Optional, Union
+
+
+class MemoryCheckpointStore:
+    """Хранилище контрольных точек в памяти процесса."""
+
+    def __init__(self):
+        self._states = {}
+        self._lock = Lock()
+
+    def load(self, key: str) -> Optional[dict]:
+        with self._lock:
+            return self._states.get(key)
+
+    def save(self, key: str, state: dict):
+        with self._lock:
+            self._states[key] = state
+
+    def delete(self, key: str):
+        with self._lock:
+            self._states.pop(key, None)
+
+
+class FileCheckpointStore:
+    """
+    Хранилище контрольных точек в JSON-файле ({ключ: состояние}). Файл
+    перезаписывается атомарно (временный файл и os.replace), поэтому
+    прерванная запись не портит прошлые контрольные точки.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = Lock()
+
+    def _read(self) -> dict:
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return {}
+
+    def _write(self, states: dict):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(prefix=".checkpoint-", dir=directory)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump(states, file, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def load(self, key: str) -> Optional[dict]:
+        with self._lock:
+            return self._read().get(key)
+
+    def save(self, key: str, state: dict):
+        with self._lock:
+            states = self._read()
+            states[key] = state
+            self._write(states)
+
+    def delete(self, key: str):
+        with self._lock:
+            states = self._read()
+            if states.pop(key, None) is not None:
+                self._write(states)
+
+
+def get_store(store) -> Optional[object]:
+    """Путь к файлу превращает в FileCheckpointStore; объект с load/save возвращает как есть."""
+    if isinstance(store, (str, os.PathLike)):
+        return FileCheckpointStore(os.fspath(store))
+    return store
+
+
+class ChannelCheckpoint:
+    """
+    Контрольная точка синхронизации статей канала: id и last_update_date
+    (unix-время) не больше max_articles самых новых статей.
+
+    Статья считается известной, если её id есть в контрольной точке с тем же
+    last_update_date или если она старше самой старой запомненной статьи
+    заполненного окна (такие статьи синхронизация уже не отслеживает).
+    """
+
+    def __init__(self, channel_id: int, articles: Optional[dict] = None, synced_at: Optional[float] = None, max_articles: int = 1000):
+        self.channel_id = channel_id
+        self.articles = dict(articles or {})
+        self.synced_at = synced_at
+        self.max_articles = max_articles
+
+    def __len__(self) -> int:
+        return len(self.articles)
+
+    def __repr__(self) -> str:
+        return f"<ChannelCheckpoint(channel_id={self.channel_id}, articles={len(self.articles)}, synced_at={self.synced_at})>"
+
+    @property
+    def floor(self) -> Optional[int]:
+        """id самой старой запомненной статьи, если окно заполнено, иначе None."""
+        if len(self.articles) < self.max_articles:
+            return None
+        return min(self.articles)
+
+    def is_known(self, article_id: int, updated: Optional[int]) -> bool:
+        if article_id in self.articles:
+            return self.articles[article_id] == updated
+        floor = self.floor
+        return floor is not None and article_id < floor
+
+    def diff(self, articles: list, seen: dict) -> list:
+        """
+        Новые и изменённые статьи страницы. Просмотренные статьи добавляются в
+        seen ({id: last_update_date}); повторы (статья сдвинулась на следующую
+        страницу из-за новых публикаций) пропускаются.
+        """
+        changed = []
+        for article in articles:
+            if article.id in seen:
+                continue
+            version = article_version(article)
+            seen[article.id] = version
+            if not self.is_known(article.id, version):
+                changed.append(article)
+        return changed
+
+    def update(self, seen: dict):
+        """Запоминает {id: last_update_date} просмотренных статей и оставляет max_articles самых новых."""
+        self.articles.update(seen)
+        if len(self.articles) > self.max_articles:
+            newest = sorted(self.articles, reverse=True)[:self.max_articles]
+            self.articles = {article_id: self.articles[article_id] for article_id in newest}
+        self.synced_at = time.time()
+
+    def to_dict(self) -> dict:
+        return {
+            "channel_id": self.channel_id,
+            "synced_at": self.synced_at,
+            "max_articles": self.max_articles,
+            "articles": sorted(self.articles.items(), reverse=True),
+        }
+
+    @classmethod
+    def from_dict(cls, state: dict) -> "ChannelCheckpoint":
+        return cls(
+            state["channel_id"],
+            {article_id: updated for article_id, updated in state.get("articles", ())},
+            state.get("synced_at"),
+            state.get("max_articles", 1000),
+        )
+
+    @staticmethod
+    def key(channel_id: int) -> str:
+        return f"channel:{channel_id}:articles"
+
+
+class PageCursor:
+    """
+    Позиция постраничного обхода (utils.Paginator.cursor): эндпоинт и параметры
+    запроса, страница и смещение следующего элемента на ней, известное на
+    момент сохранения total_page_count.
+
+    Позиция задаётся номером страницы и смещением, поэтому если список между
+    запусками изменился (новые участники, комментарии), при возобновлении
+    часть элементов может повториться или пропуститься.
+    """
+
+    __slots__ = ("endpoint", "params", "page", "offset", "total_pages")
+
+    def __init__(self, endpoint: Optional[str], params: Optional[dict] = None, page: int = 0, offset: int = 0,
+                 total_pages: Optional[int] = None):
+        self.endpoint = endpoint
+        self.params = {key: int(value) if isinstance(value, IntEnum) else value for key, value in (params or {}).items()}
+        self.page = page
+        self.offset = offset
+        self.total_pages = total_pages
+
+    def __repr__(self) -> str:
+        return f"<PageCursor(endpoint={self.endpoint!r}, params={self.params}, page={self.page}, offset={self.offset}, total_pages={self.total_pages})>"
+
+    def same_query(self, other: "PageCursor") -> bool:
+        return self.endpoint == other.endpoint and self.params == other.params
+
+    @property
+    def key(self) -> str:
+        """Ключ контрольной точки в хранилище: эндпоинт и отсортированные параметры."""
+        query = "&".join(f"{name}={self.params[name]}" for name in sorted(self.params))
+        return f"cursor:{self.endpoint}?{query}" if query else f"cursor:{self.endpoint}"
+
+    def to_dict(self) -> dict:
+        return {
+            "endpoint": self.endpoint,
+            "params": self.params,
+            "page": self.page,
+            "offset": self.offset,
+            "total_pages": self.total_pages,
+        }
+
+    @classmethod
+    def from_dict(cls, state: dict) -> "PageCursor":
+        return cls(
+            state["endpoint"],
+            state.get("params"),
+            state.get("page", 0),
+            state.get("offset", 0),
+            state.get("total_pages"),
+        )
+
+
+def load_channel_checkpoint(channel_id: int, since: Union["ChannelCheckpoint", dict, None], store) -> ChannelCheckpoint:
+    """Контрольная точка для sync_articles: since, затем сохранённая в store, иначе пустая."""
+    if since is None and store is not None:
+        since = store.load(ChannelCheckpoint.key(channel_id))
+    if since is None:
+        return ChannelCheckpoint(channel_id)
+    checkpoint = since if isinstance(since, ChannelCheckpoint) else ChannelCheckpoint.from_dict(since)
+    if checkpoint.channel_id != channel_id:
+        raise ValueError(f"Контрольная точка относится к каналу {checkpoint.channel_id}, а не к {channel_id}")
+    return checkpoint
+
+
+def article_version(article) -> Optional[int]:
+    """last_update_date статьи в исходном виде (unix-время), без декодирования в datetime."""
+    return article._data.get("last_update_date")
@@ -0,0 +1,267 @@
+import struct
+from array import array
+from operator import itemgetter
+from typing import Iterator, Optional, Union
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+# Тип колонки: (код array.array, dtype NumPy, значение вместо null в NumPy)
+TYPES = {
+    "int64": ("q", "i8", 0),
+    "int8": ("b", "i1", -1),
+    "bool": ("b", "?", 0),
+    "timestamp": ("q", "datetime64[s]", -2 ** 63),  # NaT
+    "string": (None, "O", None),
+}
+
+# Схемы: (колонка, тип, путь к значению в исходном словаре элемента)
+VOTES = (
+    ("id", "int64", ("id",)),
+    ("login", "string", ("login",)),
+    ("avatar", "string", ("avatar",)),
+    ("vote", "int8", ("vote",)),
+    ("is_online", "bool", ("is_online",)),
+    ("is_verified", "bool", ("is_verified",)),
+    ("is_sponsor", "bool", ("is_sponsor",)),
+    ("badge_id", "int64", ("badge_id",)),
+    ("badge_type", "int8", ("badge_type",)),
+)
+MEMBERS = (
+    ("id", "int64", ("id",)),
+    ("channel_id", "int64", ("channel_id",)),
+    ("login", "string", ("login",)),
+    ("avatar", "string", ("avatar",)),
+    ("permission", "int8", ("permission",)),
+    ("is_verified", "bool", ("is_verified",)),
+    ("is_sponsor", "bool", ("is_sponsor",)),
+    ("is_blocked", "bool", ("is_blocked",)),
+    ("is_perm_blocked", "bool", ("is_perm_blocked",)),
+    ("block_reason", "string", ("block_reason",)),
+    ("block_expire_date", "timestamp", ("block_expire_date",)),
+    ("permission_creation_date", "timestamp", ("permission_creation_date",)),
+)
+ARTICLES = (
+    ("id", "int64", ("id",)),
+    ("channel_id", "int64", ("channel", "id")),
+    ("author_id", "int64", ("author", "id")),
+    ("repost_article_id", "int64", ("repost_article", "id")),
+    ("vote", "int8", ("vote",)),
+    ("vote_count", "int64", ("vote_count",)),
+    ("comment_count", "int64", ("comment_count",)),
+    ("repost_count", "int64", ("repost_count",)),
+    ("is_deleted", "bool", ("is_deleted",)),
+    ("is_under_moderation", "bool", ("is_under_moderation",)),
+    ("creation_date", "timestamp", ("creation_date",)),
+    ("last_update_date", "timestamp", ("last_update_date",)),
+)
+SCHEMAS = {"votes": VOTES, "members": MEMBERS, "articles": ARTICLES}
+
+
+def _require(module, name: str):
+    if module is None:
+        raise ImportError(f"Для этого экспорта нужен {name}: pip install anixartpy[columnar]")
+    return module
+
+
+class _Column:
+    __slots__ = ("name", "type", "path", "values", "valid", "null_count")
+
+    def __init__(self, name: str, type: str, path: tuple):
+        self.name = name
+        self.type = type
+        self.path = path
+        self.reset()
+
+    def reset(self):
+        typecode = TYPES[self.type][0]
+        self.values = array(typecode) if typecode else []
+        self.valid = bytearray()
+        self.null_count = 0
+
+    def extend(self, raw):
+        """Дописывает значения колонки; числа упаковываются struct.pack одним вызовом на страницу."""
+        if None in raw:
+            flags = bytes([value is not None for value in raw])
+            self.null_count += len(raw) - sum(flags)
+            if self.type != "string":
+                raw = [0 if value is None else value for value in raw]
+        else:
+            flags = b"\x01" * len(raw)
+        self.valid.extend(flags)
+        if self.type == "string":
+            self.values.extend(raw)
+        else:
+            self.values.frombytes(struct.pack(f"{len(raw)}{self.values.typecode}", *raw))
+
+
+class ColumnarSink:
+    """
+    Приёмник страниц для Paginator.into, который раскладывает исходные словари
+    элементов сразу по типизированным колонкам (array.array): id и счётчики —
+    int64, флаги — bool, даты — unix-время int64, коды перечислений — int8.
+    Модели при этом не создаются, поэтому страницы лучше загружать с raw=True:
+
+        sink = ColumnarSink("votes")
+        article.get_votes(enums.Sorting.NEW, raw=True).into(sink)
+        table = sink.to_arrow()             # pyarrow.Table
+        sink.write_parquet("votes.parquet") # или sink.to_numpy()
+
+    Данные копятся пачками фиксированного размера batch_size строк; каждая
+    заполненная пачка замораживается в record batch. Модели (если передать их)
+    раскладываются по исходному словарю, см. store.raw_data.
+
+    Args:
+        schema: "votes", "members", "articles" или своя схема — кортеж
+            (колонка, тип из TYPES, путь к значению в словаре из 1–2 ключей).
+        batch_size: Строк в одной record batch.
+    """
+
+    def __init__(self, schema: Union[str, tuple], batch_size: int = 65536):
+        if isinstance(schema, str):
+            if schema not in SCHEMAS:
+                raise ValueError(f"Неизвестная схема. Доступные варианты: {', '.join(SCHEMAS)}")
+            schema = SCHEMAS[schema]
+        self.schema = schema
+        self.batch_size = batch_size
+        self.batches = []
+        self._columns = [_Column(name, type, path) for name, type, path in schema]
+        self._keys = list(dict.fromkeys(path[0] for _, _, path in schema))
+        self._getter = itemgetter(*self._keys)
+        self._rows = 0
+        self._flushed = 0
+
+    def __len__(self) -> int:
+        return self._flushed + self._rows
+
+    @property
+    def names(self) -> list:
+        return [column.name for column in self._columns]
+
+    def write(self, items: list, **context) -> int:
+        if items and not isinstance(items[0], dict):
+            from .store import raw_data
+            items = [raw_data(item) for item in items]
+        written = 0
+        while written < len(items):
+            chunk = items[written:written + self.batch_size - self._rows]
+            by_key = self._transpose(chunk)
+            for column in self._columns:
+                raw = by_key[column.path[0]]
+                if len(column.path) > 1:
+                    nested = column.path[1]
+                    raw = [value.get(nested) if value else None for value in raw]
+                column.extend(raw)
+            self._rows += len(chunk)
+            written += len(chunk)
+            if self._rows >= self.batch_size:
+                self.flush()
+        return written
+
+    def _transpose(self, items: list) -> dict:
+        """{ключ верхнего уровня: значения по строкам} — построчная выборка itemgetter и транспонирование zip."""
+        try:
+            rows = list(map(self._getter, items))
+        except KeyError:
+            keys = self._keys
+            rows = [tuple(item.get(key) for key in keys) for item in items]
+        if len(self._keys) == 1:
+            return {self._keys[0]: [row[0] if isinstance(row, tuple) else row for row in rows]}
+        return dict(zip(self._keys, zip(*rows)))
+
+    def flush(self):
+        """Замораживает накопленные строки в отдельную record batch (неполную, если строк меньше batch_size)."""
+        if not self._rows:
+            return
+        self.batches.append([(column.values, column.valid, column.null_count) for column in self._columns])
+        for column in self._columns:
+            column.reset()
+        self._flushed += self._rows
+        self._rows = 0
+
+    def _all_batches(self) -> Iterator[list]:
+        self.flush()
+        return iter(self.batches)
+
+    # -- NumPy ----------------------------------------------------------------
+
+    def numpy_dtype(self):
+        np = _require(numpy, "numpy")
+        return np.dtype([(column.name, TYPES[column.type][1]) for column in self._columns])
+
+    def iter_numpy(self) -> Iterator:
+        """Record batches как структурированные массивы NumPy (null — 0, NaT для дат, -1 для int8-кодов, None для строк)."""
+        np = _require(numpy, "numpy")
+        dtype = self.numpy_dtype()
+        for batch in self._all_batches():
+            length = len(batch[0][1])
+            result = np.empty(length, dtype=dtype)
+            for column, (values, valid, null_count) in zip(self._columns, batch):
+                typecode, np_type, fill = TYPES[column.type]
+                if typecode is None:
+                    result[column.name] = np.array(values, dtype=object)
+                    continue
+                data = np.frombuffer(values, dtype=np.int64 if typecode == "q" else np.int8)
+                if null_count and fill:
+                    data = np.where(np.frombuffer(valid, dtype=np.bool_), data, fill)
+                result[column.name] = data.astype(np_type, copy=False) if column.type != "timestamp" else data.view(np_type)
+            yield result
+
+    def to_numpy(self):
+        np = _require(numpy, "numpy")
+        batches = list(self.iter_numpy())
+        return np.concatenate(batches) if batches else np.empty(0, dtype=self.numpy_dtype())
+
+    # -- Arrow / Parquet ------------------------------------------------------
+
+    def arrow_schema(self):
+        pa = _require(pyarrow, "pyarrow")
+        types = {"int64": pa.int64(), "int8": pa.int8(), "bool": pa.bool_(), "timestamp": pa.timestamp("s"), "string": pa.string()}
+        return pa.schema([(column.name, types[column.type]) for column in self._columns])
+
+    def _arrow_array(self, field, column: _Column, values, valid: bytearray, null_count: int):
+        pa = _require(pyarrow, "pyarrow")
+        if column.type == "string":
+            return pa.array(values, type=pa.string())
+        length = len(valid)
+        validity = None
+        if null_count:
+            flags = pa.Array.from_buffers(pa.int8(), length, [None, pa.py_buffer(valid)])
+            validity = flags.cast(pa.bool_()).buffers()[1]
+        storage = pa.int64() if column.type in ("int64", "timestamp") else pa.int8()
+        array = pa.Array.from_buffers(storage, length, [validity, pa.py_buffer(values)], null_count)
+        if column.type == "timestamp":
+            return array.view(field.type)
+        if column.type == "bool":
+            return array.cast(pa.bool_())
+        return array
+
+    def iter_arrow(self) -> Iterator:
+        """Record batches как pyarrow.RecordBatch (данные колонок передаются без копирования)."""
+        pa = _require(pyarrow, "pyarrow")
+        schema = self.arrow_schema()
+        for batch in self._all_batches():
+            arrays = [
+                self._arrow_array(field, column, values, valid, null_count)
+                for field, column, (values, valid, null_count) in zip(schema, self._columns, batch)
+            ]
+            yield pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+    def to_arrow(self):
+        pa = _require(pyarrow, "pyarrow")
+        return pa.Table.from_batches(list(self.iter_arrow()), schema=self.arrow_schema())
+
+    def write_parquet(self, path: str, compression: Optional[str] = "zstd"):
+        """Пишет все record batches в Parquet-файл (по одной группе строк на пачку)."""
+        _require(pyarrow, "pyarrow")
+        import pyarrow.parquet as pq
+        with pq.ParquetWriter(path, self.arrow_schema(), compression=compression) as writer:
+            for batch in self.iter_arrow():
+                writer.write_batch(batch)
@@ -109,4 +109,26 @@ class ChannelPermissionManageError(AnixartError):
         3: "Целевой профиль не найден.",
         4: "Канал не найден.",
         5: "Вы не владелец канала."
-    }
\ No newline at end of file
+    }
+
+
+class RequestError(AnixartError):
+    """Запрос не удался на транспортном уровне (после всех повторов); error_code — HTTP-статус или код ниже."""
+    CONNECTION = 0
+    TIMEOUT = 1
+    INVALID_RESPONSE = 2
+    CIRCUIT_OPEN = 3
+    ERROR_MESSAGES = {
+        0: "Не удалось соединиться с сервером.",
+        1: "Превышено время ожидания ответа.",
+        2: "Сервер вернул ответ не в формате JSON.",
+        3: "Запросы к серверу приостановлены после серии ошибок.",
+        429: "Слишком много запросов.",
+        500: "Внутренняя ошибка сервера.",
+        502: "Ошибка шлюза.",
+        503: "Сервис временно недоступен.",
+        504: "Шлюз не дождался ответа сервера.",
+    }
+
+class CircuitOpenError(RequestError):
+    """Запрос отклонён без отправки: хост недоступен после серии ошибок подряд."""
@@ -0,0 +1,45 @@
+import json
+from typing import Any, Callable, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _stdlib_loads(body: bytes) -> Any:
+    return json.loads(body)
+
+
+DECODERS = {
+    "json": lambda: _stdlib_loads,
+    "orjson": lambda: orjson.loads if orjson is not None else None,
+}
+
+
+def dumps(value: Any) -> bytes:
+    """Сериализует объект в JSON (bytes): orjson, если он установлен, иначе стандартный json."""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def get_decoder(decoder: Union[None, str, Callable[[bytes], Any]] = None) -> Callable[[bytes], Any]:
+    """
+    Возвращает функцию разбора тела ответа (bytes -> объект).
+
+    decoder — имя из DECODERS ("orjson", "json"), собственная функция или None:
+    тогда используется orjson, если он установлен, иначе стандартный json.
+    Функция должна выбрасывать ValueError (или его подкласс) на некорректном JSON.
+    """
+    if callable(decoder):
+        return decoder
+    if decoder is None:
+        return orjson.loads if orjson is not None else _stdlib_loads
+    if decoder not in DECODERS:
+        available = ", ".join(DECODERS)
+        raise ValueError(f"Неизвестный декодер JSON. Доступные варианты: {available}")
+    loads = DECODERS[decoder]()
+    if loads is None:
+        raise ImportError(f"Декодер {decoder} не установлен: pip install {decoder}")
+    return loads
@@ -0,0 +1,304 @@
+import re
+import threading
+import time
+import warnings
+from typing import Callable, Optional
+from urllib.parse import urlsplit
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+ENDPOINT_TEMPLATES = [
+    (re.compile(r"/article/vote/\d+/\d+$"), "/article/vote/{id}/{vote}"),
+    (re.compile(r"/channel/\d+/block/manage$"), "/channel/{id}/block/manage"),
+]
+
+
+def normalize_endpoint(path: str) -> str:
+    """
+    Шаблон эндпоинта для метрик: числовые сегменты пути заменяются на {id}, а
+    последний числовой сегмент после "all" или после другого числа — на {page}.
+    Например, /article/votes/12/3 -> /article/votes/{id}/{page}.
+    """
+    path = path.split("?", 1)[0]
+    for pattern, template in ENDPOINT_TEMPLATES:
+        if pattern.search(path):
+            return pattern.sub(template, path)
+    segments = path.split("/")
+    last = len(segments) - 1
+    for index, segment in enumerate(segments):
+        if segment.isdigit():
+            previous = segments[index - 1] if index else ""
+            is_page = index == last and (previous == "all" or previous == "{id}")
+            segments[index] = "{page}" if is_page else "{id}"
+    return "/".join(segments)
+
+
+class RequestEvent:
+    """
+    Одна HTTP-попытка запроса к API или редактору.
+
+    Времена в секундах; None — фаза не измерялась (например, соединение взято из
+    пула, или транспорт не сообщает время разрешения имени: у requests dns всегда
+    None, а connect включает разрешение имени и TLS).
+    """
+
+    __slots__ = ("source", "method", "endpoint", "path", "mirror", "status", "code", "error", "bytes_out",
+                 "bytes_in", "dns", "connect", "ttfb", "total", "attempt", "retry", "timestamp", "_start")
+
+    def __init__(self, source: str, method: str, path: str, attempt: int = 0):
+        self.source = source
+        self.method = method
+        self.path = path
+        self.endpoint = normalize_endpoint(path)
+        self.mirror: Optional[str] = None
+        self.status: Optional[int] = None
+        self.code: Optional[int] = None
+        self.error: Optional[str] = None
+        self.bytes_out = 0
+        self.bytes_in = 0
+        self.dns: Optional[float] = None
+        self.connect: Optional[float] = None
+        self.ttfb: Optional[float] = None
+        self.total: Optional[float] = None
+        self.attempt = attempt
+        self.retry = False
+        self.timestamp = time.time()
+        self._start = time.perf_counter()
+
+    def complete(self, result=None, error: Optional[str] = None, retry: bool = False):
+        """Фиксирует полное время и исход попытки: код API из ответа, вид сбоя и был ли повтор."""
+        self.total = time.perf_counter() - self._start
+        if isinstance(result, dict):
+            self.code = result.get("code")
+        self.error = error
+        self.retry = retry
+
+    def as_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__ if not name.startswith("_")}
+
+    def __repr__(self) -> str:
+        return f"<RequestEvent({self.as_dict()})>"
+
+
+class Hooks:
+    """
+    Реестр подписчиков на события клиента. Сейчас клиент отправляет одно
+    событие — "request" с RequestEvent после каждой HTTP-попытки. Исключение в
+    подписчике не прерывает запрос и превращается в предупреждение.
+    """
+
+    def __init__(self):
+        self._callbacks = {}
+        self._lock = threading.Lock()
+
+    def __bool__(self) -> bool:
+        return any(self._callbacks.values())
+
+    def subscribe(self, callback: Callable, event: str = "request") -> Callable:
+        """Подписывает callback на событие; возвращает callback, поэтому годится как декоратор."""
+        with self._lock:
+            self._callbacks[event] = self._callbacks.get(event, ()) + (callback,)
+        return callback
+
+    def unsubscribe(self, callback: Callable, event: str = "request"):
+        with self._lock:
+            self._callbacks[event] = tuple(cb for cb in self._callbacks.get(event, ()) if cb is not callback)
+
+    def emit(self, event: str, payload):
+        for callback in self._callbacks.get(event, ()):
+            try:
+                callback(payload)
+            except Exception as e:
+                warnings.warn(f"Ошибка в обработчике события {event}: {e!r}", RuntimeWarning)
+
+
+class LatencyHistogram:
+    """
+    Гистограмма задержек в духе HdrHistogram: значения в микросекундах
+    раскладываются по лог-линейным корзинам с относительной погрешностью не
+    больше 2**-(SUB_BUCKET_BITS - 1) (около 1.6%), память растёт логарифмически.
+    """
+
+    SUB_BUCKET_BITS = 7
+
+    def __init__(self):
+        self.counts = {}
+        self.count = 0
+        self.sum = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def _index(cls, micros: int) -> int:
+        shift = max(0, micros.bit_length() - cls.SUB_BUCKET_BITS)
+        return (shift << cls.SUB_BUCKET_BITS) + (micros >> shift)
+
+    @classmethod
+    def _value(cls, index: int) -> float:
+        shift = index >> cls.SUB_BUCKET_BITS
+        lower = (index & ((1 << cls.SUB_BUCKET_BITS) - 1)) << shift
+        return (lower + ((1 << shift) - 1) / 2) / 1e6
+
+    def record(self, seconds: float):
+        index = self._index(max(0, int(seconds * 1e6)))
+        with self._lock:
+            self.counts[index] = self.counts.get(index, 0) + 1
+            self.count += 1
+            self.sum += seconds
+            self.min = seconds if self.min is None else min(self.min, seconds)
+            self.max = seconds if self.max is None else max(self.max, seconds)
+
+    def percentile(self, percent: float) -> Optional[float]:
+        """Значение percent-го перцентиля (0–100) в секундах или None, если данных нет."""
+        with self._lock:
+            if not self.count:
+                return None
+            target = max(1, round(self.count * percent / 100))
+            seen = 0
+            for index in sorted(self.counts):
+                seen += self.counts[index]
+                if seen >= target:
+                    return min(self._value(index), self.max)
+            return self.max
+
+
+class MetricsCollector:
+    """
+    Подписчик Hooks, собирающий метрики по шаблонам эндпоинтов: число запросов
+    по статусам и кодам API, ошибки, повторы, трафик и гистограммы задержек
+    (общее время и время до первого байта). to_prometheus() отдаёт метрики в
+    текстовом формате Prometheus.
+    """
+
+    QUANTILES = (0.5, 0.9, 0.99)
+
+    def __init__(self, prefix: str = "anixart"):
+        self.prefix = prefix
+        self.requests = {}
+        self.errors = {}
+        self.retries = {}
+        self.bytes_in = {}
+        self.bytes_out = {}
+        self.latency = {}
+        self.ttfb = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, event: RequestEvent):
+        key = (event.source, event.method, event.endpoint)
+        with self._lock:
+            status_key = key + (str(event.status or ""), str(event.code if event.code is not None else ""))
+            self.requests[status_key] = self.requests.get(status_key, 0) + 1
+            if event.error:
+                error_key = key + (event.error,)
+                self.errors[error_key] = self.errors.get(error_key, 0) + 1
+            if event.retry:
+                self.retries[key] = self.retries.get(key, 0) + 1
+            self.bytes_in[key] = self.bytes_in.get(key, 0) + event.bytes_in
+            self.bytes_out[key] = self.bytes_out.get(key, 0) + event.bytes_out
+            latency = self.latency.get(key) or self.latency.setdefault(key, LatencyHistogram())
+            ttfb = self.ttfb.get(key) or self.ttfb.setdefault(key, LatencyHistogram())
+        if event.total is not None:
+            latency.record(event.total)
+        if event.ttfb is not None:
+            ttfb.record(event.ttfb)
+
+    def percentile(self, endpoint: str, percent: float, method: Optional[str] = None) -> Optional[float]:
+        """Перцентиль общего времени запросов к шаблону endpoint (по всем методам, если method не задан)."""
+        merged = LatencyHistogram()
+        for (_, key_method, key_endpoint), histogram in list(self.latency.items()):
+            if key_endpoint == endpoint and method in (None, key_method):
+                with histogram._lock:
+                    for index, count in histogram.counts.items():
+                        merged.counts[index] = merged.counts.get(index, 0) + count
+                    merged.count += histogram.count
+                    merged.max = histogram.max if merged.max is None else max(merged.max, histogram.max or 0)
+        return merged.percentile(percent)
+
+    def to_prometheus(self) -> str:
+        lines = []
+        prefix = self.prefix
+
+        def labels(key, names):
+            return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, key)) + "}"
+
+        base = ("source", "method", "endpoint")
+        with self._lock:
+            for name, kind, help_text, values, names in (
+                ("requests_total", "counter", "HTTP-попытки по статусу и коду API.", self.requests, base + ("status", "code")),
+                ("request_errors_total", "counter", "Попытки, завершившиеся ошибкой транспорта или API.", self.errors, base + ("error",)),
+                ("request_retries_total", "counter", "Попытки, после которых запрос был повторён.", self.retries, base),
+                ("response_bytes_total", "counter", "Получено байт в телах ответов.", self.bytes_in, base),
+                ("request_bytes_total", "counter", "Отправлено байт в телах запросов.", self.bytes_out, base),
+            ):
+                lines.append(f"# HELP {prefix}_{name} {help_text}")
+                lines.append(f"# TYPE {prefix}_{name} {kind}")
+                for key, value in sorted(values.items()):
+                    lines.append(f"{prefix}_{name}{labels(key, names)} {value}")
+            histograms = (
+                ("request_duration_seconds", "Полное время HTTP-попытки.", dict(self.latency)),
+                ("request_ttfb_seconds", "Время до первого байта ответа.", dict(self.ttfb)),
+            )
+        for name, help_text, values in histograms:
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} summary")
+            for key, histogram in sorted(values.items()):
+                if not histogram.count:
+                    continue
+                for quantile in self.QUANTILES:
+                    value = histogram.percentile(quantile * 100)
+                    lines.append(f"{prefix}_{name}{labels(key + (quantile,), base + ('quantile',))} {value:.6f}")
+                lines.append(f"{prefix}_{name}_sum{labels(key, base)} {histogram.sum:.6f}")
+                lines.append(f"{prefix}_{name}_count{labels(key, base)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def mirror_of(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+_connect_timings = threading.local()
+
+
+def pop_connect_time() -> Optional[float]:
+    """Время установки соединения в текущем потоке с последнего вызова (None — соединение из пула)."""
+    value = getattr(_connect_timings, "value", None)
+    _connect_timings.value = None
+    return value
+
+
+class _TimedHTTPConnection(HTTPConnection):
+    def connect(self):
+        start = time.perf_counter()
+        super().connect()
+        _connect_timings.value = time.perf_counter() - start
+
+
+class _TimedHTTPSConnection(HTTPSConnection):
+    def connect(self):
+        start = time.perf_counter()
+        super().connect()
+        _connect_timings.value = time.perf_counter() - start
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class TimingAdapter(HTTPAdapter):
+    """HTTPAdapter, который запоминает время установки новых соединений (разрешение имени, TCP и TLS)."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {"http": _TimedHTTPConnectionPool, "https": _TimedHTTPSConnectionPool}
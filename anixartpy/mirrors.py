@@ -0,0 +1,211 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event, Lock, Thread, current_thread
+from typing import Iterable, Optional
+
+import requests
+from urllib3.exceptions import NewConnectionError
+
+
+class Mirror:
+    """
+    Состояние одного зеркала: скользящая задержка, доля ошибок, время до
+    окончания карантина и признак suspect — последнее обращение к зеркалу
+    завершилось сбоем, и с тех пор оно ни разу не ответило.
+    """
+
+    __slots__ = ("url", "latency", "error_rate", "down_until", "requests", "failures", "suspect")
+
+    def __init__(self, url: str):
+        self.url = url
+        self.latency: Optional[float] = None
+        self.error_rate = 0.0
+        self.down_until = 0.0
+        self.requests = 0
+        self.failures = 0
+        self.suspect = False
+
+    def __repr__(self) -> str:
+        latency = "?" if self.latency is None else f"{self.latency * 1000:.0f}ms"
+        return f"<Mirror({self.url}, latency={latency}, error_rate={self.error_rate:.2f})>"
+
+
+class MirrorPool:
+    """
+    Пул зеркал API с выбором по задержке и переключением при сбоях.
+
+    Для каждого зеркала хранится экспоненциальное скользящее среднее задержки и
+    доли ошибок. Оценки обновляются ответами на обычные запросы и фоновыми
+    проверками (GET base_url + probe_path раз в probe_interval секунд).
+    Запрос уходит на здоровое зеркало с наименьшим score; после ошибки
+    соединения или ответа 5xx зеркало на cooldown секунд уходит в конец очереди,
+    а после карантина пропускает вперёд здоровые зеркала, пока не ответит на
+    запрос или проверку. Неизвестная задержка считается равной probe_timeout.
+    """
+
+    ERROR_WEIGHT = 4.0  # во сколько раз доля ошибок 1.0 увеличивает score относительно задержки
+
+    def __init__(self, urls: Iterable[str], probe_interval: Optional[float] = 30.0, probe_timeout: float = 5.0,
+                 probe_path: str = "/", alpha: float = 0.3, cooldown: float = 30.0):
+        """
+        Args:
+            urls: Адреса зеркал в порядке предпочтения (используется, пока задержки неизвестны).
+            probe_interval: Период фоновых проверок в секундах; None — без фоновых проверок.
+            probe_timeout: Таймаут одной проверки.
+            probe_path: Путь, запрашиваемый при проверке; зеркало здорово, если ответ не 5xx.
+            alpha: Вес нового измерения в скользящих средних.
+            cooldown: Сколько секунд зеркало после сбоя не выбирается, пока есть здоровые.
+        """
+        self.mirrors = [Mirror(url.rstrip("/")) for url in dict.fromkeys(urls)]
+        if not self.mirrors:
+            raise ValueError("MirrorPool требует хотя бы одно зеркало")
+        self.probe_interval = probe_interval
+        self.probe_timeout = probe_timeout
+        self.probe_path = probe_path
+        self.alpha = alpha
+        self.cooldown = cooldown
+        self.failovers = 0
+        self._by_url = {mirror.url: mirror for mirror in self.mirrors}
+        self._lock = Lock()
+        self._stop = Event()
+        self._thread: Optional[Thread] = None
+        self._session: Optional[requests.Session] = None
+
+    def score(self, mirror: Mirror) -> float:
+        latency = mirror.latency if mirror.latency is not None else self.probe_timeout
+        return latency * (1 + self.ERROR_WEIGHT * mirror.error_rate)
+
+    def _rank(self, mirror: Mirror) -> tuple:
+        return mirror.suspect, self.score(mirror)
+
+    def candidates(self) -> list[str]:
+        """Адреса зеркал в порядке попыток: здоровые по score, затем находящиеся на карантине."""
+        now = time.monotonic()
+        with self._lock:
+            healthy = [mirror for mirror in self.mirrors if mirror.down_until <= now]
+            down = [mirror for mirror in self.mirrors if mirror.down_until > now]
+            healthy.sort(key=self._rank)
+            down.sort(key=lambda mirror: mirror.down_until)
+        return [mirror.url for mirror in healthy + down]
+
+    def best(self) -> str:
+        return self.candidates()[0]
+
+    def record(self, url: str, latency: Optional[float], ok: bool):
+        """Учитывает результат запроса к зеркалу url (latency — время ответа в секундах)."""
+        mirror = self._by_url.get(url)
+        if mirror is None:
+            return
+        alpha = self.alpha
+        with self._lock:
+            mirror.requests += 1
+            mirror.error_rate += alpha * ((0.0 if ok else 1.0) - mirror.error_rate)
+            mirror.suspect = not ok
+            if ok:
+                mirror.down_until = 0.0
+                if latency is not None:
+                    mirror.latency = latency if mirror.latency is None else mirror.latency + alpha * (latency - mirror.latency)
+            else:
+                mirror.failures += 1
+                mirror.down_until = time.monotonic() + self.cooldown
+
+    def record_failover(self):
+        with self._lock:
+            self.failovers += 1
+
+    def record_error(self, url: str, is_last: bool, is_write: bool, not_sent: bool) -> bool:
+        """
+        Учитывает ошибку соединения с зеркалом url. True — запрос нужно отправить на
+        следующее зеркало: оно есть, и запрос читающий или заведомо не дошёл до сервера.
+        """
+        self.record(url, None, False)
+        if is_last or (is_write and not not_sent):
+            return False
+        self.record_failover()
+        return True
+
+    def record_reply(self, url: str, status: int, latency: float, is_last: bool, is_write: bool) -> bool:
+        """
+        Учитывает ответ зеркала url. True — ответ 5xx, и читающий запрос нужно
+        отправить на следующее зеркало; изменяющие запросы не переотправляются.
+        """
+        if status < 500:
+            self.record(url, latency, True)
+            return False
+        self.record(url, None, False)
+        if is_write or is_last:
+            return False
+        self.record_failover()
+        return True
+
+    @property
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "failovers": self.failovers,
+                "mirrors": {
+                    mirror.url: {
+                        "latency": mirror.latency,
+                        "error_rate": round(mirror.error_rate, 4),
+                        "healthy": mirror.down_until <= time.monotonic(),
+                        "requests": mirror.requests,
+                        "failures": mirror.failures,
+                    }
+                    for mirror in self.mirrors
+                },
+            }
+
+    def probe(self, url: str):
+        """Проверяет одно зеркало и учитывает результат."""
+        if self._session is None:
+            self._session = requests.Session()
+        start = time.monotonic()
+        try:
+            response = self._session.get(f"{url}{self.probe_path}", timeout=self.probe_timeout)
+            response.close()
+        except requests.RequestException:
+            self.record(url, None, False)
+            return
+        self.record(url, time.monotonic() - start, response.status_code < 500)
+
+    def probe_all(self):
+        with ThreadPoolExecutor(max_workers=len(self.mirrors), thread_name_prefix="anixartpy-probe") as executor:
+            list(executor.map(self.probe, [mirror.url for mirror in self.mirrors]))
+
+    def start(self):
+        """Запускает фоновые проверки (если заданы и ещё не запущены)."""
+        if not self.probe_interval or self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._stop.clear()
+            self._thread = Thread(target=self._run, name="anixartpy-mirrors", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """Останавливает фоновые проверки; оценки продолжают обновляться по обычным запросам."""
+        self._stop.set()
+        thread, self._thread = self._thread, None
+        if thread is not None and thread is not current_thread():
+            thread.join()
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.probe_all()
+            self._stop.wait(self.probe_interval)
+
+
+
+def request_not_sent(exc: BaseException) -> bool:
+    """
+    True, если запрос requests заведомо не дошёл до сервера (не удалось разрешить имя или
+    установить соединение) и его можно безопасно отправить на другое зеркало,
+    даже если он изменяет данные.
+    """
+    if isinstance(exc, requests.ConnectTimeout):
+        return True
+    if isinstance(exc, requests.ConnectionError):
+        reason = getattr(exc.args[0], "reason", None) if exc.args else None
+        return isinstance(reason, NewConnectionError)
+    return False
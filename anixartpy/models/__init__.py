@@ -1,4 +1,4 @@
-from .base import BaseModel
+from .base import BaseModel, IdentityMap, resolve
 from .profile import Badge, Role, Socials, Stats, Counters, Notifications, WatchDynamic, Profile
 from .channel import Channel, ChannelMember
 from .user_vote import UserVote
@@ -9,6 +9,8 @@ from .articleSuggestion import ArticleSuggestion
 
 __all__ = [
     "BaseModel",
+    "IdentityMap",
+    "resolve",
     "Badge",
     "Role",
     "Socials",
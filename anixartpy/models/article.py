@@ -1,7 +1,7 @@
 from datetime import datetime
-from typing import Optional, List, Union, Iterator, TYPE_CHECKING
+from typing import Any, Callable, Optional, List, Union, Iterable, Iterator, TYPE_CHECKING
 from .. import enums, errors, utils
-from .base import BaseModel
+from .base import BaseModel, lazy, resolve
 from .payload import Payload
 from .user_vote import UserVote
 
@@ -11,6 +11,7 @@ if TYPE_CHECKING:
 
 
 class Article(BaseModel):
+    __slots__ = ("__api",)
     id: int
     channel: "Channel"
     author: dict
@@ -24,17 +25,37 @@ class Article(BaseModel):
     is_deleted: bool
     under_moderation_reason: Optional[str]
     contains_repost_article: bool
+    creation_date: datetime
+    last_update_date: datetime
 
     def __init__(self, data: dict, api):
         super().__init__(data)
         self.__api = api
+
+    @lazy
+    def channel(self, data: dict) -> "Channel":
         from .channel import Channel
-        self.channel = Channel(data["channel"], api)
-        self.payload = Payload(data["payload"])
-        self.creation_date: datetime = datetime.fromtimestamp(data["creation_date"])
-        self.last_update_date: datetime = datetime.fromtimestamp(data["last_update_date"])
-        self.repost_article = Article(data["repost_article"], self.__api) if data.get("repost_article") else None
-        self.vote = enums.Vote(data["vote"]) if data.get("vote") else None
+        return resolve(Channel, data["channel"], self.__api)
+
+    @lazy
+    def payload(self, data: dict) -> Payload:
+        return Payload(data["payload"])
+
+    @lazy
+    def creation_date(self, data: dict) -> datetime:
+        return datetime.fromtimestamp(data["creation_date"])
+
+    @lazy
+    def last_update_date(self, data: dict) -> datetime:
+        return datetime.fromtimestamp(data["last_update_date"])
+
+    @lazy
+    def repost_article(self, data: dict) -> Optional["Article"]:
+        return resolve(Article, data["repost_article"], self.__api) if data.get("repost_article") else None
+
+    @lazy
+    def vote(self, data: dict) -> Optional[enums.Vote]:
+        return enums.Vote(data["vote"]) if data.get("vote") else None
 
     def edit(self, article_data: Union[utils.ArticleBuilder, dict], repost_article_id: Optional[int] = None) -> "Article":
         if isinstance(article_data, utils.ArticleBuilder):
@@ -44,7 +65,7 @@ class Article(BaseModel):
         response = self.__api._post(f"/article/edit/{self.id}", article_data)
         if response["code"] == 0:
             self.payload = Payload(article_data["payload"])
-            self.repost_article = Article(response["article"]["repost_article"], self.__api) if response["article"]["repost_article"] else None
+            self.repost_article = resolve(Article, response["article"]["repost_article"], self.__api) if response["article"]["repost_article"] else None
         else:
             raise errors.ArticleCreateEditError(response["code"])
         return self
@@ -65,33 +86,37 @@ class Article(BaseModel):
             raise errors.DefaultError(response["code"])
         return response
 
-    def _fetch_votes_page(self, sort: enums.Sorting, page: int) -> tuple[list[UserVote], int]:
+    def _fetch_votes_page(self, sort: enums.Sorting, page: int, build: Optional[Callable[[list], list]] = None) -> tuple[list[UserVote], int]:
         response = self.__api._get(f"/article/votes/{self.id}/{page}?sort={sort}")
         if response["code"] == 0:
-            items = [UserVote(vote) for vote in response["content"]]
+            items = build(response["content"]) if build else [UserVote(vote) for vote in response["content"]]
             return items, response["total_page_count"]
         raise errors.AnixartError(response["code"], "Ошибка загрузки голосов")
 
-    def get_votes(self, sort: enums.Sorting, page: Union[int, range, None] = None) -> Union[list[UserVote], Iterator[UserVote]]:
-        return utils.paginate(lambda pg: self._fetch_votes_page(sort, pg), page)
+    def get_votes(self, sort: enums.Sorting, page: Union[int, range, None] = None, prefetch: int = 0, raw: bool = False, factory: Optional[Callable[[dict], Any]] = None, fields: Optional[Iterable[str]] = None) -> Union[list[UserVote], Iterator[UserVote]]:
+        build = utils.item_builder(raw, factory, fields, UserVote)
+        return utils.paginate(lambda pg: self._fetch_votes_page(sort, pg, build), page, prefetch, f"/article/votes/{self.id}", {"sort": sort})
 
-    def _fetch_reposts_page(self, sort: enums.Sorting, page: int) -> tuple[list["Article"], int]:
+    def _fetch_reposts_page(self, sort: enums.Sorting, page: int, build: Optional[Callable[[list], list]] = None) -> tuple[list["Article"], int]:
         response = self.__api._get(f"/article/reposts/{self.id}/{page}?sort={sort}")
         if response["code"] == 0:
-            items = [Article(repost, self.__api) for repost in response["content"]]
+            items = build(response["content"]) if build else [resolve(Article, repost, self.__api) for repost in response["content"]]
             return items, response["total_page_count"]
         raise errors.AnixartError(response["code"], "Ошибка загрузки репостов")
 
-    def get_reposts(self, sort: enums.Sorting, page: Union[int, range, None] = None) -> Union[list["Article"], Iterator["Article"]]:
-        return utils.paginate(lambda pg: self._fetch_reposts_page(sort, pg), page)
+    def get_reposts(self, sort: enums.Sorting, page: Union[int, range, None] = None, prefetch: int = 0, raw: bool = False, factory: Optional[Callable[[dict], Any]] = None, fields: Optional[Iterable[str]] = None) -> Union[list["Article"], Iterator["Article"]]:
+        build = utils.item_builder(raw, factory, fields, lambda data: Article(data, self.__api))
+        return utils.paginate(lambda pg: self._fetch_reposts_page(sort, pg, build), page, prefetch, f"/article/reposts/{self.id}", {"sort": sort})
     
-    def _fetch_comments_page(self, sort: enums.Sorting, page: int) -> tuple[list["ArticleComment"], int]:
+    def _fetch_comments_page(self, sort: enums.Sorting, page: int, build: Optional[Callable[[list], list]] = None) -> tuple[list["ArticleComment"], int]:
         from .comment import ArticleComment
         response = self.__api._get(f"/article/comment/all/{self.id}/{page}?sort={sort}")
         if response["code"] == 0:
-            items = [ArticleComment(comment, self.__api) for comment in response["content"]]
+            items = build(response["content"]) if build else [ArticleComment(comment, self.__api) for comment in response["content"]]
             return items, response["total_page_count"]
         raise errors.AnixartError(response["code"], "Ошибка загрузки комментариев")
     
-    def get_comments(self, sort: enums.Sorting, page: Union[int, range, None] = 0) -> Union[list["ArticleComment"], Iterator["ArticleComment"]]:
-        return utils.paginate(lambda pg: self._fetch_comments_page(sort, pg), page)
\ No newline at end of file
+    def get_comments(self, sort: enums.Sorting, page: Union[int, range, None] = 0, prefetch: int = 0, raw: bool = False, factory: Optional[Callable[[dict], Any]] = None, fields: Optional[Iterable[str]] = None) -> Union[list["ArticleComment"], Iterator["ArticleComment"]]:
+        from .comment import ArticleComment
+        build = utils.item_builder(raw, factory, fields, lambda data: ArticleComment(data, self.__api))
+        return utils.paginate(lambda pg: self._fetch_comments_page(sort, pg, build), page, prefetch, f"/article/comment/all/{self.id}", {"sort": sort})
\ No newline at end of file
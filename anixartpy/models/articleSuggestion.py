@@ -1,14 +1,15 @@
 from datetime import datetime
 from typing import Union, Optional, TYPE_CHECKING
 from .. import utils, errors
+from .article import Article
 from .payload import Payload
 
 if TYPE_CHECKING:
-    from .article import Article
     from .channel import Channel
 
 
-class ArticleSuggestion:
+class ArticleSuggestion(Article):
+    __slots__ = ("__api",)
     id: int
     channel: "Channel"
     author: dict
@@ -18,11 +19,8 @@ class ArticleSuggestion:
     under_moderation_reason: Optional[str]
 
     def __init__(self, data: dict, api):
+        super().__init__(data, api)
         self.__api = api
-        from .article import Article
-        article = Article(data, api)
-        for attr, value in article.__dict__.items():
-            setattr(self, attr, value)
 
     def edit(self, article_data: Union[utils.ArticleBuilder, dict]) -> "ArticleSuggestion":
         if isinstance(article_data, utils.ArticleBuilder):
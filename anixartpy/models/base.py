@@ -1,7 +1,219 @@
-class BaseModel:
+import keyword
+import weakref
+from datetime import datetime
+from threading import Lock
+from types import MemberDescriptorType
+from typing import Optional
+
+MAX_DECODERS = 4
+
+
+def from_timestamp(value) -> Optional[datetime]:
+    """Преобразует unix-время из ответа в datetime; 0 и None дают None."""
+    return datetime.fromtimestamp(value) if value else None
+
+
+class lazy:
+    """
+    Вложенное поле модели, которое декодируется из исходного словаря ответа
+    при первом обращении и затем кэшируется в __dict__ экземпляра, так что
+    повторные обращения не проходят через дескриптор.
+
+    Функция получает модель и исходный словарь data; одноимённый ключ ответа
+    BaseModel в экземпляр не копирует. Поле lazy.of_fields строится из уже
+    декодированных полей модели (функция получает только модель); модели, у
+    которых других полей lazy нет, не хранят исходный словарь в _data.
+    """
+
+    uses_data = True
+
+    def __init__(self, func):
+        self.func = func
+        self.name = func.__name__
+        self.__doc__ = func.__doc__
+
+    @classmethod
+    def of_fields(cls, func) -> "lazy":
+        field = cls(func)
+        field.uses_data = False
+        return field
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        try:
+            value = self.func(instance, instance._data) if self.uses_data else self.func(instance)
+        except KeyError as e:
+            raise AttributeError(f"Поле {self.name} не загружено (нет ключа {e} в ответе)") from e
+        instance.__dict__[self.name] = value
+        return value
+
+
+class ModelMeta(type):
+    """
+    Создаёт для модели __slots__ из аннотаций класса и явно объявленных
+    __slots__. Известные поля не требуют __dict__ у экземпляра; неизвестные
+    ключи ответа и декодированные поля lazy сохраняются в __dict__, который
+    создаётся только при необходимости.
+
+    Преобразования полей объявляются в _converters ({поле: функция}) и
+    наследуются. Для каждого набора ключей ответа модель один раз компилирует
+    декодер — функцию, которая присваивает поля по именам без обхода словаря и
+    вызовов setattr (см. BaseModel._compile_decoder).
+    """
+
+    def __new__(mcls, name, bases, namespace, **kwargs):
+        inherited = {attr for base in bases for klass in base.__mro__ for attr in vars(klass)}
+        slots = list(namespace.get("__slots__", ()))
+        for attr in namespace.get("__annotations__", {}):
+            if attr not in inherited and attr not in namespace and attr not in slots:
+                slots.append(attr)
+        namespace["__slots__"] = tuple(slots)
+
+        cls = super().__new__(mcls, name, bases, namespace, **kwargs)
+        fields = {attr: value for klass in reversed(cls.__mro__) for attr, value in vars(klass).items() if isinstance(value, lazy)}
+        cls._lazy_fields = frozenset(fields)
+        cls._keeps_data = any(field.uses_data for field in fields.values())
+        converters = {}
+        for klass in reversed(cls.__mro__):
+            converters.update(vars(klass).get("_converters", {}))
+        cls._converters = converters
+        cls._decoders = ()
+        return cls
+
+
+class BaseModel(metaclass=ModelMeta):
+    __slots__ = ("__dict__", "__weakref__", "_data")
+    _lazy_fields = frozenset()
+    _keeps_data = False
+
     def __init__(self, data: dict):
+        for decode in self._decoders:
+            try:
+                if decode(self, data):
+                    return
+            except KeyError:
+                pass
+        self._decode(data)
+        type(self)._compile_decoder(data)
+
+    def _decode(self, data: dict):
+        """Общий путь декодирования: обход словаря с setattr для каждого ключа."""
+        lazy_fields = self._lazy_fields
+        converters = self._converters
+        if self._keeps_data:
+            self._data = data
         for key, value in data.items():
-            setattr(self, key, value)
+            if key not in lazy_fields:
+                convert = converters.get(key)
+                setattr(self, key, value if convert is None else convert(value))
+
+    @classmethod
+    def _compile_decoder(cls, data: dict):
+        """
+        Компилирует декодер для набора ключей data. Декодер проверяет число
+        ключей, читает каждое поле по имени (KeyError — другой набор ключей) и
+        присваивает его с преобразованием из _converters. У модели не больше
+        MAX_DECODERS декодеров; ответы с другими ключами, как и с ключами, не
+        являющимися идентификаторами, декодируются общим путём _decode.
+        """
+        keys = list(data)
+        if len(cls._decoders) >= MAX_DECODERS or not all(key.isidentifier() and not keyword.iskeyword(key) for key in keys):
+            return
+        lines = [f"if len(data) != {len(keys)}:", "    return False"]
+        namespace = {}
+        if cls._keeps_data:
+            lines.append("self._data = data")
+        for index, key in enumerate(keys):
+            if key in cls._lazy_fields:
+                lines.append(f"data[{key!r}]")
+                continue
+            convert = cls._converters.get(key)
+            if convert is None:
+                lines.append(f"self.{key} = data[{key!r}]")
+            else:
+                namespace[f"c{index}"] = convert
+                lines.append(f"self.{key} = c{index}(data[{key!r}])")
+        lines.append("return True")
+        source = "def decode(self, data):\n    " + "\n    ".join(lines)
+        exec(compile(source, f"<{cls.__name__} decoder>", "exec"), namespace)
+        cls._decoders = cls._decoders + (namespace["decode"],)
+
+    def _refresh(self, *args):
+        """Повторно инициализирует модель свежими данными, сбрасывая декодированные поля lazy."""
+        instance_dict = self.__dict__
+        for name in self._lazy_fields:
+            instance_dict.pop(name, None)
+        self.__init__(*args)
+
+    def _fields(self) -> dict:
+        fields = {}
+        for klass in reversed(type(self).__mro__):
+            for attr, value in vars(klass).items():
+                if isinstance(value, MemberDescriptorType) and attr != "_data":
+                    try:
+                        fields[attr] = value.__get__(self, type(self))
+                    except AttributeError:
+                        pass
+        fields.update(getattr(self, "__dict__", {}))
+        return fields
 
     def __repr__(self) -> str:
-        return f"<{self.__class__.__name__}({self.__dict__})>"
\ No newline at end of file
+        return f"<{self.__class__.__name__}({self._fields()})>"
+
+
+class Partial(dict):
+    """Словарь ответа, сокращённый проекцией полей (utils.projector)."""
+
+    __slots__ = ()
+
+
+class IdentityMap:
+    """
+    Карта идентичности клиента: для каждой пары (тип модели, id) хранится не
+    больше одного экземпляра. Повторные вхождения одной сущности в ответах
+    обновляют и возвращают уже существующий объект. Ссылки слабые — объекты,
+    на которые никто не ссылается, удаляются сборщиком мусора.
+
+    Модели из сокращённых ответов (Partial) в карту не попадают и не
+    обновляют уже загруженные экземпляры.
+    """
+
+    def __init__(self):
+        self._objects = weakref.WeakValueDictionary()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    def get(self, cls, id):
+        return self._objects.get((cls, id))
+
+    def resolve(self, cls, data: dict, *args):
+        model_id = data.get("id")
+        if model_id is None or isinstance(data, Partial):
+            return cls(data, *args)
+        key = (cls, model_id)
+        with self._lock:
+            instance = self._objects.get(key)
+            if instance is None:
+                instance = cls(data, *args)
+                self._objects[key] = instance
+            else:
+                instance._refresh(data, *args)
+            return instance
+
+    def clear(self):
+        with self._lock:
+            self._objects.clear()
+
+
+def resolve(cls, data: dict, api, *args):
+    """Создаёт модель cls или обновляет общий экземпляр из карты идентичности клиента (api.identity_map)."""
+    identity_map = getattr(api, "identity_map", None)
+    if identity_map is None:
+        return cls(data, api, *args)
+    return identity_map.resolve(cls, data, api, *args)
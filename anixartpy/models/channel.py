@@ -1,7 +1,7 @@
 from datetime import datetime
-from typing import Optional, Union, Iterator, TYPE_CHECKING
-from .. import enums, errors, anix_images, utils
-from .base import BaseModel
+from typing import Any, Callable, Optional, Union, Iterable, Iterator, TYPE_CHECKING
+from .. import enums, errors, anix_images, utils, checkpoints
+from .base import BaseModel, lazy, resolve, from_timestamp
 from .profile import Badge
 
 if TYPE_CHECKING:
@@ -9,7 +9,15 @@ if TYPE_CHECKING:
     from .articleSuggestion import ArticleSuggestion
 
 
+def _expire_date(value):
+    try:
+        return from_timestamp(value)
+    except Exception:
+        return value
+
+
 class ChannelMember(BaseModel):
+    __slots__ = ("__api",)
     id: int
     avatar: str
     login: str
@@ -20,17 +28,21 @@ class ChannelMember(BaseModel):
     permission: enums.ChannelMemberPermission
     is_blocked: bool
     is_perm_blocked: bool
+    badge_name: Optional[str]
+    badge_type: Optional[int]
+    badge_url: Optional[str]
+    permission_creation_date: Optional[datetime]
+    block_expire_date: Optional[datetime]
+    _converters = {"permission": enums.ChannelMemberPermission, "permission_creation_date": from_timestamp,
+                   "block_expire_date": _expire_date}
 
     def __init__(self, data: dict, api):
         super().__init__(data)
         self.__api = api
-        self.badge = Badge(id=None, name=data["badge_name"], type=data["badge_type"], url=data["badge_url"])
-        self.permission = enums.ChannelMemberPermission(data["permission"])
-        self.permission_creation_date = datetime.fromtimestamp(data["permission_creation_date"]) if data["permission_creation_date"] else None
-        try:
-            self.block_expire_date = datetime.fromtimestamp(data["block_expire_date"]) if data["block_expire_date"] else None
-        except Exception:
-            self.block_expire_date = data["block_expire_date"]
+
+    @lazy.of_fields
+    def badge(self) -> Badge:
+        return Badge(id=None, name=self.badge_name, type=self.badge_type, url=self.badge_url)
     
     def block(self, reason: str, expire_date: Union[datetime, int] = None, show_reason: bool = True) -> "ChannelMember":
         response = self.__api._post(f"/channel/{self.channel_id}/block/manage", {"target_profile_id": self.id, "is_blocked": True, "reason": reason, "expire_date": expire_date, "is_reason_showing_enabled": show_reason, "is_perm_blocked": expire_date == None})
@@ -71,6 +83,7 @@ class ChannelMember(BaseModel):
 
 
 class Channel(BaseModel):
+    __slots__ = ("__api",)
     id: int
     title: str
     description: str
@@ -95,9 +108,18 @@ class Channel(BaseModel):
     def __init__(self, data: dict, api):
         super().__init__(data)
         self.__api = api
-        self.permission = enums.ChannelMemberPermission(data["permission"])
-        self.creation_date: datetime = datetime.fromtimestamp(data["creation_date"]) if data.get("creation_date") else None
-        self.last_update_date: datetime = datetime.fromtimestamp(data["last_update_date"]) if data.get("last_update_date") else None
+
+    @lazy
+    def permission(self, data: dict) -> enums.ChannelMemberPermission:
+        return enums.ChannelMemberPermission(data["permission"])
+
+    @lazy
+    def creation_date(self, data: dict) -> Optional[datetime]:
+        return datetime.fromtimestamp(data["creation_date"]) if data.get("creation_date") else None
+
+    @lazy
+    def last_update_date(self, data: dict) -> Optional[datetime]:
+        return datetime.fromtimestamp(data["last_update_date"]) if data.get("last_update_date") else None
 
     def update_settings(self, title: Optional[str] = None, description: Optional[str] = None, is_commenting_enabled: Optional[bool] = None, is_article_suggestion_enabled: Optional[bool] = None) -> dict:
         """Обновляет настройки канала."""
@@ -125,7 +147,7 @@ class Channel(BaseModel):
             article_data["repost_article_id"] = repost_article_id
         response = self.__api._post(f"/article/create/{self.id}", article_data)
         if response["code"] == 0:
-            return Article(response["article"], self)
+            return resolve(Article, response["article"], self.__api)
         else:
             raise errors.ArticleCreateEditError(response["code"])
     
@@ -135,7 +157,7 @@ class Channel(BaseModel):
             article_data = article_data.build(channel_id=self.id, is_suggestion=True)
         response = self.__api._post(f"/article/suggestion/create/{self.id}", article_data)
         if response["code"] == 0:
-            return ArticleSuggestion(response["article"], self)
+            return resolve(ArticleSuggestion, response["article"], self.__api)
         else:
             raise errors.ArticleCreateEditError(response["code"])
     
@@ -155,63 +177,104 @@ class Channel(BaseModel):
             raise errors.ChannelUnsubscribeError(response["code"])
         return self
     
-    def _fetch_suggestions_page(self, page: int) -> tuple[list["ArticleSuggestion"], int]:
+    def _fetch_suggestions_page(self, page: int, build: Optional[Callable[[list], list]] = None) -> tuple[list["ArticleSuggestion"], int]:
         from .articleSuggestion import ArticleSuggestion
         response = self.__api._post(f"/article/suggestion/all/{page}", {"channel_id": self.id})
         if response["code"] == 0:
-            items = [ArticleSuggestion(suggestion, self.__api) for suggestion in response["content"]]
+            items = build(response["content"]) if build else [resolve(ArticleSuggestion, suggestion, self.__api) for suggestion in response["content"]]
             return items, response["total_page_count"]
         raise errors.AnixartError(response["code"], "Ошибка загрузки предложенных записей канала")
 
-    def get_suggestions(self, page: Union[int, range, None] = None) -> Union[list["ArticleSuggestion"], Iterator["ArticleSuggestion"]]:
-        return utils.paginate(lambda pg: self._fetch_suggestions_page(pg), page)
+    def get_suggestions(self, page: Union[int, range, None] = None, prefetch: int = 0, raw: bool = False, factory: Optional[Callable[[dict], Any]] = None, fields: Optional[Iterable[str]] = None) -> Union[list["ArticleSuggestion"], Iterator["ArticleSuggestion"]]:
+        from .articleSuggestion import ArticleSuggestion
+        build = utils.item_builder(raw, factory, fields, lambda data: ArticleSuggestion(data, self.__api))
+        return utils.paginate(lambda pg: self._fetch_suggestions_page(pg, build), page, prefetch, "/article/suggestion/all", {"channel_id": self.id})
     
-    def _fetch_members_page(self, page: int) -> tuple[list[ChannelMember], int]:
+    def _fetch_members_page(self, page: int, build: Optional[Callable[[list], list]] = None) -> tuple[list[ChannelMember], int]:
         response = self.__api._get(f"/channel/{self.id}/subscriber/all/{page}")
         if response["code"] == 0:
-            items = [ChannelMember(member, self.__api) for member in response["content"]]
+            items = build(response["content"]) if build else [ChannelMember(member, self.__api) for member in response["content"]]
             return items, response["total_page_count"]
         raise errors.AnixartError(response["code"], "Ошибка загрузки участников канала")
 
-    def get_members(self, page: Union[int, range, None] = None) -> Union[list[ChannelMember], Iterator[ChannelMember]]:
-        return utils.paginate(lambda pg: self._fetch_members_page(pg), page)
+    def get_members(self, page: Union[int, range, None] = None, prefetch: int = 0, raw: bool = False, factory: Optional[Callable[[dict], Any]] = None, fields: Optional[Iterable[str]] = None) -> Union[list[ChannelMember], Iterator[ChannelMember]]:
+        build = utils.item_builder(raw, factory, fields, lambda data: ChannelMember(data, self.__api))
+        return utils.paginate(lambda pg: self._fetch_members_page(pg, build), page, prefetch, f"/channel/{self.id}/subscriber/all", None)
 
-    def _fetch_administrators_page(self, permission: Union[enums.ChannelMemberPermission, int], page: int) -> tuple[list[ChannelMember], int]:
+    def _fetch_administrators_page(self, permission: Union[enums.ChannelMemberPermission, int], page: int, build: Optional[Callable[[list], list]] = None) -> tuple[list[ChannelMember], int]:
         response = self.__api._post(f"/channel/{self.id}/permission/all/{page}", {"permission": permission})
         if response["code"] == 0:
-            items = [ChannelMember(member, self.__api) for member in response["content"]]
+            items = build(response["content"]) if build else [ChannelMember(member, self.__api) for member in response["content"]]
             return items, response["total_page_count"]
         raise errors.AnixartError(response["code"], "Ошибка загрузки администраторов")
 
     def get_administrators(self, 
                         permission: Union[enums.ChannelMemberPermission, int] = enums.ChannelMemberPermission.ADMINISTRATOR,
-                        page: Union[int, range, None] = None) -> Union[list[ChannelMember], Iterator[ChannelMember]]:
-        return utils.paginate(lambda pg: self._fetch_administrators_page(permission, pg), page)
+                        page: Union[int, range, None] = None, prefetch: int = 0, raw: bool = False, factory: Optional[Callable[[dict], Any]] = None, fields: Optional[Iterable[str]] = None) -> Union[list[ChannelMember], Iterator[ChannelMember]]:
+        build = utils.item_builder(raw, factory, fields, lambda data: ChannelMember(data, self.__api))
+        return utils.paginate(lambda pg: self._fetch_administrators_page(permission, pg, build), page, prefetch, f"/channel/{self.id}/permission/all", {"permission": permission})
 
-    def _fetch_blocked_members_page(self, page: int) -> tuple[list[ChannelMember], int]:
+    def _fetch_blocked_members_page(self, page: int, build: Optional[Callable[[list], list]] = None) -> tuple[list[ChannelMember], int]:
         response = self.__api._get(f"/channel/{self.id}/block/all/{page}")
         if response["code"] == 0:
-            items = [ChannelMember(member, self.__api) for member in response["content"]]
+            items = build(response["content"]) if build else [ChannelMember(member, self.__api) for member in response["content"]]
             return items, response["total_page_count"]
         raise errors.AnixartError(response["code"], "Ошибка загрузки заблокированных пользователей")
 
-    def get_blocked_members(self, page: Union[int, range, None] = None) -> Union[list[ChannelMember], Iterator[ChannelMember]]:
-        return utils.paginate(lambda pg: self._fetch_blocked_members_page(pg), page)
+    def get_blocked_members(self, page: Union[int, range, None] = None, prefetch: int = 0, raw: bool = False, factory: Optional[Callable[[dict], Any]] = None, fields: Optional[Iterable[str]] = None) -> Union[list[ChannelMember], Iterator[ChannelMember]]:
+        build = utils.item_builder(raw, factory, fields, lambda data: ChannelMember(data, self.__api))
+        return utils.paginate(lambda pg: self._fetch_blocked_members_page(pg, build), page, prefetch, f"/channel/{self.id}/block/all", None)
     
-    def _fetch_articles_page(self, date_filter: Union[enums.DateFilter, int], page: int) -> tuple[list["Article"], int]:
+    def _fetch_articles_page(self, date_filter: Union[enums.DateFilter, int], page: int, build: Optional[Callable[[list], list]] = None) -> tuple[list["Article"], int]:
         from .article import Article
         response = self.__api._post(f"/article/all/{page}", {"channel_id": self.id, "date": date_filter})
         if response["code"] == 0:
-            items = [Article(article, self.__api) for article in response["content"]]
+            items = build(response["content"]) if build else [resolve(Article, article, self.__api) for article in response["content"]]
             return items, response["total_page_count"]
         raise errors.AnixartError(response["code"], "Ошибка загрузки статей канала")
 
-    def get_articles(self, date_filter: Union[enums.DateFilter, int] = enums.DateFilter.NONE, page: Union[int, range, None] = None) -> Union[list["Article"], Iterator["Article"]]:
-        return utils.paginate(lambda pg: self._fetch_articles_page(date_filter, pg), page)
+    def get_articles(self, date_filter: Union[enums.DateFilter, int] = enums.DateFilter.NONE, page: Union[int, range, None] = None, prefetch: int = 0, raw: bool = False, factory: Optional[Callable[[dict], Any]] = None, fields: Optional[Iterable[str]] = None) -> Union[list["Article"], Iterator["Article"]]:
+        from .article import Article
+        build = utils.item_builder(raw, factory, fields, lambda data: Article(data, self.__api))
+        return utils.paginate(lambda pg: self._fetch_articles_page(date_filter, pg, build), page, prefetch, "/article/all", {"channel_id": self.id, "date": date_filter})
+
+    def sync_articles(self, since: Union[checkpoints.ChannelCheckpoint, dict, None] = None, store=None, max_pages: Optional[int] = None) -> tuple[list["Article"], checkpoints.ChannelCheckpoint]:
+        """
+        Инкрементальная синхронизация статей канала.
+
+        Обходит страницы от новых статей к старым и останавливается на первой
+        странице, где нет новых или изменённых (по last_update_date) статей.
+        Без контрольной точки обходит все страницы.
+
+        Args:
+            since: Контрольная точка прошлой синхронизации (ChannelCheckpoint или её to_dict()).
+                Если не задана, берётся из store.
+            store: Хранилище контрольных точек (объект с load/save) или путь к JSON-файлу;
+                обновлённая контрольная точка сохраняется в него.
+            max_pages: Ограничение числа загружаемых страниц.
+
+        Returns:
+            (новые и изменённые статьи от новых к старым, обновлённая контрольная точка).
+            Если загрузка страницы завершилась ошибкой, контрольная точка не меняется.
+        """
+        store = checkpoints.get_store(store)
+        checkpoint = checkpoints.load_channel_checkpoint(self.id, since, store)
+        fresh, seen = [], {}
+        page, total_pages = 0, 1
+        while page < total_pages and (max_pages is None or page < max_pages):
+            items, total_pages = self._fetch_articles_page(enums.DateFilter.NONE, page)
+            changed = checkpoint.diff(items, seen)
+            fresh.extend(changed)
+            page += 1
+            if not items or (len(checkpoint) and not changed):
+                break
+        checkpoint.update(seen)
+        if store is not None:
+            store.save(checkpoint.key(self.id), checkpoint.to_dict())
+        return fresh, checkpoint
     
     def set_avatar(self, file: str) -> "Channel":
         response = anix_images.upload_avatar(self.id, file, self.is_blog)
-        print(response)
         if response["code"] == 0:
             self.avatar = response["url"] if not self.is_blog else response["avatar"]
         else:
@@ -1,6 +1,6 @@
 from typing import Union, Optional, TYPE_CHECKING
 from .. import enums, utils
-from .base import BaseModel
+from .base import BaseModel, lazy, resolve
 from datetime import datetime
 
 if TYPE_CHECKING:
@@ -9,6 +9,7 @@ if TYPE_CHECKING:
 
 
 class Comment(BaseModel):
+    __slots__ = ("__api",)
     id: int
     message: str
     type: int  #  maybe 0 - comment, 1 - reply
@@ -22,14 +23,26 @@ class Comment(BaseModel):
     is_deleted: bool
     is_reply: bool
     can_like: bool
+    text: str
 
     def __init__(self, data: dict, api):
         super().__init__(data)
         self.__api = api
+        if "message" in data:
+            self.text = data["message"]
+
+    @lazy
+    def author(self, data: dict) -> "Profile":
         from .profile import Profile
-        self.author = self.profile = Profile(data["author"], api)
-        self.timestamp = datetime.fromtimestamp(data["timestamp"])
-        self.text = self.message
+        return resolve(Profile, data["author"], self.__api)
+
+    @lazy
+    def profile(self, data: dict) -> "Profile":
+        return self.author
+
+    @lazy
+    def timestamp(self, data: dict) -> datetime:
+        return datetime.fromtimestamp(data["timestamp"])
 
     def edit(self, message: str) -> "Comment":
         return
@@ -42,9 +55,14 @@ class Comment(BaseModel):
 
 
 class ArticleComment(Comment):
+    __slots__ = ("__api",)
     article: "Article"
     
     def __init__(self, data: dict, api):
         super().__init__(data, api)
+        self.__api = api
+
+    @lazy
+    def article(self, data: dict) -> "Article":
         from .article import Article
-        self.article = Article(data["article"], api)
\ No newline at end of file
+        return resolve(Article, data["article"], self.__api)
\ No newline at end of file
@@ -1,4 +1,4 @@
-from .base import BaseModel
+from .base import BaseModel, lazy
 from typing import List
 
 
@@ -18,8 +18,12 @@ class Payload(BaseModel):
     blocks: List[PayloadBlock]
     version: str
     block_count: int
+    data: dict
 
     def __init__(self, data: dict):
         super().__init__(data)
         self.data = data
-        self.blocks = [PayloadBlock(block) for block in data.get("blocks", [])]
\ No newline at end of file
+
+    @lazy
+    def blocks(self, data: dict) -> List[PayloadBlock]:
+        return [PayloadBlock(block) for block in data.get("blocks", [])]
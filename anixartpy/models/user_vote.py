@@ -1,5 +1,6 @@
+from typing import Optional
 from .. import enums
-from .base import BaseModel
+from .base import BaseModel, lazy
 from .profile import Badge
 
 
@@ -11,8 +12,15 @@ class UserVote(BaseModel):
     is_online: bool
     is_verified: bool
     is_sponsor: bool
+    badge_id: Optional[int]
+    badge_name: Optional[str]
+    badge_type: Optional[int]
+    badge_url: Optional[str]
+    _converters = {"vote": enums.Vote}
 
     def __init__(self, data: dict):
         super().__init__(data)
-        self.vote = enums.Vote(data["vote"])
-        self.badge = Badge(id=data["badge_id"], name=data["badge_name"], type=data["badge_type"], url=data["badge_url"])
\ No newline at end of file
+
+    @lazy.of_fields
+    def badge(self) -> Badge:
+        return Badge(id=self.badge_id, name=self.badge_name, type=self.badge_type, url=self.badge_url)
\ No newline at end of file
@@ -0,0 +1,120 @@
+import asyncio
+import re
+import time
+from threading import Lock
+from typing import Optional
+
+ENDPOINT_GROUPS = [
+    (r"GET /channel/\d+/editor/available", "editor"),
+    (r"(?:GET|POST) /(?:.*/)?(?:create|edit|delete|publish|subscribe|unsubscribe|manage|upload)(?:[/?]|$)", "write"),
+    (r"(?:GET|POST) /(?:article/vote|profile/preference)/", "write"),
+]
+_endpoint_groups = [(re.compile(pattern), group) for pattern, group in ENDPOINT_GROUPS]
+
+
+def endpoint_group(method: str, endpoint: str, default: str = "read") -> str:
+    """
+    Группа эндпоинта ("read", "write" или "editor") по началу строки "МЕТОД /путь".
+    Запросы группы "write" изменяют данные, и повторять их небезопасно.
+    """
+    target = f"{method} {endpoint}"
+    for pattern, group in _endpoint_groups:
+        if pattern.match(target):
+            return group
+    return default
+
+
+class TokenBucket:
+    """
+    Ведро токенов: rate запросов в секунду в среднем и до burst запросов подряд.
+
+    Токен резервируется под блокировкой без ожидания, а ждёт уже вызывающий —
+    time.sleep в потоке или asyncio.sleep в корутине, поэтому одно ведро можно
+    делить между потоками и event loop. Очередь справедливая: каждый следующий
+    запрос получает следующий свободный слот.
+    """
+
+    def __init__(self, rate: Optional[float], burst: Optional[float] = None):
+        """
+        Args:
+            rate: Запросов в секунду; None или 0 — без ограничения.
+            burst: Ёмкость ведра (по умолчанию max(1, rate)).
+        """
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, rate or 0)
+        self.waits = 0
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = Lock()
+
+    def reserve(self, tokens: float = 1) -> float:
+        """Забирает tokens токенов и возвращает, сколько секунд нужно подождать перед запросом."""
+        if not self.rate:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            self.waits += 1
+            return -self._tokens / self.rate
+
+    def acquire(self, tokens: float = 1):
+        delay = self.reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, tokens: float = 1):
+        delay = self.reserve(tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class RateLimiter:
+    """
+    Набор TokenBucket по группам эндпоинтов, общий для всех потоков и корутин клиента.
+
+    Группа эндпоинта определяется функцией endpoint_group (правила ENDPOINT_GROUPS),
+    эндпоинты вне правил попадают в default_group.
+    Запросы к редактору (загрузка медиа и вложений) всегда идут в группу "editor".
+    """
+
+    DEFAULT_BUDGETS = {
+        "read": (10, 20),
+        "write": (2, 5),
+        "editor": (4, 4),
+    }
+
+    def __init__(self, budgets: Optional[dict] = None, default_group: str = "read"):
+        """
+        Args:
+            budgets: Переопределённые бюджеты: {"группа": (запросов_в_секунду, burst)}.
+                Значение None снимает ограничение с группы.
+            default_group: Группа для эндпоинтов, не попавших ни под одно правило ENDPOINT_GROUPS.
+        """
+        budgets = {**self.DEFAULT_BUDGETS, **(budgets or {})}
+        self.buckets = {group: TokenBucket(*(budget or (None,))) for group, budget in budgets.items()}
+        self.default_group = default_group
+
+    @property
+    def stats(self) -> dict:
+        """Сколько раз запросам каждой группы пришлось ждать."""
+        return {group: bucket.waits for group, bucket in self.buckets.items()}
+
+    def group_for(self, method: str, endpoint: str) -> str:
+        return endpoint_group(method, endpoint, self.default_group)
+
+    def bucket(self, group: str) -> Optional[TokenBucket]:
+        return self.buckets.get(group)
+
+    def acquire(self, group: str, tokens: float = 1):
+        bucket = self.buckets.get(group)
+        if bucket is not None:
+            bucket.acquire(tokens)
+
+    async def acquire_async(self, group: str, tokens: float = 1):
+        bucket = self.buckets.get(group)
+        if bucket is not None:
+            await bucket.acquire_async(tokens)
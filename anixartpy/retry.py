@@ -0,0 +1,324 @@
+import random
+import time
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from threading import Lock
+from typing import Iterator, Optional, Union
+
+from . import errors
+from .metrics import RequestEvent
+from .ratelimit import endpoint_group
+
+
+class RetryPolicy:
+    """
+    Политика повторов запросов с экспоненциальной задержкой и полным джиттером.
+
+    Читающие запросы повторяются при таймаутах, ошибках соединения, ответах из
+    statuses и ответах не в JSON (например, HTML-страница 502 от прокси).
+    Изменяющие запросы (группа "write", см. ratelimit.endpoint_group) повторяются
+    только если заведомо не дошли до сервера или получили 429. Заголовок
+    Retry-After имеет приоритет над расчётной задержкой.
+    """
+
+    def __init__(self, retries: int = 3, backoff: float = 0.5, max_backoff: float = 30.0,
+                 statuses: tuple = (429, 500, 502, 503, 504), max_retry_after: float = 120.0):
+        """
+        Args:
+            retries: Сколько раз повторять запрос после первой попытки.
+            backoff: Базовая задержка: перед попыткой n ждём случайное время до backoff * 2**n.
+            max_backoff: Верхняя граница расчётной задержки.
+            statuses: HTTP-статусы, после которых запрос повторяется.
+            max_retry_after: Если сервер просит ждать дольше, запрос не повторяется.
+        """
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.statuses = frozenset(statuses)
+        self.max_retry_after = max_retry_after
+
+    def should_retry(self, attempt: int, is_write: bool, failure: str, status: Optional[int] = None) -> bool:
+        """
+        failure — вид сбоя: "not_sent" (соединение не установлено), "connection",
+        "timeout", "status" (HTTP-статус status) или "invalid" (ответ не JSON).
+        """
+        if attempt >= self.retries:
+            return False
+        if failure == "not_sent":
+            return True
+        if failure == "status":
+            return status in self.statuses and (not is_write or status == 429)
+        return not is_write
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> Optional[float]:
+        """Задержка перед повтором номер attempt (с нуля) или None, если Retry-After слишком велик."""
+        if retry_after is not None:
+            return retry_after if retry_after <= self.max_retry_after else None
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Значение заголовка Retry-After (секунды или HTTP-дата) в секундах ожидания."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RequestAttempts:
+    """
+    Ход одного запроса с повторами — общая часть AnixartAPI._send и
+    AsyncAnixartAPI._send. Клиент только отправляет попытки и ждёт задержку, а
+    классификация сбоев, счётчики RequestStats, события hooks и решение о
+    повторе по RetryPolicy принимаются здесь:
+
+        attempts = RequestAttempts(client, method, endpoint)
+        while True:
+            event = attempts.start()
+            try:
+                status, body, retry_after = send(event)
+            except errors.CircuitOpenError:
+                attempts.circuit_open()
+                raise
+            except TRANSPORT_ERRORS as e:
+                attempts.failed(e, timeout=..., not_sent=...)
+            else:
+                if attempts.completed(status, body, retry_after, raw):
+                    return attempts.result
+            delay = attempts.retry_delay()
+            if delay is None:
+                raise attempts.error from attempts.cause
+            sleep(delay)
+    """
+
+    def __init__(self, client, method: str, endpoint: str):
+        self.policy: Optional[RetryPolicy] = client.retry
+        self.stats: RequestStats = client.request_stats
+        self.hooks = client.hooks
+        self.loads = client.loads
+        self.method = method
+        self.endpoint = endpoint
+        self.is_write = endpoint_group(method, endpoint) == "write"
+        self.attempt = 0
+        self.event: Optional[RequestEvent] = None
+        self.result = None
+        self.error: Optional[errors.RequestError] = None
+        self.cause: Optional[BaseException] = None
+        self._failure: Optional[str] = None
+        self._status: Optional[int] = None
+        self._retry_after: Optional[float] = None
+        self.stats.add("requests")
+
+    def start(self) -> Optional[RequestEvent]:
+        """Начинает попытку; возвращает её событие для hooks (None, если подписчиков нет)."""
+        self.event = RequestEvent("api", self.method, self.endpoint, self.attempt) if self.hooks else None
+        return self.event
+
+    def _emit(self, result=None, error: Optional[str] = None, retry: bool = False):
+        if self.event is not None:
+            self.event.complete(result, error, retry)
+            self.hooks.emit("request", self.event)
+
+    def circuit_open(self):
+        """Попытка отклонена предохранителем; такой запрос не повторяется."""
+        self.stats.add("circuit_open")
+        self.stats.add("failures")
+        self._emit(error="circuit_open")
+
+    def failed(self, exc: BaseException, timeout: bool, not_sent: bool):
+        """
+        Попытка завершилась ошибкой транспорта exc. Обрыв ответа считается ошибкой
+        соединения; not_sent — запрос заведомо не дошёл до сервера.
+        """
+        self.cause = exc
+        self._status = self._retry_after = None
+        if timeout:
+            self.stats.add("timeouts")
+            self.error, self._failure = errors.RequestError(errors.RequestError.TIMEOUT), "timeout"
+        else:
+            self.stats.add("connection_errors")
+            self.error, self._failure = errors.RequestError(errors.RequestError.CONNECTION), "connection"
+        if not_sent:
+            self._failure = "not_sent"
+
+    def completed(self, status: int, body: bytes, retry_after: Optional[str], raw: bool = False) -> bool:
+        """
+        Учитывает ответ сервера. True — ответ принят, результат (JSON или body при
+        raw=True) в self.result; False — ответ считается сбоем (5xx, 429, не JSON).
+        """
+        result = cause = None
+        if raw:
+            result = body
+        else:
+            try:
+                result = self.loads(body)
+            except ValueError as e:
+                cause = e
+        if status < 500 and status != 429 and cause is None:
+            self.result = result
+            self._emit(result=result)
+            return True
+        if status >= 500:
+            self.stats.add("server_errors")
+        if cause is not None and status < 400:
+            self.stats.add("invalid_responses")
+            self.error, self._failure, self.cause = errors.RequestError(errors.RequestError.INVALID_RESPONSE), "invalid", cause
+        else:
+            self.error, self._failure, self.cause = errors.RequestError(status), "status", None
+        self._status = status
+        self._retry_after = parse_retry_after(retry_after)
+        return False
+
+    def retry_delay(self) -> Optional[float]:
+        """Задержка перед следующей попыткой или None — запрос не удался (self.error)."""
+        delay = None
+        if self.policy is not None and self.policy.should_retry(self.attempt, self.is_write, self._failure, self._status):
+            delay = self.policy.delay(self.attempt, self._retry_after)
+        if delay is None:
+            self.stats.add("failures")
+            self._emit(error=self._failure)
+            return None
+        self.stats.add("retries")
+        self._emit(error=self._failure, retry=True)
+        self.attempt += 1
+        return delay
+
+
+class CircuitBreaker:
+    """
+    Предохранитель для одного хоста. После failure_threshold сбоев подряд
+    (ошибка соединения, таймаут или 5xx) запросы к хосту reset_timeout секунд
+    сразу завершаются CircuitOpenError. Затем пропускается один пробный запрос:
+    успех замыкает цепь, сбой снова размыкает её.
+    """
+
+    def __init__(self, host: str, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial = False
+        self._lock = Lock()
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if self._trial or time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half-open"
+        return "open"
+
+    def before_request(self):
+        """Пропускает запрос или выбрасывает CircuitOpenError, пока цепь разомкнута."""
+        with self._lock:
+            if self.opened_at is None:
+                return
+            if not self._trial and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self._trial = True
+                return
+        raise errors.CircuitOpenError(errors.RequestError.CIRCUIT_OPEN, f"Запросы к {self.host} приостановлены после серии ошибок.")
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self._trial or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+                self._trial = False
+
+    def release(self):
+        """Снимает пробный запрос, прерванный без ответа хоста (отмена, KeyboardInterrupt)."""
+        with self._lock:
+            self._trial = False
+
+    def record_status(self, status: int):
+        """Учитывает HTTP-статус ответа хоста: 5xx — сбой, остальное — успех."""
+        if status >= 500:
+            self.record_failure()
+        else:
+            self.record_success()
+
+
+class CircuitBreakers:
+    """Реестр CircuitBreaker по хостам с общими параметрами."""
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._breakers = {}
+        self._lock = Lock()
+
+    def __getitem__(self, host: str) -> CircuitBreaker:
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.setdefault(
+                    host, CircuitBreaker(host, self.failure_threshold, self.reset_timeout)
+                )
+        return breaker
+
+    @property
+    def states(self) -> dict:
+        return {host: breaker.state for host, breaker in self._breakers.items()}
+
+
+@contextmanager
+def breaker_guard(breakers: Optional[CircuitBreakers], host: str, transport_errors: Union[type, tuple]) -> Iterator[Optional[CircuitBreaker]]:
+    """
+    Пропускает одну попытку запроса к host через его предохранитель (если breakers
+    заданы): ошибки transport_errors считаются сбоем хоста, прерывание без ответа
+    (отмена, KeyboardInterrupt) снимает пробный запрос. Статус полученного ответа
+    клиент передаёт в breaker.record_status.
+    """
+    if breakers is None:
+        yield None
+        return
+    breaker = breakers[host]
+    breaker.before_request()
+    try:
+        yield breaker
+    except transport_errors:
+        breaker.record_failure()
+        raise
+    except BaseException:
+        breaker.release()
+        raise
+
+
+class RequestStats:
+    """Счётчики запросов клиента: попытки, повторы, таймауты и отказы."""
+
+    FIELDS = ("requests", "attempts", "retries", "timeouts", "connection_errors",
+              "server_errors", "invalid_responses", "circuit_open", "failures")
+
+    def __init__(self):
+        self._lock = Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            for field in self.FIELDS:
+                setattr(self, field, 0)
+
+    def add(self, field: str, value: int = 1):
+        with self._lock:
+            setattr(self, field, getattr(self, field) + value)
+
+    def as_dict(self) -> dict:
+        with self._lock:
+            return {field: getattr(self, field) for field in self.FIELDS}
+
+    def __repr__(self) -> str:
+        return f"<RequestStats({self.as_dict()})>"
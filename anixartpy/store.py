@@ -0,0 +1,358 @@
+import json
+import sqlite3
+from datetime import datetime
+from enum import Enum
+from threading import Lock
+from typing import Iterable, Optional
+
+from .models.base import Partial
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS channels (
+    id INTEGER PRIMARY KEY, title TEXT, description TEXT, avatar TEXT, cover TEXT, is_blog INTEGER,
+    blog_profile_id INTEGER, article_count INTEGER, subscriber_count INTEGER, is_verified INTEGER,
+    is_deleted INTEGER, creation_date INTEGER, last_update_date INTEGER
+);
+CREATE TABLE IF NOT EXISTS profiles (
+    id INTEGER PRIMARY KEY, login TEXT, avatar TEXT, status TEXT, rating_score INTEGER, privilege_level INTEGER,
+    is_verified INTEGER, is_sponsor INTEGER, is_banned INTEGER, register_date INTEGER, last_activity_time INTEGER
+);
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY, channel_id INTEGER, author_id INTEGER, repost_article_id INTEGER, vote INTEGER,
+    vote_count INTEGER, comment_count INTEGER, repost_count INTEGER, is_deleted INTEGER, is_under_moderation INTEGER,
+    under_moderation_reason TEXT, payload_time INTEGER, payload_version TEXT, creation_date INTEGER, last_update_date INTEGER
+);
+CREATE INDEX IF NOT EXISTS articles_channel_votes ON articles (channel_id, vote_count DESC);
+CREATE INDEX IF NOT EXISTS articles_channel_created ON articles (channel_id, creation_date DESC);
+CREATE TABLE IF NOT EXISTS payload_blocks (
+    article_id INTEGER NOT NULL, position INTEGER NOT NULL, block_id TEXT, type TEXT, name TEXT, data TEXT,
+    PRIMARY KEY (article_id, position)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS comments (
+    id INTEGER PRIMARY KEY, article_id INTEGER, profile_id INTEGER, parent_comment_id INTEGER, message TEXT,
+    type INTEGER, vote INTEGER, vote_count INTEGER, likes_count INTEGER, reply_count INTEGER, is_spoiler INTEGER,
+    is_edited INTEGER, is_deleted INTEGER, timestamp INTEGER
+);
+CREATE INDEX IF NOT EXISTS comments_profile ON comments (profile_id, timestamp DESC);
+CREATE INDEX IF NOT EXISTS comments_article ON comments (article_id, timestamp DESC);
+CREATE TABLE IF NOT EXISTS votes (
+    article_id INTEGER NOT NULL, profile_id INTEGER NOT NULL, vote INTEGER,
+    PRIMARY KEY (article_id, profile_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS votes_profile ON votes (profile_id);
+CREATE TABLE IF NOT EXISTS channel_members (
+    channel_id INTEGER NOT NULL, profile_id INTEGER NOT NULL, permission INTEGER, is_blocked INTEGER,
+    is_perm_blocked INTEGER, block_reason TEXT, block_expire_date INTEGER, permission_creation_date INTEGER,
+    PRIMARY KEY (channel_id, profile_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS channel_members_profile ON channel_members (profile_id);
+"""
+
+CHANNEL_COLUMNS = ("id", "title", "description", "avatar", "cover", "is_blog", "blog_profile_id", "article_count",
+                   "subscriber_count", "is_verified", "is_deleted", "creation_date", "last_update_date")
+PROFILE_COLUMNS = ("id", "login", "avatar", "status", "rating_score", "privilege_level", "is_verified", "is_sponsor",
+                   "is_banned", "register_date", "last_activity_time")
+ARTICLE_COLUMNS = ("id", "channel_id", "author_id", "repost_article_id", "vote", "vote_count", "comment_count",
+                   "repost_count", "is_deleted", "is_under_moderation", "under_moderation_reason", "payload_time",
+                   "payload_version", "creation_date", "last_update_date")
+COMMENT_COLUMNS = ("id", "article_id", "profile_id", "parent_comment_id", "message", "type", "vote", "vote_count",
+                   "likes_count", "reply_count", "is_spoiler", "is_edited", "is_deleted", "timestamp")
+VOTE_COLUMNS = ("article_id", "profile_id", "vote")
+MEMBER_COLUMNS = ("channel_id", "profile_id", "permission", "is_blocked", "is_perm_blocked", "block_reason",
+                  "block_expire_date", "permission_creation_date")
+
+
+def _upsert_sql(table: str, columns: tuple, key: tuple, keep_known: bool = False) -> str:
+    """
+    INSERT ... ON CONFLICT DO UPDATE для таблицы. keep_known — не затирать
+    известные значения NULL-ами (профили и каналы приходят и полными, и урезанными,
+    остальные сущности — урезанными при проекции fields, см. models.base.Partial).
+    """
+    updates = ", ".join(
+        f"{column} = COALESCE(excluded.{column}, {column})" if keep_known else f"{column} = excluded.{column}"
+        for column in columns if column not in key
+    )
+    placeholders = ", ".join("?" for _ in columns)
+    return (f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders}) "
+            f"ON CONFLICT ({', '.join(key)}) DO UPDATE SET {updates}")
+
+
+def _scalar(value):
+    if isinstance(value, datetime):
+        return int(value.timestamp())
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def raw_data(item) -> dict:
+    """
+    Исходный словарь ответа для модели или словаря. У моделей без полей lazy
+    (UserVote, ChannelMember) исходный словарь не хранится — он собирается из
+    атрибутов, перечисления и даты приводятся к числам.
+    """
+    if isinstance(item, dict):
+        return item
+    data = getattr(item, "_data", None)
+    if data is not None:
+        return data
+    lazy_fields = item._lazy_fields
+    return {name: _scalar(value) for name, value in item._fields().items() if name not in lazy_fields}
+
+
+class SQLiteStore:
+    """
+    Локальная база SQLite (режим WAL) для результатов обхода: каналы, профили,
+    статьи с блоками содержимого, комментарии, голоса и участники каналов в
+    нормализованных таблицах с индексами под типичные запросы.
+
+    Методы upsert_* принимают модели или исходные словари ответов и
+    записывают их пачками по batch_size строк в одной транзакции; вложенные
+    объекты (канал статьи, автор комментария, статья-репост) сохраняются
+    вместе с ними. Paginator.into(store) пишет страницы прямо в базу:
+
+        store = SQLiteStore("anixart.db")
+        channel.get_articles().into(store)
+        article.get_votes().into(store, article_id=article.id)
+        store.top_articles(channel.id, limit=10)
+    """
+
+    def __init__(self, path: str, batch_size: int = 500):
+        self.path = path
+        self.batch_size = batch_size
+        self._lock = Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.row_factory = sqlite3.Row
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(SCHEMA)
+        self._channel_sql = _upsert_sql("channels", CHANNEL_COLUMNS, ("id",), keep_known=True)
+        self._profile_sql = _upsert_sql("profiles", PROFILE_COLUMNS, ("id",), keep_known=True)
+        self._article_sql = _upsert_sql("articles", ARTICLE_COLUMNS, ("id",))
+        self._partial_article_sql = _upsert_sql("articles", ARTICLE_COLUMNS, ("id",), keep_known=True)
+        self._comment_sql = _upsert_sql("comments", COMMENT_COLUMNS, ("id",))
+        self._partial_comment_sql = _upsert_sql("comments", COMMENT_COLUMNS, ("id",), keep_known=True)
+        self._vote_sql = _upsert_sql("votes", VOTE_COLUMNS, ("article_id", "profile_id"))
+        self._member_sql = _upsert_sql("channel_members", MEMBER_COLUMNS, ("channel_id", "profile_id"))
+        self._partial_member_sql = _upsert_sql("channel_members", MEMBER_COLUMNS, ("channel_id", "profile_id"), keep_known=True)
+
+    def __enter__(self) -> "SQLiteStore":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    # -- запись ---------------------------------------------------------------
+
+    def _write(self, rows: dict):
+        """Выполняет {sql: [строки]} одной транзакцией."""
+        with self._lock:
+            self._db.execute("BEGIN")
+            try:
+                for sql, params in rows.items():
+                    if callable(sql):
+                        sql(self._db, params)
+                    elif params:
+                        self._db.executemany(sql, params)
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            self._db.execute("COMMIT")
+
+    def _batches(self, items: Iterable) -> Iterable[list]:
+        batch = []
+        for item in items:
+            batch.append(raw_data(item))
+            if len(batch) >= self.batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def _collect_article(self, data: dict, rows: dict):
+        channel = data.get("channel")
+        if channel:
+            rows[self._channel_sql].append(tuple(_scalar(channel.get(column)) for column in CHANNEL_COLUMNS))
+        repost = data.get("repost_article")
+        if repost:
+            self._collect_article(repost, rows)
+        payload = data.get("payload") or {}
+        partial = isinstance(data, Partial)
+        rows[self._partial_article_sql if partial else self._article_sql].append((
+            data["id"], channel["id"] if channel else data.get("channel_id"), (data.get("author") or {}).get("id"),
+            repost["id"] if repost else None, data.get("vote"), data.get("vote_count"), data.get("comment_count"),
+            data.get("repost_count"), data.get("is_deleted"), data.get("is_under_moderation"),
+            data.get("under_moderation_reason"), payload.get("time"), payload.get("version"),
+            data.get("creation_date"), data.get("last_update_date"),
+        ))
+        # Блоки заменяются, только если они есть в данных: проекция без payload их не трогает
+        if "blocks" in payload or ("payload" in data and not partial):
+            rows[_replace_blocks].append((data["id"], payload.get("blocks") or ()))
+
+    @staticmethod
+    def _profile_row(data: dict) -> tuple:
+        return tuple(_scalar(data.get(column)) for column in PROFILE_COLUMNS)
+
+    def _rows(self) -> dict:
+        return {self._channel_sql: [], self._profile_sql: [], self._article_sql: [], self._partial_article_sql: [],
+                _replace_blocks: [], self._comment_sql: [], self._partial_comment_sql: [], self._vote_sql: [],
+                self._member_sql: [], self._partial_member_sql: []}
+
+    def upsert_channels(self, channels: Iterable) -> int:
+        count = 0
+        for batch in self._batches(channels):
+            rows = self._rows()
+            rows[self._channel_sql] = [tuple(_scalar(data.get(column)) for column in CHANNEL_COLUMNS) for data in batch]
+            self._write(rows)
+            count += len(batch)
+        return count
+
+    def upsert_profiles(self, profiles: Iterable) -> int:
+        count = 0
+        for batch in self._batches(profiles):
+            rows = self._rows()
+            rows[self._profile_sql] = [self._profile_row(data) for data in batch]
+            self._write(rows)
+            count += len(batch)
+        return count
+
+    def upsert_articles(self, articles: Iterable) -> int:
+        """Статьи вместе с каналами, статьями-репостами и блоками содержимого (блоки статьи заменяются целиком)."""
+        count = 0
+        for batch in self._batches(articles):
+            rows = self._rows()
+            for data in batch:
+                self._collect_article(data, rows)
+            self._write(rows)
+            count += len(batch)
+        return count
+
+    def upsert_comments(self, comments: Iterable) -> int:
+        """Комментарии вместе с профилями авторов и статьями (у ArticleComment)."""
+        count = 0
+        for batch in self._batches(comments):
+            rows = self._rows()
+            for data in batch:
+                author = data.get("author") or {}
+                if author:
+                    rows[self._profile_sql].append(self._profile_row(author))
+                article = data.get("article")
+                if article:
+                    self._collect_article(article, rows)
+                sql = self._partial_comment_sql if isinstance(data, Partial) else self._comment_sql
+                rows[sql].append((
+                    data["id"], article["id"] if article else data.get("article_id"), author.get("id"),
+                    data.get("parent_comment_id"), data.get("message"), data.get("type"), _scalar(data.get("vote")),
+                    data.get("vote_count"), data.get("likes_count"), data.get("reply_count"), data.get("is_spoiler"),
+                    data.get("is_edited"), data.get("is_deleted"), _scalar(data.get("timestamp")),
+                ))
+            self._write(rows)
+            count += len(batch)
+        return count
+
+    def upsert_votes(self, article_id: int, votes: Iterable) -> int:
+        """Голоса за статью article_id (UserVote) вместе с краткими профилями проголосовавших."""
+        count = 0
+        for batch in self._batches(votes):
+            rows = self._rows()
+            for data in batch:
+                rows[self._profile_sql].append(self._profile_row(data))
+                rows[self._vote_sql].append((article_id, data["id"], _scalar(data.get("vote"))))
+            self._write(rows)
+            count += len(batch)
+        return count
+
+    def upsert_members(self, members: Iterable, channel_id: Optional[int] = None) -> int:
+        """Участники канала (ChannelMember) вместе с краткими профилями; channel_id — если его нет в данных."""
+        count = 0
+        for batch in self._batches(members):
+            rows = self._rows()
+            for data in batch:
+                rows[self._profile_sql].append(self._profile_row(data))
+                sql = self._partial_member_sql if isinstance(data, Partial) else self._member_sql
+                rows[sql].append((
+                    data.get("channel_id", channel_id), data["id"], _scalar(data.get("permission")), data.get("is_blocked"),
+                    data.get("is_perm_blocked"), data.get("block_reason"), _scalar(data.get("block_expire_date")),
+                    _scalar(data.get("permission_creation_date")),
+                ))
+            self._write(rows)
+            count += len(batch)
+        return count
+
+    def write(self, items: list, kind: Optional[str] = None, **context) -> int:
+        """
+        Записывает страницу элементов (приёмник для Paginator.into). kind —
+        "channels", "profiles", "articles", "comments", "votes" или "members";
+        по умолчанию определяется по типу модели. Для голосов нужен
+        article_id=..., для участников без channel_id в данных — channel_id=...
+        """
+        if not items:
+            return 0
+        kind = kind or _kind_of(items[0])
+        if kind == "votes":
+            return self.upsert_votes(context["article_id"], items)
+        if kind == "members":
+            return self.upsert_members(items, context.get("channel_id"))
+        if kind not in WRITERS:
+            raise ValueError(f"Неизвестный вид элементов: {kind!r}")
+        return getattr(self, WRITERS[kind])(items)
+
+    # -- запросы --------------------------------------------------------------
+
+    def query(self, sql: str, params: tuple = ()) -> list[dict]:
+        with self._lock:
+            return [dict(row) for row in self._db.execute(sql, params).fetchall()]
+
+    def top_articles(self, channel_id: int, limit: int = 10) -> list[dict]:
+        """Статьи канала с наибольшим vote_count."""
+        return self.query(
+            "SELECT * FROM articles WHERE channel_id = ? AND NOT COALESCE(is_deleted, 0) ORDER BY vote_count DESC LIMIT ?",
+            (channel_id, limit)
+        )
+
+    def profile_comments(self, profile_id: int, limit: int = 100) -> list[dict]:
+        """Комментарии пользователя, новые первыми."""
+        return self.query("SELECT * FROM comments WHERE profile_id = ? ORDER BY timestamp DESC LIMIT ?", (profile_id, limit))
+
+    def article_blocks(self, article_id: int) -> list[dict]:
+        rows = self.query("SELECT * FROM payload_blocks WHERE article_id = ? ORDER BY position", (article_id,))
+        for row in rows:
+            row["data"] = json.loads(row["data"]) if row["data"] is not None else None
+        return rows
+
+    def counts(self) -> dict:
+        """Число строк в каждой таблице."""
+        tables = ("channels", "profiles", "articles", "payload_blocks", "comments", "votes", "channel_members")
+        with self._lock:
+            return {table: self._db.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0] for table in tables}
+
+
+def _replace_blocks(db: sqlite3.Connection, articles: list):
+    if not articles:
+        return
+    db.executemany("DELETE FROM payload_blocks WHERE article_id = ?", [(article_id,) for article_id, _ in articles])
+    db.executemany(
+        "INSERT OR REPLACE INTO payload_blocks (article_id, position, block_id, type, name, data) VALUES (?, ?, ?, ?, ?, ?)",
+        [
+            (article_id, position, block.get("id"), block.get("type"), block.get("name"),
+             json.dumps(block.get("data"), ensure_ascii=False, separators=(",", ":")))
+            for article_id, blocks in articles for position, block in enumerate(blocks)
+        ]
+    )
+
+
+WRITERS = {"channels": "upsert_channels", "profiles": "upsert_profiles", "articles": "upsert_articles",
+           "comments": "upsert_comments"}
+
+
+def _kind_of(item) -> str:
+    from . import models
+    for cls, kind in ((models.Comment, "comments"), (models.Article, "articles"), (models.Channel, "channels"),
+                      (models.Profile, "profiles"), (models.UserVote, "votes"), (models.ChannelMember, "members")):
+        if isinstance(item, cls):
+            return kind
+    raise ValueError("Не удалось определить вид элементов; укажите kind=")
@@ -1,8 +1,13 @@
+import asyncio
 import time
 import uuid
-from . import anix_images
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, Future, as_completed
+from functools import partial
+from . import anix_images, checkpoints, errors
+from .models.base import Partial
 from .models.payload import Payload
-from typing import Union, Optional, Iterator, Callable, Any, List
+from typing import Union, Optional, Iterator, AsyncIterator, Awaitable, Callable, Any, List, Deque, Iterable
 
 
 class Style:
@@ -30,9 +35,18 @@ class Style:
 class ArticleBuilder:
     EDITOR_VERSION = "2.26.5"
 
-    def __init__(self, payload: Optional[dict] = None, channel_id: Optional[int] = None, request_delay: float = 0.25):
+    def __init__(self, payload: Optional[dict] = None, channel_id: Optional[int] = None, request_delay: Optional[float] = None, upload_workers: int = 1):
+        """
+        Args:
+            payload: Готовый payload статьи (например, для редактирования).
+            channel_id: Канал, в редактор которого загружаются медиа и вложения.
+            request_delay: Дополнительный минимальный интервал между запросами загрузки (общий для всех
+                потоков). По умолчанию частоту ограничивает только группа "editor" ограничителя клиента.
+            upload_workers: Сколько файлов/вложений загружать одновременно.
+        """
         self.channel_id = channel_id
         self.request_delay = request_delay
+        self.upload_workers = upload_workers
         
         if payload:
             self.payload = payload
@@ -96,21 +110,20 @@ class ArticleBuilder:
                 self._media_files,
                 is_suggestion,
                 is_edit_mode,
-                self.request_delay
+                self.request_delay,
+                self.upload_workers
             )
         
         embed_results = []
         if self._embed_links:
-            for link in self._embed_links:
-                result = anix_images.upload_embed_content(
-                    self.channel_id,
-                    link,
-                    is_suggestion,
-                    is_edit_mode
-                )
-                embed_results.append(result)
-                if self.request_delay > 0:
-                    time.sleep(self.request_delay)
+            embed_results = anix_images.upload_embeds(
+                self.channel_id,
+                self._embed_links,
+                is_suggestion,
+                is_edit_mode,
+                self.request_delay,
+                self.upload_workers
+            )
         
         return media_results, embed_results
     
@@ -133,26 +146,234 @@ class ArticleBuilder:
         return {"payload": self.payload}
 
 
-class Paginator:
-    """Универсальный пагинатор для любых объектов."""
+class _CursorState:
+    """
+    Курсор обхода, общий для Paginator и AsyncPaginator: текущая позиция
+    (checkpoints.PageCursor), возобновление с сохранённой позиции и
+    автоматические контрольные точки в хранилище.
+    """
+
+    def _init_cursor(self, endpoint: Optional[str], params: Optional[dict]):
+        self.endpoint = endpoint
+        self.params = dict(params or {})
+        self._skip = 0  # Смещение на следующей загружаемой странице (при возобновлении)
+        self._store = None
+        self._store_key = None
+        self._every = 1
+        self._since_save = 0
+        self._finished = False
+        self._deferred = False
+
+    @property
+    def cursor(self) -> checkpoints.PageCursor:
+        """Позиция следующего элемента; уже выданные элементы считаются обработанными."""
+        return self._cursor()
+
+    def _cursor(self, redeliver: bool = False) -> checkpoints.PageCursor:
+        if redeliver and 0 < self._buffer_index <= len(self._buffer):
+            page, offset = self._current_page, self._buffer_index - 1
+        elif self._buffer_index < len(self._buffer):
+            page, offset = self._current_page, self._buffer_index
+        else:
+            page, offset = self._current_page + 1, self._skip
+        return checkpoints.PageCursor(self.endpoint, self.params, page, offset, self._total_pages)
+
+    def resume(self, cursor: Union[checkpoints.PageCursor, dict, None]):
+        """
+        Продолжает обход с позиции cursor (PageCursor или его to_dict()).
+        Вызывается до начала итерации; None ничего не меняет.
+        """
+        if cursor is None:
+            return self
+        if isinstance(cursor, dict):
+            cursor = checkpoints.PageCursor.from_dict(cursor)
+        if not cursor.same_query(checkpoints.PageCursor(self.endpoint, self.params)):
+            raise ValueError(f"Курсор относится к другому запросу: {cursor.key}")
+        if self._buffer or self._current_page != self.start_page - 1:
+            raise ValueError("Возобновить можно только пагинатор, обход которого ещё не начат")
+        self._current_page = cursor.page - 1
+        self._skip = cursor.offset
+        return self
+
+    def checkpoint(self, store, every: int = 1, key: Optional[str] = None):
+        """
+        Включает автоматические контрольные точки обхода.
+
+        Курсор сохраняется в store каждые every страниц, при ошибке загрузки
+        страницы и при выходе из with-блока (при исключении — так, чтобы
+        последний выданный элемент был выдан повторно). После полного обхода
+        курсор удаляется. Если в store уже есть курсор этого запроса, обход
+        продолжается с него.
+
+        Args:
+            store: Хранилище (объект с load/save/delete, см. checkpoints) или путь к JSON-файлу.
+            every: Через сколько страниц сохранять курсор.
+            key: Ключ в хранилище; по умолчанию строится из эндпоинта и параметров запроса.
+        """
+        if key is None and self.endpoint is None:
+            raise ValueError("Для пагинатора без эндпоинта нужен key")
+        self._store = checkpoints.get_store(store)
+        self._store_key = key or self.cursor.key
+        self._every = max(1, every)
+        return self.resume(self._store.load(self._store_key))
+
+    def _checkpoint(self, redeliver: bool = False):
+        """Сохраняет курсор в хранилище (после полного обхода — удаляет)."""
+        self._since_save = 0
+        if self._finished:
+            self._store.delete(self._store_key)
+        else:
+            self._store.save(self._store_key, self._cursor(redeliver).to_dict())
+
+    def _checkpoint_due(self) -> bool:
+        return self._store is not None and not self._deferred and self._since_save >= self._every
+
+    def _release(self):
+        """Сбрасывает буфер, сохраняя позицию внутри недочитанной страницы для cursor."""
+        if self._buffer_index < len(self._buffer):
+            self._current_page -= 1
+            self._skip = self._buffer_index
+        self._buffer = []
+        self._buffer_index = 0
+
+
+class Paginator(_CursorState):
+    """Универсальный пагинатор для любых объектов.
+
+    При prefetch > 0 после получения первой страницы (и total_page_count) следующие
+    prefetch страниц загружаются заранее в пуле потоков; элементы по-прежнему
+    выдаются строго по порядку. Незавершённые загрузки отменяются при close()
+    или досрочном выходе из итерации.
+
+    Позицию обхода можно сохранить (cursor) и продолжить с неё в новом
+    пагинаторе того же запроса (resume), а checkpoint(store, every) делает
+    это автоматически:
+
+        with channel.get_members().checkpoint("crawl.json", every=10) as members:
+            for member in members:
+                ...
+    """
     
     def __init__(
         self,
         fetch_func: Callable[[int], Any],
         start_page: int = 0,
-        end_page: Optional[int] = None
+        end_page: Optional[int] = None,
+        prefetch: int = 0,
+        endpoint: Optional[str] = None,
+        params: Optional[dict] = None
     ):
         self.fetch_func = fetch_func
         self.start_page = start_page
         self.end_page = end_page
+        self.prefetch = max(0, prefetch)
         self._current_page = start_page - 1  # Для __next__
         self._total_pages = None
         self._buffer = []
         self._buffer_index = 0
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: Deque[tuple[int, Future]] = deque()
+        self._closed = False
+        self._init_cursor(endpoint, params)
 
     def __iter__(self) -> Iterator[Any]:
         return self
 
+    def __enter__(self) -> "Paginator":
+        return self
+
+    def __exit__(self, exc_type, *exc_info):
+        if self._store is not None and not self._closed:
+            self._checkpoint(redeliver=exc_type is not None)
+        self.close()
+
+    def __del__(self):
+        self.close()
+
+    def close(self):
+        """Останавливает итерацию и отменяет незавершённые предзагрузки."""
+        self._closed = True
+        self._release()
+        while self._pending:
+            _, future = self._pending.popleft()
+            future.cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def _stop(self, cause: Optional[BaseException] = None):
+        self._finished = cause is None
+        if self._store is not None and not self._deferred:
+            self._checkpoint()
+        self.close()
+        raise StopIteration from cause
+
+    def pages(self) -> Iterator[list]:
+        """
+        Итератор оставшихся элементов постранично (остаток текущей страницы, затем
+        следующие страницы целиком). В отличие от обычной итерации, ошибка загрузки
+        страницы выбрасывается, а не завершает обход молча.
+        """
+        if self._buffer_index < len(self._buffer):
+            rest = self._buffer[self._buffer_index:]
+            self._buffer_index = len(self._buffer)
+            yield rest
+        while True:
+            try:
+                next(self)
+            except StopIteration as e:
+                if e.__cause__ is not None:
+                    raise e.__cause__
+                return
+            # После возобновления страница выдаётся с сохранённого смещения
+            start = self._buffer_index - 1
+            self._buffer_index = len(self._buffer)
+            yield self._buffer[start:] if start else self._buffer
+
+    def into(self, sink, batch_size: int = 500, **context) -> int:
+        """
+        Записывает оставшиеся элементы в приёмник (например, store.SQLiteStore)
+        пачками не меньше batch_size элементов (целыми страницами): sink.write(items, **context).
+        Возвращает число записанных элементов.
+
+        С checkpoint() курсор сохраняется после каждой записанной пачки, так что
+        после перезапуска обход продолжается с первого незаписанного элемента.
+        """
+        written, batch = 0, []
+        self._deferred = True
+        try:
+            for page in self.pages():
+                batch.extend(page)
+                if len(batch) >= batch_size:
+                    written += sink.write(batch, **context)
+                    batch = []
+                    if self._store is not None:
+                        self._checkpoint()
+            if batch:
+                written += sink.write(batch, **context)
+            if self._store is not None:
+                self._checkpoint()
+        finally:
+            self._deferred = False
+        return written
+
+    def _schedule(self):
+        """Ставит в очередь загрузку следующих страниц (не более prefetch вперёд)."""
+        if not self.prefetch or self._total_pages is None:
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.prefetch, thread_name_prefix="anixartpy-prefetch")
+        next_page = self._pending[-1][0] + 1 if self._pending else self._current_page + 1
+        while len(self._pending) < self.prefetch and next_page <= self.end_page:
+            self._pending.append((next_page, self._executor.submit(self.fetch_func, next_page)))
+            next_page += 1
+
+    def _fetch(self, page: int):
+        if self._pending and self._pending[0][0] == page:
+            _, future = self._pending.popleft()
+            return future.result()
+        return self.fetch_func(page)
+
     def __next__(self) -> Any:
         while True:
             # Если в буфере есть элементы — возвращаем их
@@ -161,20 +382,28 @@ class Paginator:
                 self._buffer_index += 1
                 return item
 
+            if self._closed:
+                raise StopIteration
+
+            # Страница дочитана — контрольная точка перед переходом к следующей
+            if self._checkpoint_due():
+                self._checkpoint()
+
             # Переход к следующей странице
             self._current_page += 1
 
             # Проверка на выход за границы
             if self._total_pages is not None and self._current_page >= self._total_pages:
-                raise StopIteration
+                self._stop()
             if self.end_page is not None and self._current_page > self.end_page:
-                raise StopIteration
+                self._stop()
 
             # Загрузка данных
             try:
-                items, total_pages = self.fetch_func(self._current_page)
+                items, total_pages = self._fetch(self._current_page)
             except Exception as e:
-                raise StopIteration from e
+                self._current_page -= 1  # Незагруженная страница остаётся следующей в cursor
+                self._stop(e)
 
             # Обновление общего числа страниц (если ещё не известно)
             if self._total_pages is None:
@@ -187,16 +416,114 @@ class Paginator:
 
             # Если страница пуста или вышли за границы — завершаем итерацию
             if not items:
-                raise StopIteration
+                self._stop()
 
-            # Обновляем буфер
+            # Обновляем буфер (при возобновлении — с сохранённого смещения)
             self._buffer = items
-            self._buffer_index = 0
+            self._buffer_index = self._skip
+            self._skip = 0
+            self._since_save += 1
+            self._schedule()
+
+
+def item_builder(raw: bool = False, factory: Optional[Callable[[dict], Any]] = None,
+                 fields: Optional[Iterable[str]] = None, model: Optional[Callable[[dict], Any]] = None) -> Optional[Callable[[list], list]]:
+    """Преобразование содержимого страницы для постраничных методов.
+
+    Args:
+        raw: Выдавать исходные словари ответа без построения моделей.
+        factory: Строить элементы вызовом factory(словарь) вместо моделей библиотеки.
+        fields: Проекция полей (см. projector): каждый элемент сокращается до
+            нужных ключей, остальное содержимое ответа сразу отбрасывается.
+        model: Конструктор модели (словарь -> модель) для fields без raw и factory.
+
+    Returns:
+        Функцию (список словарей страницы -> список элементов) или None — строить модели.
+    """
+    if raw and factory is not None:
+        raise ValueError("raw=True и factory взаимоисключающие")
+    project = projector(fields)
+    if project is not None:
+        if raw:
+            return lambda content: [project(item) for item in content]
+        if factory is not None:
+            return lambda content: [factory(project(item)) for item in content]
+        return lambda content: [_partial_model(model, project(item)) for item in content]
+    if raw:
+        return _raw_items
+    if factory is not None:
+        return lambda content: [factory(item) for item in content]
+    return None
+
+
+def _raw_items(content: list) -> list:
+    return content
+
+
+def _partial_model(model: Callable[[dict], Any], data: dict) -> Any:
+    """Строит частичную модель и оставляет ей сокращённый словарь (по нему store.raw_data узнаёт Partial)."""
+    instance = model(data)
+    instance._data = data
+    return instance
+
+
+def projector(fields: Optional[Iterable[str]]) -> Optional[Callable[[dict], dict]]:
+    """
+    Функция, сокращающая словарь ответа до перечисленных полей.
+
+    Поле — ключ верхнего уровня ("vote_count") или путь через точку во
+    вложенный объект ("channel.title"); вложенные списки объектов
+    сокращаются поэлементно. id сохраняется на каждом уровне, так как по нему
+    работают методы моделей. Ключ без пути ("channel") сохраняет вложенный
+    объект целиком.
+
+    Сокращённые словари — models.base.Partial: частичные модели из них
+    строятся в обход карты идентичности и не затирают полные экземпляры.
+
+    Returns:
+        Функцию проекции или None, если fields не задан.
+    """
+    if fields is None:
+        return None
+    if isinstance(fields, str):
+        fields = (fields,)
+    spec = {}
+    for field in fields:
+        node = spec
+        *parents, name = field.split(".")
+        for parent in parents:
+            child = node.setdefault(parent, {})
+            if child is None:
+                break
+            node = child
+        else:
+            node[name] = None
+    return partial(_project, spec=_with_ids(spec))
+
+
+def _with_ids(spec: dict) -> dict:
+    return {"id": None, **{key: child if child is None else _with_ids(child) for key, child in spec.items()}}
+
+
+def _project(data: Any, spec: dict) -> Any:
+    if isinstance(data, list):
+        return [_project(item, spec) for item in data]
+    if not isinstance(data, dict):
+        return data
+    projected = Partial()
+    for key, child in spec.items():
+        if key in data:
+            value = data[key]
+            projected[key] = value if child is None or value is None else _project(value, child)
+    return projected
 
 
 def paginate(
     fetch_func: Callable[[int], tuple[list[Any], int]],
-    page: Union[int, range, None] = None
+    page: Union[int, range, None] = None,
+    prefetch: int = 0,
+    endpoint: Optional[str] = None,
+    params: Optional[dict] = None
 ) -> Union[list[Any], Paginator]:
     """Универсальная функция для пагинации.
     
@@ -206,6 +533,8 @@ def paginate(
             - int: загрузить только эту страницу.
             - range: загрузить страницы из диапазона.
             - None: загрузить все страницы (от 0 до последней).
+        prefetch: Сколько следующих страниц загружать заранее (0 — последовательная загрузка).
+        endpoint, params: Эндпоинт (без номера страницы) и параметры запроса для курсора обхода.
     
     Returns:
         - Если page=int → возвращает список элементов.
@@ -217,4 +546,296 @@ def paginate(
     else:
         start = 0 if page is None else (page.start if isinstance(page, range) else 0)
         end = None if page is None else (page.stop - 1 if isinstance(page, range) else None)
-        return Paginator(fetch_func, start_page=start, end_page=end)
\ No newline at end of file
+        return Paginator(fetch_func, start_page=start, end_page=end, prefetch=prefetch, endpoint=endpoint, params=params)
+
+
+class AsyncPaginator(_CursorState):
+    """Асинхронный аналог Paginator для AsyncAnixartAPI.
+
+    При prefetch > 0 следующие страницы загружаются заранее как задачи asyncio.
+    Контрольные точки (checkpoint) записываются в хранилище в пуле потоков.
+    """
+
+    def __init__(
+        self,
+        fetch_func: Callable[[int], Awaitable[Any]],
+        start_page: int = 0,
+        end_page: Optional[int] = None,
+        prefetch: int = 0,
+        endpoint: Optional[str] = None,
+        params: Optional[dict] = None
+    ):
+        self.fetch_func = fetch_func
+        self.start_page = start_page
+        self.end_page = end_page
+        self.prefetch = max(0, prefetch)
+        self._current_page = start_page - 1
+        self._total_pages = None
+        self._buffer = []
+        self._buffer_index = 0
+        self._pending: Deque[tuple[int, "asyncio.Task"]] = deque()
+        self._closed = False
+        self._init_cursor(endpoint, params)
+
+    def __aiter__(self) -> AsyncIterator[Any]:
+        return self
+
+    async def __aenter__(self) -> "AsyncPaginator":
+        return self
+
+    async def __aexit__(self, exc_type, *exc_info):
+        if self._store is not None and not self._closed:
+            await self._acheckpoint(redeliver=exc_type is not None)
+        await self.aclose()
+
+    async def aclose(self):
+        """Останавливает итерацию и отменяет незавершённые предзагрузки."""
+        self._closed = True
+        self._release()
+        tasks = [task for _, task in self._pending]
+        self._pending.clear()
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _acheckpoint(self, redeliver: bool = False):
+        await asyncio.get_running_loop().run_in_executor(None, partial(self._checkpoint, redeliver))
+
+    async def _stop(self, cause: Optional[BaseException] = None):
+        self._finished = cause is None
+        if self._store is not None and not self._deferred:
+            await self._acheckpoint()
+        await self.aclose()
+        raise StopAsyncIteration from cause
+
+    async def pages(self) -> AsyncIterator[list]:
+        """Асинхронная версия Paginator.pages."""
+        if self._buffer_index < len(self._buffer):
+            rest = self._buffer[self._buffer_index:]
+            self._buffer_index = len(self._buffer)
+            yield rest
+        while True:
+            try:
+                await self.__anext__()
+            except StopAsyncIteration as e:
+                if e.__cause__ is not None:
+                    raise e.__cause__
+                return
+            start = self._buffer_index - 1
+            self._buffer_index = len(self._buffer)
+            yield self._buffer[start:] if start else self._buffer
+
+    async def into(self, sink, batch_size: int = 500, **context) -> int:
+        """Асинхронная версия Paginator.into; sink.write вызывается в пуле потоков."""
+        written, batch = 0, []
+        loop = asyncio.get_running_loop()
+        self._deferred = True
+        try:
+            async for page in self.pages():
+                batch.extend(page)
+                if len(batch) >= batch_size:
+                    written += await loop.run_in_executor(None, partial(sink.write, batch, **context))
+                    batch = []
+                    if self._store is not None:
+                        await self._acheckpoint()
+            if batch:
+                written += await loop.run_in_executor(None, partial(sink.write, batch, **context))
+            if self._store is not None:
+                await self._acheckpoint()
+        finally:
+            self._deferred = False
+        return written
+
+    def _schedule(self):
+        if not self.prefetch or self._total_pages is None:
+            return
+        next_page = self._pending[-1][0] + 1 if self._pending else self._current_page + 1
+        while len(self._pending) < self.prefetch and next_page <= self.end_page:
+            self._pending.append((next_page, asyncio.ensure_future(self.fetch_func(next_page))))
+            next_page += 1
+
+    async def _fetch(self, page: int):
+        if self._pending and self._pending[0][0] == page:
+            _, task = self._pending.popleft()
+            return await task
+        return await self.fetch_func(page)
+
+    async def __anext__(self) -> Any:
+        while True:
+            if self._buffer_index < len(self._buffer):
+                item = self._buffer[self._buffer_index]
+                self._buffer_index += 1
+                return item
+
+            if self._closed:
+                raise StopAsyncIteration
+
+            if self._checkpoint_due():
+                await self._acheckpoint()
+
+            self._current_page += 1
+
+            if self._total_pages is not None and self._current_page >= self._total_pages:
+                await self._stop()
+            if self.end_page is not None and self._current_page > self.end_page:
+                await self._stop()
+
+            try:
+                items, total_pages = await self._fetch(self._current_page)
+            except Exception as e:
+                self._current_page -= 1
+                await self._stop(e)
+
+            if self._total_pages is None:
+                self._total_pages = total_pages
+                if self.end_page is None:
+                    self.end_page = self._total_pages - 1
+                else:
+                    self.end_page = min(self.end_page, self._total_pages - 1)
+
+            if not items:
+                await self._stop()
+
+            self._buffer = items
+            self._buffer_index = self._skip
+            self._skip = 0
+            self._since_save += 1
+            self._schedule()
+
+
+def async_paginate(
+    fetch_func: Callable[[int], Awaitable[tuple[list[Any], int]]],
+    page: Union[int, range, None] = None,
+    prefetch: int = 0,
+    endpoint: Optional[str] = None,
+    params: Optional[dict] = None
+) -> Union[Awaitable[list[Any]], AsyncPaginator]:
+    """Асинхронная версия paginate.
+
+    Returns:
+        - Если page=int → возвращает корутину со списком элементов (нужен await).
+        - Если page=range или None → возвращает AsyncPaginator (для async for).
+    """
+    if isinstance(page, int):
+        async def fetch_one():
+            items, _ = await fetch_func(page)
+            return items
+        return fetch_one()
+    else:
+        start = 0 if page is None else (page.start if isinstance(page, range) else 0)
+        end = None if page is None else (page.stop - 1 if isinstance(page, range) else None)
+        return AsyncPaginator(fetch_func, start_page=start, end_page=end, prefetch=prefetch, endpoint=endpoint, params=params)
+
+
+def _capture(func: Callable[[Any], Any], key: Any) -> Any:
+    """Результат func(key) или ошибка API для этого ключа; прочие исключения (ошибки в коде) пробрасываются."""
+    try:
+        return func(key)
+    except errors.AnixartError as e:
+        return e
+
+
+def fetch_many(
+    func: Callable[[Any], Any],
+    keys: Iterable[Any],
+    max_workers: int = 8
+) -> list[Any]:
+    """Вызывает func для каждого уникального ключа в пуле потоков.
+
+    Returns:
+        Список результатов в порядке keys (повторяющиеся ключи запрашиваются один раз).
+        Если вызов для ключа завершился ошибкой API (errors.AnixartError), на его месте
+        стоит объект исключения; прочие исключения пробрасываются, а незапущенные
+        вызовы отменяются.
+    """
+    keys = list(keys)
+    unique = list(dict.fromkeys(keys))
+    if max_workers <= 1 or len(unique) <= 1:
+        results = {key: _capture(func, key) for key in unique}
+    else:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(unique)), thread_name_prefix="anixartpy-bulk") as executor:
+            futures = [executor.submit(_capture, func, key) for key in unique]
+            try:
+                results = {key: future.result() for key, future in zip(unique, futures)}
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+    return [results[key] for key in keys]
+
+
+def iter_fetch_many(
+    func: Callable[[Any], Any],
+    keys: Iterable[Any],
+    max_workers: int = 8
+) -> Iterator[tuple[Any, Any]]:
+    """Как fetch_many, но выдаёт пары (ключ, результат или исключение) по мере готовности.
+
+    При досрочном закрытии генератора незапущенные запросы отменяются.
+    """
+    unique = list(dict.fromkeys(keys))
+    executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(unique) or 1)), thread_name_prefix="anixartpy-bulk")
+    futures = {executor.submit(_capture, func, key): key for key in unique}
+    try:
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+    finally:
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+async def async_fetch_many(
+    func: Callable[[Any], Awaitable[Any]],
+    keys: Iterable[Any],
+    concurrency: int = 32
+) -> list[Any]:
+    """
+    Асинхронная версия fetch_many: не более concurrency запросов одновременно.
+    Исключения, кроме errors.AnixartError, пробрасываются, а остальные запросы отменяются.
+    """
+    keys = list(keys)
+    unique = list(dict.fromkeys(keys))
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def limited(key):
+        async with semaphore:
+            try:
+                return await func(key)
+            except errors.AnixartError as e:
+                return e
+
+    tasks = [asyncio.ensure_future(limited(key)) for key in unique]
+    try:
+        results = await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+    by_key = dict(zip(unique, results))
+    return [by_key[key] for key in keys]
+
+
+async def async_iter_fetch_many(
+    func: Callable[[Any], Awaitable[Any]],
+    keys: Iterable[Any],
+    concurrency: int = 32
+) -> AsyncIterator[tuple[Any, Any]]:
+    """Асинхронная версия iter_fetch_many."""
+    unique = list(dict.fromkeys(keys))
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def limited(key):
+        async with semaphore:
+            try:
+                return key, await func(key)
+            except errors.AnixartError as e:
+                return key, e
+
+    tasks = [asyncio.ensure_future(limited(key)) for key in unique]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
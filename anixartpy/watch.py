@@ -0,0 +1,191 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import AsyncIterator, Iterator, Optional
+
+from . import errors, utils
+
+
+class _WatcherState:
+    """
+    Общая логика ArticleWatcher и AsyncArticleWatcher: последний выданный id,
+    окно уже выданных id, оценка частоты публикаций и интервал опроса.
+
+    Интервал опроса — half_life / частота публикаций (по умолчанию половина
+    среднего промежутка между статьями), ограниченный min_interval и
+    max_interval. Частота оценивается экспоненциальным скользящим средним по
+    опросам, поэтому в тишине интервал плавно растёт до max_interval. После
+    неудачного опроса (RequestError или ответ с ненулевым code) следующий
+    выполняется через max_interval.
+    """
+
+    def __init__(self, since: Optional[int], min_interval: float, max_interval: float,
+                 batch_size: int, window: int, alpha: float = 0.3, half_life: float = 0.5):
+        if min_interval <= 0 or max_interval < min_interval:
+            raise ValueError("Нужно 0 < min_interval <= max_interval")
+        self.last_id = since
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.batch_size = max(1, batch_size)
+        self.alpha = alpha
+        self.half_life = half_life
+        self.rate: Optional[float] = None
+        self.interval = min_interval
+        self.polls = 0
+        self.skipped = 0
+        self.poll_errors = 0
+        self._seen = set()
+        self._order = deque()
+        self._window = window
+        self._last_poll: Optional[float] = None
+
+    def observe(self, latest_id: int):
+        """Учитывает результат опроса в оценке частоты и пересчитывает интервал."""
+        now = time.monotonic()
+        self.polls += 1
+        if self._last_poll is not None and self.last_id is not None:
+            elapsed = max(now - self._last_poll, 1e-3)
+            rate = max(0, latest_id - self.last_id) / elapsed
+            self.rate = rate if self.rate is None else self.alpha * rate + (1 - self.alpha) * self.rate
+        self._last_poll = now
+        if self.rate:
+            self.interval = min(self.max_interval, max(self.min_interval, self.half_life / self.rate))
+        elif self.rate is not None:
+            self.interval = self.max_interval
+
+    def poll_failed(self):
+        """Учитывает неудачный опрос: позиция и окно выданных id сохраняются, интервал — max_interval."""
+        self.poll_errors += 1
+        self.interval = self.max_interval
+
+    def advance(self, latest_id: int):
+        """Учитывает успешный опрос; при первом опросе без since начинает со следующей статьи."""
+        if self.last_id is None:
+            self.last_id = latest_id
+        self.observe(latest_id)
+
+    def batches(self, latest_id: int) -> Iterator[range]:
+        """Диапазоны пропущенных id от last_id + 1 до latest_id не длиннее batch_size."""
+        start = self.last_id + 1
+        while start <= latest_id:
+            stop = min(latest_id + 1, start + self.batch_size)
+            yield range(start, stop)
+            start = stop
+
+    def collect(self, ids: range, results: list) -> tuple[list, bool]:
+        """
+        Статьи пачки по порядку id и признак того, что пачка разобрана целиком.
+
+        Статьи, которых нет (ArticleGetError: удалена или не найдена), пропускаются.
+        На первом id с ошибкой запроса разбор останавливается: last_id остаётся
+        перед ним, и следующий опрос запросит его снова.
+        """
+        articles = []
+        for article_id, result in zip(ids, results):
+            if isinstance(result, errors.ArticleGetError):
+                self.skipped += 1
+            elif isinstance(result, errors.AnixartError):
+                return articles, False
+            elif isinstance(result, BaseException):
+                raise result
+            elif self._remember(article_id):
+                articles.append(result)
+            self.last_id = article_id
+        return articles, True
+
+    def _remember(self, article_id: int) -> bool:
+        if article_id in self._seen:
+            return False
+        self._seen.add(article_id)
+        self._order.append(article_id)
+        if len(self._order) > self._window:
+            self._seen.discard(self._order.popleft())
+        return True
+
+
+class ArticleWatcher(_WatcherState):
+    """
+    Следит за новыми статьями: дёшево опрашивает /article/latest (в обход
+    кэша ответов), а id, появившиеся между опросами, загружает параллельно
+    пачками по batch_size и выдаёт каждую статью один раз в порядке id.
+
+    Используется как итератор; stop() (например, из другого потока)
+    завершает итерацию после текущего опроса.
+
+        for article in api.watch_articles():
+            print(article.id, article.channel.title)
+    """
+
+    def __init__(self, api, since: Optional[int] = None, min_interval: float = 1.0, max_interval: float = 60.0,
+                 max_workers: int = 8, batch_size: int = 64, window: int = 4096):
+        """
+        Args:
+            api: AnixartAPI.
+            since: id, после которого выдавать статьи. None — начиная со следующей после
+                текущей последней статьи (история не выдаётся).
+            min_interval: Минимальный интервал опроса, секунды.
+            max_interval: Максимальный интервал опроса (в отсутствие новых статей), секунды.
+            max_workers: Сколько статей загружать одновременно.
+            batch_size: Сколько пропущенных id загружать за один шаг (ограничивает память при
+                большом отставании).
+            window: Сколько последних выданных id помнить для защиты от повторов.
+        """
+        super().__init__(since, min_interval, max_interval, batch_size, window)
+        self.api = api
+        self.max_workers = max_workers
+        self._stopped = threading.Event()
+
+    def stop(self):
+        self._stopped.set()
+
+    def __iter__(self) -> Iterator:
+        self._stopped.clear()
+        while not self._stopped.is_set():
+            try:
+                latest_id = self.api.get_latest_article_id(use_cache=False)
+            except errors.AnixartError:
+                self.poll_failed()
+                self._stopped.wait(self.interval)
+                continue
+            self.advance(latest_id)
+            for ids in self.batches(latest_id):
+                articles, complete = self.collect(ids, utils.fetch_many(self.api.get_article, ids, self.max_workers))
+                yield from articles
+                if not complete or self._stopped.is_set():
+                    break
+            self._stopped.wait(self.interval)
+
+
+class AsyncArticleWatcher(_WatcherState):
+    """Асинхронный ArticleWatcher для AsyncAnixartAPI: async for article in api.watch_articles()."""
+
+    def __init__(self, api, since: Optional[int] = None, min_interval: float = 1.0, max_interval: float = 60.0,
+                 concurrency: int = 8, batch_size: int = 64, window: int = 4096):
+        super().__init__(since, min_interval, max_interval, batch_size, window)
+        self.api = api
+        self.concurrency = concurrency
+        self._stopped = False
+
+    def stop(self):
+        self._stopped = True
+
+    async def __aiter__(self) -> AsyncIterator:
+        self._stopped = False
+        while not self._stopped:
+            try:
+                latest_id = await self.api.get_latest_article_id(use_cache=False)
+            except errors.AnixartError:
+                self.poll_failed()
+                await asyncio.sleep(self.interval)
+                continue
+            self.advance(latest_id)
+            for ids in self.batches(latest_id):
+                results = await utils.async_fetch_many(self.api.get_article, ids, self.concurrency)
+                articles, complete = self.collect(ids, results)
+                for article in articles:
+                    yield article
+                if not complete or self._stopped:
+                    break
+            if not self._stopped:
+                await asyncio.sleep(self.interval)
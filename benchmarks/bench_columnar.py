@@ -0,0 +1,59 @@
+"""
+Выгрузка страниц в колонки: ColumnarSink на исходных словарях против
+построения моделей и сбора кортежей атрибутов (как перед pandas.DataFrame).
+
+    python benchmarks/bench_columnar.py
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from anixartpy import ColumnarSink, models  # noqa: E402
+import fixtures  # noqa: E402
+
+COUNT = 2000
+
+
+def article_rows(items):
+    rows = []
+    for data in items:
+        article = models.Article(data, None)
+        repost = article.repost_article
+        rows.append((article.id, article.channel.id, article.author["id"], repost.id if repost else None, article.vote,
+                     article.vote_count, article.comment_count, article.repost_count, article.is_deleted,
+                     article.is_under_moderation, article.creation_date, article.last_update_date))
+    return rows
+
+
+def vote_rows(items):
+    rows = []
+    for data in items:
+        vote = models.UserVote(data)
+        rows.append((vote.id, vote.login, vote.avatar, vote.vote, vote.is_online, vote.is_verified, vote.is_sponsor,
+                     vote.badge_id, vote.badge_type))
+    return rows
+
+
+def columnar(schema, items):
+    sink = ColumnarSink(schema)
+    sink.write(items)
+    sink.flush()
+    return sink
+
+
+def main():
+    cases = (
+        ("articles", [fixtures.article(i) for i in range(COUNT)], article_rows),
+        ("votes", [fixtures.user_vote(i) for i in range(COUNT)], vote_rows),
+    )
+    print(f"{'schema':<10}{'модели, мкс':>14}{'колонки, мкс':>14}{'ускорение':>12}")
+    for schema, items, rows in cases:
+        objects_us = min(timeit.repeat(lambda: rows(items), number=1, repeat=5)) / COUNT * 1e6
+        columns_us = min(timeit.repeat(lambda: columnar(schema, items), number=1, repeat=5)) / COUNT * 1e6
+        print(f"{schema:<10}{objects_us:>14.2f}{columns_us:>14.2f}{objects_us / columns_us:>11.1f}x")
+
+
+if __name__ == "__main__":
+    main()
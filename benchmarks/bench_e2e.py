@@ -0,0 +1,153 @@
+"""
+Сквозной набор бенчмарков против локального FakeAnixart (сеть не нужна).
+
+Измеряет:
+  - пропускную способность пагинации (элементов в секунду, prefetch 0 и 4);
+  - стоимость построения моделей из ответа (мкс на элемент);
+  - пропускную способность загрузки медиа в редактор (МиБ/с, 1 и 4 потока);
+  - память, удерживаемую одним элементом вместе с исходным словарём (байт).
+
+Ограничитель частоты клиента отключён: измеряется сам клиент, а не бюджет запросов.
+
+    python benchmarks/bench_e2e.py                          # таблица результатов
+    python benchmarks/bench_e2e.py --save baseline.json     # сохранить результаты
+    python benchmarks/bench_e2e.py --baseline baseline.json # сравнить; код выхода 1 при регрессии
+"""
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from anixartpy import AnixartAPI, ArticleBuilder, anix_images, enums, models  # noqa: E402
+from fake_server import FakeAnixart  # noqa: E402
+import fixtures  # noqa: E402
+
+UPLOAD_FILE_SIZE = 256 * 1024
+UPLOAD_FILES = 16
+
+
+def bench_pagination(server):
+    api = AnixartAPI(base_url=server.url, rate_limit=False)
+    channel = api.get_channel(1)
+    article = api.get_article(1)
+    results = {}
+    for prefetch in (0, 4):
+        start = time.perf_counter()
+        count = sum(1 for _ in channel.get_articles(prefetch=prefetch))
+        results[f"pagination.articles.prefetch{prefetch}"] = count / (time.perf_counter() - start)
+        start = time.perf_counter()
+        count = sum(1 for _ in article.get_comments(enums.Sorting.NEW, page=None, prefetch=prefetch))
+        results[f"pagination.comments.prefetch{prefetch}"] = count / (time.perf_counter() - start)
+    return results
+
+
+def bench_models(count=2000, repeat=5):
+    cases = {
+        "Profile": (lambda data: models.Profile(data, None), [fixtures.profile(i) for i in range(count)]),
+        "Article": (lambda data: models.Article(data, None), [fixtures.article(i) for i in range(count)]),
+        "ArticleComment": (lambda data: models.ArticleComment(data, None), [fixtures.comment(i) for i in range(count)]),
+        "UserVote": (models.UserVote, [fixtures.user_vote(i) for i in range(count)]),
+        "ChannelMember": (lambda data: models.ChannelMember(data, None), [fixtures.channel_member(i) for i in range(count)]),
+    }
+    results = {}
+    for name, (factory, items) in cases.items():
+        def build():
+            for data in items:
+                factory(data).id
+        best = min(timeit.repeat(build, number=1, repeat=repeat))
+        results[f"models.{name}.us_per_item"] = best / count * 1e6
+    return results
+
+
+def bench_uploads(server):
+    AnixartAPI(base_url=server.url, rate_limit=False)  # становится anix_images.API_INSTANCE
+    editor_url, anix_images.EDITOR_URL = anix_images.EDITOR_URL, server.url
+    payload = b"\xff\xd8\xff" + os.urandom(UPLOAD_FILE_SIZE - 3)
+    results = {}
+    try:
+        for workers in (1, 4):
+            builder = ArticleBuilder(channel_id=1, upload_workers=workers).add_media([payload] * UPLOAD_FILES)
+            start = time.perf_counter()
+            builder.build()
+            elapsed = time.perf_counter() - start
+            results[f"uploads.workers{workers}.mib_per_s"] = UPLOAD_FILE_SIZE * UPLOAD_FILES / elapsed / 2 ** 20
+    finally:
+        anix_images.EDITOR_URL = editor_url
+    return results
+
+
+def bench_memory(count=5000):
+    cases = {
+        "Article": lambda i: models.Article(fixtures.article(i), None),
+        "UserVote": lambda i: models.UserVote(fixtures.user_vote(i)),
+        "ChannelMember": lambda i: models.ChannelMember(fixtures.channel_member(i), None),
+    }
+    results = {}
+    for name, build in cases.items():
+        gc.collect()
+        tracemalloc.start()
+        objects = [build(i) for i in range(count)]
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        results[f"memory.{name}.bytes_per_item"] = current / count
+        del objects
+    return results
+
+
+def higher_is_better(name: str) -> bool:
+    return name.startswith(("pagination.", "uploads."))
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    regressions = []
+    for name, value in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        change = (base - value) / base if higher_is_better(name) else (value - base) / base
+        if change > tolerance:
+            regressions.append((name, base, value, change))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Сквозные бенчмарки anixartpy против FakeAnixart.")
+    parser.add_argument("--latency", type=float, default=0.005, help="задержка ответа сервера, секунды")
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--per-page", type=int, default=20)
+    parser.add_argument("--save", help="сохранить результаты в JSON-файл")
+    parser.add_argument("--baseline", help="JSON-файл с прошлыми результатами для сравнения")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="допустимое ухудшение (доля), по умолчанию 0.2")
+    args = parser.parse_args()
+
+    results = {}
+    with FakeAnixart(latency=args.latency, pages=args.pages, per_page=args.per_page) as server:
+        results.update(bench_pagination(server))
+        results.update(bench_uploads(server))
+    results.update(bench_models())
+    results.update(bench_memory())
+
+    for name, value in results.items():
+        print(f"{name:<40}{value:>14.2f}")
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2, sort_keys=True)
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            regressions = compare(results, json.load(file), args.tolerance)
+        for name, base, value, change in regressions:
+            print(f"РЕГРЕССИЯ {name}: {base:.2f} -> {value:.2f} ({change:+.0%})")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Разбор тела ответа: requests.Response.json() против декодеров jsonlib на bytes.
+
+По умолчанию используются синтетические страницы /article/all и
+/article/comment/all из fixtures; можно передать пути к записанным ответам:
+
+    python benchmarks/bench_json.py [recorded.json ...]
+"""
+import json
+import os
+import sys
+import timeit
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from anixartpy import jsonlib  # noqa: E402
+import fixtures  # noqa: E402
+
+
+def requests_json(body: bytes):
+    response = requests.models.Response()
+    response._content = body
+    response.status_code = 200
+    return response.json()
+
+
+def load_pages(paths):
+    if paths:
+        pages = {}
+        for path in paths:
+            with open(path, "rb") as file:
+                pages[os.path.basename(path)] = file.read()
+        return pages
+    articles = fixtures.page([fixtures.article(i) for i in range(20)], total_page_count=50)
+    comments = fixtures.page([fixtures.comment(i) for i in range(20)], total_page_count=50)
+    return {
+        "/article/all (20)": json.dumps(articles, ensure_ascii=False).encode(),
+        "/article/comment/all (20)": json.dumps(comments, ensure_ascii=False).encode(),
+    }
+
+
+def per_page_us(func, body, number=200, repeat=5):
+    return min(timeit.repeat(lambda: func(body), number=number, repeat=repeat)) / number * 1e6
+
+
+def main():
+    decoders = [("requests .json()", requests_json), ("json (bytes)", jsonlib.get_decoder("json"))]
+    if jsonlib.orjson is not None:
+        decoders.append(("orjson", jsonlib.get_decoder("orjson")))
+    for name, body in load_pages(sys.argv[1:]).items():
+        print(f"{name}: {len(body) / 1024:.1f} КиБ")
+        baseline = None
+        for decoder_name, func in decoders:
+            us = per_page_us(func, body)
+            baseline = baseline or us
+            print(f"  {decoder_name:<20}{us:>10.1f} мкс{baseline / us:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
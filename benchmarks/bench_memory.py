@@ -0,0 +1,62 @@
+"""
+RSS процесса, удерживающего N объектов UserVote.
+
+"dict" — прежнее представление (все поля в __dict__ экземпляра, как у
+BaseModel до перехода на __slots__), "slots" — текущие модели. Каждый режим
+запускается в отдельном процессе; исходные словари ответа не удерживаются.
+
+    python benchmarks/bench_memory.py [N]
+"""
+import os
+import subprocess
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from anixartpy import enums, models  # noqa: E402
+import fixtures  # noqa: E402
+
+
+class DictBadge:
+    def __init__(self, id, name, type, url):
+        for key, value in {"id": id, "name": name, "type": enums.BadgeType(type) if type else None, "url": url}.items():
+            setattr(self, key, value)
+
+
+class DictUserVote:
+    def __init__(self, data: dict):
+        for key, value in data.items():
+            setattr(self, key, value)
+        self.vote = enums.Vote(data["vote"])
+        self.badge = DictBadge(id=data["badge_id"], name=data["badge_name"], type=data["badge_type"], url=data["badge_url"])
+
+
+def rss_mb() -> float:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+    except OSError:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def measure(mode: str, count: int):
+    factory = DictUserVote if mode == "dict" else models.UserVote
+    before = rss_mb()
+    votes = [factory(fixtures.user_vote(i)) for i in range(count)]
+    after = rss_mb()
+    print(f"{mode:<6}{count:>10}{after - before:>12.1f}{(after - before) * 2 ** 20 / len(votes):>14.1f}")
+
+
+def main():
+    if len(sys.argv) > 2 and sys.argv[1] == "--mode":
+        measure(sys.argv[2], int(sys.argv[3]))
+        return
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    print(f"{'mode':<6}{'объектов':>10}{'RSS, МБ':>12}{'байт/объект':>14}")
+    for mode in ("dict", "slots"):
+        subprocess.run([sys.executable, os.path.abspath(__file__), "--mode", mode, str(count)], check=True)
+
+
+if __name__ == "__main__":
+    main()
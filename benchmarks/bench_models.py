@@ -0,0 +1,72 @@
+"""
+Стоимость построения моделей на элемент.
+
+"eager" — построение модели с обращением ко всем вложенным полям (так раньше
+работал конструктор), "lazy" — построение и чтение только id и vote_count,
+как при обходе ленты.
+
+    python benchmarks/bench_models.py
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from anixartpy import models  # noqa: E402
+import fixtures  # noqa: E402
+
+ARTICLE_FIELDS = ("channel", "payload", "creation_date", "last_update_date", "repost_article", "vote")
+PROFILE_FIELDS = ("badge", "roles", "last_activity_time", "register_date", "socials", "ban_expires", "privilege_level",
+                  "stats", "counters", "notifications", "watch_dynamics", "friend_status", "sponsorship_expires")
+
+
+def hydrate_article(article):
+    for field in ARTICLE_FIELDS:
+        getattr(article, field)
+    article.payload.blocks
+    article.channel.permission, article.channel.creation_date, article.channel.last_update_date
+    if article.repost_article is not None:
+        hydrate_article(article.repost_article)
+
+
+def hydrate_comment(comment):
+    for field in PROFILE_FIELDS:
+        getattr(comment.profile, field)
+    comment.timestamp
+    hydrate_article(comment.article)
+
+
+def build_articles(items, eager):
+    for data in items:
+        article = models.Article(data, None)
+        article.id, article.vote_count
+        if eager:
+            hydrate_article(article)
+
+
+def build_comments(items, eager):
+    for data in items:
+        comment = models.ArticleComment(data, None)
+        comment.id, comment.vote_count
+        if eager:
+            hydrate_comment(comment)
+
+
+def per_item_us(func, items, eager, repeat=5):
+    best = min(timeit.repeat(lambda: func(items, eager), number=1, repeat=repeat))
+    return best / len(items) * 1e6
+
+
+def main():
+    articles = [fixtures.article(i) for i in range(2000)]
+    comments = [fixtures.comment(i) for i in range(2000)]
+    print(f"{'model':<16}{'eager, мкс':>12}{'lazy, мкс':>12}{'ускорение':>12}")
+    for name, func, items in (("Article", build_articles, articles), ("ArticleComment", build_comments, comments)):
+        eager = per_item_us(func, items, True)
+        lazy = per_item_us(func, items, False)
+        print(f"{name:<16}{eager:>12.2f}{lazy:>12.2f}{eager / lazy:>11.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Память, которую удерживают статьи после обхода страниц: полные модели против
+проекции fields=("vote_count", "creation_date").
+
+    python benchmarks/bench_projection.py
+"""
+import gc
+import os
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from anixartpy import models, utils  # noqa: E402
+import fixtures  # noqa: E402
+
+PAGES = 50
+PER_PAGE = 25
+FIELDS = ("vote_count", "creation_date")
+
+
+def crawl(build):
+    """Как Paginator: каждая страница декодируется, превращается в элементы и отбрасывается."""
+    items = []
+    for page in range(PAGES):
+        content = [fixtures.article(page * PER_PAGE + i, with_repost=True) for i in range(PER_PAGE)]
+        items.extend(build(content))
+    return items
+
+
+def measure(build) -> tuple[float, float]:
+    gc.collect()
+    tracemalloc.start()
+    items = crawl(build)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del items
+    return retained / 1024, peak / 1024
+
+
+def main():
+    cases = (
+        ("модели", lambda content: [models.Article(data, None) for data in content]),
+        ("fields", utils.item_builder(fields=FIELDS, model=lambda data: models.Article(data, None))),
+    )
+    count = PAGES * PER_PAGE
+    print(f"{'режим':<10}{'удержано, КиБ':>16}{'пик, КиБ':>12}{'мкс/статья':>13}")
+    for name, build in cases:
+        retained, peak = measure(build)
+        per_item = min(timeit.repeat(lambda: crawl(build), number=1, repeat=3)) / count * 1e6
+        print(f"{name:<10}{retained:>16.0f}{peak:>12.0f}{per_item:>13.2f}")
+
+
+if __name__ == "__main__":
+    main()
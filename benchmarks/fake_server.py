@@ -0,0 +1,269 @@
+"""
+Локальная замена Anixart API и редактора editor.anixsekai.com для бенчмарков.
+
+Отдаёт синтетические ответы из fixtures (или записанные ответы) для эндпоинтов,
+которыми пользуется клиент: /channel/*, /article/*, /article/suggestion/*,
+загрузки обложек и аватаров, а также /content/upload и /embed/* редактора.
+Задержка, доля ошибок и число страниц настраиваются.
+
+    with FakeAnixart(latency=0.02, pages=20) as server:
+        api = AnixartAPI(base_url=server.url)
+        anix_images.EDITOR_URL = server.url
+
+или отдельным процессом:
+
+    python benchmarks/fake_server.py --port 8000 --latency 0.05 --error-rate 0.01
+"""
+import argparse
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from anixartpy.metrics import normalize_endpoint  # noqa: E402
+import fixtures  # noqa: E402
+
+CHUNK_SIZE = 64 * 1024
+
+
+class FakeAnixart:
+    """
+    Потоковый HTTP-сервер на 127.0.0.1 со случайным портом.
+
+    Args:
+        latency: Задержка перед каждым ответом, секунды.
+        jitter: Дополнительная случайная задержка от 0 до jitter секунд.
+        error_rate: Доля запросов, на которые сервер отвечает HTML-страницей с кодом error_status.
+        error_status: HTTP-статус ошибочных ответов.
+        pages: Сколько страниц отдают постраничные эндпоинты.
+        per_page: Элементов на странице.
+        recorded: Записанные ответы {"МЕТОД /шаблон": ответ}, где шаблон — результат
+            metrics.normalize_endpoint (например, "POST /article/all/{page}");
+            имеют приоритет над синтетическими.
+        seed: Зерно генератора ошибок и джиттера.
+    """
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, error_rate: float = 0.0, error_status: int = 502,
+                 pages: int = 10, per_page: int = 20, recorded: Optional[dict] = None, seed: int = 0):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.pages = pages
+        self.per_page = per_page
+        self.recorded = recorded or {}
+        self.hits = Counter()
+        self.bytes_received = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._routes = [(re.compile(pattern + r"$"), handler) for pattern, handler in (
+            (r"/channel/(\d+)", self.channel),
+            (r"/channel/(\d+)/(?:subscriber|block)/all/(\d+)", self.members),
+            (r"/channel/(\d+)/permission/all/(\d+)", self.members),
+            (r"/channel/(\d+)/editor/available", self.editor_available),
+            (r"/channel/(?:edit|subscribe|unsubscribe)/(\d+)", self.ok),
+            (r"/channel/(\d+)/(?:block|permission)/manage", self.ok),
+            (r"/channel/(?:cover|avatar)/upload/(\d+)", self.image_uploaded),
+            (r"/profile/preference/avatar/edit", self.image_uploaded),
+            (r"/article/latest", self.latest),
+            (r"/article/(\d+)", self.article),
+            (r"/article/suggestion/(\d+)", self.suggestion),
+            (r"/article/(?:suggestion/)?all/(\d+)", self.articles),
+            (r"/article/votes/(\d+)/(\d+)", self.votes),
+            (r"/article/reposts/(\d+)/(\d+)", self.reposts),
+            (r"/article/comment/all/(\d+)/(\d+)", self.comments),
+            (r"/article/vote/(\d+)/(\d+)", self.ok),
+            (r"/article/(?:suggestion/)?(?:create|edit)/(\d+)", self.article_saved),
+            (r"/article/(?:suggestion/)?(?:delete|publish)/(\d+)", self.ok),
+            (r"/content/upload", self.content_uploaded),
+            (r"/embed/(\w+)", self.embed),
+        )]
+
+    # -- жизненный цикл ------------------------------------------------------
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeAnixart":
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, name="fake-anixart", daemon=True).start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "FakeAnixart":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    # -- ответы --------------------------------------------------------------
+
+    def page(self, page: int, build):
+        items = [build(page * self.per_page + index) for index in range(self.per_page)] if page < self.pages else []
+        return fixtures.page(items, total_page_count=self.pages)
+
+    def channel(self, channel_id, body):
+        return {"code": 0, "channel": fixtures.channel(int(channel_id))}
+
+    def members(self, channel_id, page, body):
+        return self.page(int(page), lambda i: fixtures.channel_member(i + 1, int(channel_id)))
+
+    def editor_available(self, channel_id, body):
+        return {"code": 0, "media_upload_token": f"media-{channel_id}"}
+
+    def image_uploaded(self, *args):
+        return {"code": 0, "url": "https://s.anixart.app/image.jpg", "avatar": "https://s.anixart.app/avatar.jpg"}
+
+    def latest(self, body):
+        return {"code": 0, "articleId": self.pages * self.per_page}
+
+    def article(self, article_id, body):
+        return {"code": 0, "article": fixtures.article(int(article_id))}
+
+    def suggestion(self, article_id, body):
+        return {"code": 0, "articleSuggestion": fixtures.article(int(article_id))}
+
+    def articles(self, page, body):
+        channel_id = (body or {}).get("channel_id") or 1
+        top = self.pages * self.per_page
+        return self.page(int(page), lambda i: fixtures.article(top - i, channel_id))
+
+    def votes(self, article_id, page, body):
+        return self.page(int(page), lambda i: fixtures.user_vote(i + 1))
+
+    def reposts(self, article_id, page, body):
+        return self.page(int(page), lambda i: fixtures.article(i + 1, with_repost=False))
+
+    def comments(self, article_id, page, body):
+        return self.page(int(page), lambda i: fixtures.comment(i + 1, int(article_id)))
+
+    def article_saved(self, target_id, body):
+        return {"code": 0, "article": fixtures.article(int(target_id), with_repost=False)}
+
+    def ok(self, *args):
+        return {"code": 0}
+
+    def content_uploaded(self, body):
+        return {"success": 1, "file": {"url": f"https://editor.anixsekai.com/content/{self._random.getrandbits(32):08x}.jpg"}}
+
+    def embed(self, service, body):
+        return {"success": 1, "embed": f"https://www.{service}.com/embed/x", "image": "https://img/preview.jpg"}
+
+    def respond(self, method: str, path: str, body) -> Optional[dict]:
+        template = f"{method} {normalize_endpoint(path)}"
+        with self._lock:
+            self.hits[template] += 1
+        if template in self.recorded:
+            return self.recorded[template]
+        for pattern, handler in self._routes:
+            match = pattern.match(path)
+            if match:
+                return handler(*match.groups(), body)
+        return None
+
+    def _delay_and_fail(self) -> bool:
+        with self._lock:
+            delay = self.latency + (self._random.random() * self.jitter if self.jitter else 0)
+            failed = self.error_rate and self._random.random() < self.error_rate
+        if delay:
+            time.sleep(delay)
+        return bool(failed)
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def read_body(self) -> bytes:
+                length = int(self.headers.get("Content-Length") or 0)
+                is_json = "json" in (self.headers.get("Content-Type") or "")
+                chunks, received = [], 0
+                while received < length:
+                    chunk = self.rfile.read(min(CHUNK_SIZE, length - received))
+                    if not chunk:
+                        break
+                    received += len(chunk)
+                    if is_json:
+                        chunks.append(chunk)
+                with server._lock:
+                    server.bytes_received += received
+                return b"".join(chunks)
+
+            def send(self, status: int, body: bytes, content_type: str):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def handle_any(self):
+                raw = self.read_body()
+                path = self.path.split("?", 1)[0]
+                if server._delay_and_fail():
+                    page = f"<html><body><h1>{server.error_status} Bad Gateway</h1></body></html>".encode()
+                    return self.send(server.error_status, page, "text/html")
+                try:
+                    body = json.loads(raw) if raw else None
+                except ValueError:
+                    body = None
+                response = server.respond(self.command, path, body)
+                if response is None:
+                    return self.send(404, b'{"code": 404}', "application/json")
+                self.send(200, json.dumps(response, ensure_ascii=False).encode(), "application/json")
+
+            do_GET = do_POST = handle_any
+
+        return Handler
+
+
+def load_recorded(path: str) -> dict:
+    """Читает записанные ответы из JSON-файла вида {"МЕТОД /шаблон": ответ}."""
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--pages", type=int, default=10)
+    parser.add_argument("--per-page", type=int, default=20)
+    parser.add_argument("--recorded", help="JSON-файл с записанными ответами")
+    args = parser.parse_args()
+
+    server = FakeAnixart(args.latency, args.jitter, args.error_rate, pages=args.pages, per_page=args.per_page,
+                         recorded=load_recorded(args.recorded) if args.recorded else None)
+    server._server = ThreadingHTTPServer(("127.0.0.1", args.port), server._handler())
+    print(f"Fake Anixart API: {server.url}")
+    try:
+        server._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
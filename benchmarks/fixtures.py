@@ -0,0 +1,82 @@
+"""Синтетические ответы Anixart API для бенчмарков (структура совпадает с реальными ответами)."""
+
+
+def profile(profile_id: int) -> dict:
+    return {
+        "id": profile_id, "login": f"user{profile_id}", "avatar": "https://s.anixart.app/avatar.jpg", "status": "",
+        "history": [], "votes": [], "ban_reason": None, "is_private": False, "is_sponsor": False, "is_banned": False,
+        "is_perm_banned": False, "is_bookmarks_transferred": False, "is_sponsor_transferred": False, "is_vk_bound": False,
+        "is_google_bound": False, "is_verified": False, "rating_score": 12, "is_blocked": False, "is_me_blocked": False,
+        "is_stats_hidden": False, "is_counts_hidden": False, "is_social_hidden": False, "is_friend_requests_disallowed": False,
+        "is_online": True, "badge": {"id": 1, "name": "badge", "type": 0, "image_url": "https://s.anixart.app/badge.webp"},
+        "roles": [{"id": 1, "name": "role", "color": "ffffff"}], "last_activity_time": 1700000000, "register_date": 1600000000,
+        "vk_page": "", "tg_page": "", "inst_page": "", "tt_page": "", "discord_page": "", "ban_expires": 0,
+        "privilege_level": 1, "watching_count": 1, "plan_count": 2, "completed_count": 3, "hold_on_count": 4,
+        "dropped_count": 5, "favorite_count": 6, "watched_episode_count": 7, "watched_time": 8000, "comment_count": 1,
+        "collection_count": 2, "video_count": 3, "friend_count": 4, "subscription_count": 5,
+        "is_release_type_notifications_enabled": True, "is_episode_notifications_enabled": True,
+        "is_first_episode_notification_enabled": True, "is_related_release_notifications_enabled": True,
+        "is_report_process_notifications_enabled": True, "is_comment_notifications_enabled": True,
+        "is_my_collection_comment_notifications_enabled": True, "is_my_article_comment_notifications_enabled": True,
+        "watch_dynamics": [{"id": 1, "day": 1, "count": 2, "timestamp": 1700000000}], "friend_status": None,
+        "sponsorshipExpires": 0,
+    }
+
+
+def channel(channel_id: int) -> dict:
+    return {
+        "id": channel_id, "title": f"Канал {channel_id}", "description": "Описание", "cover": "https://s.anixart.app/cover.jpg",
+        "avatar": "https://s.anixart.app/avatar.jpg", "permission": 0, "article_count": 100, "subscriber_count": 1000,
+        "is_blog": False, "blog_profile_id": None, "is_commenting_enabled": True, "is_article_suggestion_enabled": True,
+        "is_verified": False, "is_deleted": False, "is_subscribed": False, "is_blocked": False, "is_perm_blocked": False,
+        "block_reason": None, "is_creator": False, "is_administrator_or_higher": False,
+        "creation_date": 1600000000, "last_update_date": 1700000000,
+    }
+
+
+def article(article_id: int, channel_id: int = 1, with_repost: bool = True) -> dict:
+    return {
+        "id": article_id, "channel": channel(channel_id), "author": {"id": 1},
+        "payload": {
+            "time": 1700000000000, "version": "2.26.5", "block_count": 3,
+            "blocks": [
+                {"id": "a1", "name": "header", "type": "header", "data": {"text": "Заголовок", "level": 3}},
+                {"id": "a2", "name": "paragraph", "type": "paragraph", "data": {"text": "Текст " * 20}},
+                {"id": "a3", "name": "media", "type": "media", "data": {"items": [{"url": "https://s.anixart.app/1.jpg"}], "item_count": 1}},
+            ],
+        },
+        "vote": 2, "repost_article": article(article_id + 1000000, channel_id, False) if with_repost and article_id % 5 == 0 else None,
+        "comment_count": 3, "repost_count": 1, "vote_count": article_id % 97, "is_under_moderation": False,
+        "is_deleted": False, "under_moderation_reason": None, "contains_repost_article": False,
+        "creation_date": 1700000000 - article_id, "last_update_date": 1700000000 - article_id,
+    }
+
+
+def comment(comment_id: int, article_id: int = 1) -> dict:
+    return {
+        "id": comment_id, "message": "Комментарий", "type": 0, "vote": 0, "parent_comment_id": None, "vote_count": 1,
+        "likes_count": 0, "reply_count": 0, "is_spoiler": False, "is_edited": False, "is_deleted": False,
+        "is_reply": False, "can_like": True, "author": profile(comment_id % 50), "timestamp": 1700000000,
+        "article": article(article_id, with_repost=False),
+    }
+
+
+def user_vote(profile_id: int) -> dict:
+    return {
+        "id": profile_id, "vote": 2, "avatar": "https://s.anixart.app/avatar.jpg", "login": f"user{profile_id}",
+        "is_online": False, "is_verified": False, "is_sponsor": False,
+        "badge_id": None, "badge_name": None, "badge_type": None, "badge_url": None,
+    }
+
+
+def channel_member(profile_id: int, channel_id: int = 1) -> dict:
+    return {
+        "id": profile_id, "avatar": "https://s.anixart.app/avatar.jpg", "login": f"user{profile_id}", "is_verified": False,
+        "channel_id": channel_id, "block_reason": None, "is_sponsor": False, "permission": 0, "is_blocked": False,
+        "is_perm_blocked": False, "badge_name": None, "badge_type": None, "badge_url": None,
+        "permission_creation_date": None, "block_expire_date": None,
+    }
+
+
+def page(items: list, total_page_count: int = 1) -> dict:
+    return {"code": 0, "content": items, "total_page_count": total_page_count}
@@ -0,0 +1,21 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [ROOT, os.path.join(ROOT, "benchmarks")]
+
+from anixartpy import AnixartAPI  # noqa: E402
+from fake_server import FakeAnixart  # noqa: E402
+
+
+@pytest.fixture
+def server():
+    with FakeAnixart(pages=3, per_page=5) as fake:
+        yield fake
+
+
+@pytest.fixture
+def api(server):
+    return AnixartAPI(base_url=server.url, rate_limit=False)
@@ -0,0 +1,10 @@
+import fixtures
+from anixartpy.aio import AsyncAnixartAPI, AsyncArticle, AsyncArticleSuggestion, AsyncChannel
+
+
+def test_async_suggestion_nested_models_are_async():
+    api = AsyncAnixartAPI(rate_limit=False)
+    suggestion = AsyncArticleSuggestion(fixtures.article(10), api)
+    assert isinstance(suggestion.channel, AsyncChannel)
+    assert isinstance(suggestion.repost_article, AsyncArticle)
+    assert AsyncArticleSuggestion(fixtures.article(8), api).repost_article is None
@@ -0,0 +1,138 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from anixartpy import anix_images
+from anixartpy.aio import AsyncAnixartAPI
+from anixartpy.utils import ArticleBuilder
+
+JPEG = b"\xff\xd8\xff" + b"\x00" * 1024
+
+
+def test_editor_requests_use_pooled_session_with_timeout(api, server, monkeypatch):
+    monkeypatch.setattr(anix_images, "EDITOR_URL", server.url)
+    session = anix_images.get_relay_session()
+    real = session.request
+    calls = []
+
+    def request(method, url, **kwargs):
+        calls.append((method, kwargs.get("timeout")))
+        return real(method, url, **kwargs)
+
+    monkeypatch.setattr(session, "request", request)
+    ArticleBuilder(channel_id=1).add_media([JPEG]).build()
+    embed = anix_images.upload_embed_content(1, "https://youtu.be/dQw4w9WgXcQ")
+    assert embed["service"] == "youtube"
+    assert {method for method, _ in calls} == {"GET", "POST"}
+    assert all(timeout == anix_images.UPLOAD_TIMEOUT for _, timeout in calls)
+    assert server.hits["POST /content/upload"] == 1
+
+
+def test_async_client_uploads_without_replacing_api_instance(api, server, monkeypatch):
+    monkeypatch.setattr(anix_images, "EDITOR_URL", server.url)
+    events = []
+
+    async def main():
+        async with AsyncAnixartAPI(base_url=server.url, token="async-token") as client:
+            client.hooks.subscribe(lambda event: events.append(event.path))
+            channel = await client.get_channel(1)
+            await channel.set_avatar(JPEG)
+            return client
+
+    client = asyncio.run(main())
+    assert anix_images.API_INSTANCE is api
+    assert anix_images.current_api() is api
+    assert "/channel/avatar/upload/1" in events
+
+    events.clear()
+    with anix_images.use_api(client):
+        ArticleBuilder(channel_id=1, upload_workers=2).add_media([JPEG, JPEG]).build()
+    # загрузки из потоков пула тоже идут от имени клиента use_api
+    assert events.count("/content/upload") == 2
+
+
+def test_prepare_multipart_body_returns_bytes(tmp_path):
+    path = tmp_path / "cover.jpg"
+    path.write_bytes(JPEG)
+    body = anix_images.prepare_multipart_body(str(path), "boundary", "image")
+    assert isinstance(body, bytes)
+    assert body.startswith(b"--boundary\r\n") and body.endswith(b"\r\n--boundary--\r\n")
+    assert JPEG in body and b'filename="cover.jpg"' in body
+    with anix_images.open_multipart_body(str(path), "boundary", "image") as stream:
+        assert len(stream) == len(body)
+
+
+def test_streamed_body_length_matches_bytes_sent(api, server, tmp_path):
+    path = tmp_path / "big.jpg"
+    path.write_bytes(JPEG * 300)
+    sent = []
+    api.hooks.subscribe(lambda event: sent.append(event.bytes_out))
+    before = server.bytes_received
+    response = anix_images.post_file(f"{server.url}/channel/cover/upload/1", str(path), {}, "image")
+    assert response.status_code == 200
+    received = server.bytes_received - before
+    boundary = "-" * len(f"----WebKitFormBoundary{'0' * 32}")
+    assert received == sent[-1] == len(anix_images.prepare_multipart_body(str(path), boundary, "image"))
+
+
+def test_parallel_uploads_keep_input_order(api, server, monkeypatch):
+    monkeypatch.setattr(anix_images, "EDITOR_URL", server.url)
+    threads = set()
+
+    def slow(delay):
+        # первые элементы завершаются последними
+        threads.add(threading.get_ident())
+        time.sleep(delay)
+        return delay
+
+    delays = [0.05, 0.04, 0.03, 0.02, 0.01]
+    assert anix_images._run_ordered(slow, delays, max_workers=5) == delays
+    assert len(threads) > 1
+
+    links = [f"https://example.com/{index}" for index in range(6)]
+    results = anix_images.upload_embeds(1, links, max_workers=3)
+    assert [result["url"] for result in results] == links
+    assert server.hits["POST /embed/link"] == 6
+
+
+class Reply:
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+    def json(self):
+        return {"status": self.status_code}
+
+
+def test_media_token_is_reused_within_ttl(api, server, monkeypatch):
+    monkeypatch.setattr(anix_images, "EDITOR_URL", server.url)
+    anix_images.upload_media_files(1, [JPEG, JPEG, JPEG], max_workers=3)
+    anix_images.upload_embed_content(1, "https://example.com")
+    assert server.hits["GET /channel/{id}/editor/available"] == 1
+    anix_images.upload_embed_content(2, "https://example.com")
+    assert server.hits["GET /channel/{id}/editor/available"] == 2
+
+    now = time.monotonic() + api.media_tokens.ttl + 1
+    monkeypatch.setattr(anix_images.time, "monotonic", lambda: now)
+    anix_images.upload_embed_content(1, "https://example.com")
+    assert server.hits["GET /channel/{id}/editor/available"] == 3
+
+
+@pytest.mark.parametrize("status", anix_images.AUTH_ERROR_STATUSES)
+def test_rejected_media_token_is_refreshed_once(api, server, status):
+    tokens = []
+
+    def send(headers):
+        tokens.append(headers["Authorization"])
+        return Reply(status)
+
+    assert anix_images.send_with_media_token(1, False, False, send) == {"status": status}
+    # один повтор со свежим токеном, дальше ответ отдаётся как есть
+    assert tokens == ["Bearer media-1", "Bearer media-1"]
+    assert server.hits["GET /channel/{id}/editor/available"] == 2
+
+    tokens.clear()
+    assert anix_images.send_with_media_token(1, False, False, lambda headers: tokens.append(headers) or Reply(200)) == {"status": 200}
+    assert len(tokens) == 1
+    assert server.hits["GET /channel/{id}/editor/available"] == 2
@@ -0,0 +1,31 @@
+import asyncio
+
+from anixartpy import models
+from anixartpy.aio import AsyncAnixartAPI, AsyncArticle, AsyncArticleSuggestion
+
+
+def test_get_article_suggestion(api, server):
+    suggestion = api.get_article_suggestion(5)
+    assert isinstance(suggestion, models.ArticleSuggestion)
+    assert suggestion.id == 5
+    assert isinstance(suggestion.repost_article, models.Article)
+    assert server.hits["POST /article/suggestion/{id}"] == 1
+
+
+def test_get_suggestions(api, server):
+    suggestions = list(api.get_channel(1).get_suggestions())
+    assert len(suggestions) == server.pages * server.per_page
+    assert all(isinstance(item, models.ArticleSuggestion) for item in suggestions)
+
+
+def test_async_get_article_suggestion(server):
+    async def main():
+        async with AsyncAnixartAPI(base_url=server.url, rate_limit=False) as api:
+            suggestion = await api.get_article_suggestion(5)
+            suggestions = [item async for item in (await api.get_channel(1)).get_suggestions()]
+            return suggestion, suggestions
+
+    suggestion, suggestions = asyncio.run(main())
+    assert isinstance(suggestion, AsyncArticleSuggestion)
+    assert isinstance(suggestion.repost_article, AsyncArticle)
+    assert len(suggestions) == server.pages * server.per_page
@@ -0,0 +1,108 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from anixartpy import errors, utils
+from anixartpy.aio import AsyncAnixartAPI
+
+
+class InFlight:
+    """Считает одновременные вызовы и падает с ошибкой API на отрицательных ключах."""
+
+    def __init__(self):
+        self.current = self.peak = 0
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def enter(self, key):
+        with self._lock:
+            self.calls.append(key)
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+
+    def exit(self, key):
+        with self._lock:
+            self.current -= 1
+        if key < 0:
+            raise errors.ArticleGetError(3)
+        return key * 10
+
+    def __call__(self, key):
+        self.enter(key)
+        time.sleep(0.01)
+        return self.exit(key)
+
+    async def fetch(self, key):
+        self.enter(key)
+        await asyncio.sleep(0.01)
+        return self.exit(key)
+
+
+def test_order_duplicates_and_errors():
+    func = InFlight()
+    results = utils.fetch_many(func, [3, -1, 2, 3, 1], max_workers=2)
+    assert isinstance(results[1], errors.ArticleGetError)
+    assert results[:1] + results[2:] == [30, 20, 30, 10]
+    assert sorted(func.calls) == [-1, 1, 2, 3]
+    assert func.peak <= 2
+
+
+def test_stream_yields_every_key_once():
+    func = InFlight()
+    pairs = dict(utils.iter_fetch_many(func, range(-2, 10), max_workers=3))
+    assert set(pairs) == set(range(-2, 10))
+    assert pairs[5] == 50 and isinstance(pairs[-2], errors.AnixartError)
+    assert func.peak <= 3
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_programming_errors_propagate(max_workers):
+    def broken(key):
+        return key.missing_attribute
+
+    with pytest.raises(AttributeError):
+        utils.fetch_many(broken, [1, 2, 3], max_workers=max_workers)
+    with pytest.raises(AttributeError):
+        list(utils.iter_fetch_many(broken, [1, 2], max_workers=max_workers))
+
+
+def test_async_order_errors_and_concurrency():
+    func = InFlight()
+
+    async def main():
+        results = await utils.async_fetch_many(func.fetch, [4, -1, 4, 2] + list(range(5, 20)), concurrency=3)
+        pairs = [pair async for pair in utils.async_iter_fetch_many(func.fetch, [-3, 7], concurrency=1)]
+        return results, pairs
+
+    results, pairs = asyncio.run(main())
+    assert results[:4] == [40, results[1], 40, 20]
+    assert isinstance(results[1], errors.ArticleGetError)
+    assert func.peak <= 3
+    assert sorted(key for key, _ in pairs) == [-3, 7]
+
+
+def test_async_programming_errors_propagate():
+    async def broken(key):
+        raise TypeError(key)
+
+    async def main():
+        with pytest.raises(TypeError):
+            await utils.async_fetch_many(broken, [1, 2])
+        with pytest.raises(TypeError):
+            [pair async for pair in utils.async_iter_fetch_many(broken, [1])]
+
+    asyncio.run(main())
+
+
+def test_clients_fetch_in_order(api, server):
+    articles = api.get_articles([7, 5, 7, 9], max_workers=4)
+    assert [article.id for article in articles] == [7, 5, 7, 9]
+    assert server.hits["POST /article/{id}"] == 3
+
+    async def main():
+        async with AsyncAnixartAPI(base_url=server.url) as client:
+            return await client.get_channels([2, 1, 2])
+
+    assert [channel.id for channel in asyncio.run(main())] == [2, 1, 2]
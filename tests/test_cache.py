@@ -0,0 +1,82 @@
+import pytest
+
+from anixartpy import AnixartAPI, DiskBackend, MemoryBackend, ResponseCache, cache as cache_module
+
+
+@pytest.fixture
+def cached(server):
+    return AnixartAPI(base_url=server.url, rate_limit=False, cache=ResponseCache(default_ttl=60))
+
+
+def test_read_is_served_from_cache(cached, server):
+    assert cached.get_channel(1).id == cached.get_channel(1).id == 1
+    assert server.hits["GET /channel/{id}"] == 1
+    assert cached.cache.stats["hits"] == 1
+
+
+def test_write_gets_are_never_cached(cached, server):
+    article = cached.get_article(5)
+    for _ in range(3):
+        article.set_vote(2)
+    assert server.hits["GET /article/vote/{id}/{vote}"] == 3
+    assert cached.cache.stats["hits"] == 0
+    assert cached.cache.ttl_for("GET", "/article/vote/5/2") is None
+    assert cached.cache.ttl_for("GET", "/channel/1/editor/available") is None
+    assert cached.cache.ttl_for("GET", "/unknown") == 60
+
+
+def test_cached_response_is_not_shared(cached):
+    response = cached._get("/channel/1")
+    response["channel"]["title"] = "mutated"
+    assert cached.get_channel(1).title != "mutated"
+
+
+def test_write_invalidates_related_keys(cached, server):
+    cached.get_channel(1)
+    cached.get_channel(1).subscribe()
+    cached.get_channel(1)
+    assert server.hits["GET /channel/{id}"] == 2
+    assert cached.cache.stats["invalidations"] >= 1
+
+
+def test_ttl_expiry(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "time", lambda: now[0])
+    cache = ResponseCache()
+    cache.store("GET", "/channel/1", None, {"code": 0})
+    assert cache.get("GET", "/channel/1") == {"code": 0}
+    now[0] += 61
+    assert cache.get("GET", "/channel/1") is None
+    assert len(cache.backend) == 0
+
+
+def test_error_responses_are_not_stored():
+    cache = ResponseCache()
+    cache.store("GET", "/channel/1", None, {"code": 2})
+    assert cache.get("GET", "/channel/1") is None
+
+
+def test_memory_backend_lru_bound():
+    backend = MemoryBackend(maxsize=2)
+    backend.set("a", 1, 0)
+    backend.set("b", 2, 0)
+    backend.get("a")
+    backend.set("c", 3, 0)
+    assert backend.get("b") is None
+    assert backend.get("a") == (0, 1)
+    assert len(backend) == 2 and backend.evictions == 1
+
+
+def test_disk_backend_persists_and_evicts(tmp_path):
+    path = str(tmp_path / "cache.db")
+    backend = DiskBackend(path, maxsize=2)
+    backend.set("GET /channel/1|", {"code": 0, "title": "канал"}, 10)
+    backend.close()
+
+    backend = DiskBackend(path, maxsize=2)
+    assert backend.get("GET /channel/1|") == (10, {"code": 0, "title": "канал"})
+    backend.set("GET /channel/2|", {}, 10)
+    backend.set("GET /channel/3|", {}, 10)
+    assert len(backend) == 2 and backend.evictions == 1
+    assert backend.delete_prefix("GET /channel/") == 2
+    backend.close()
@@ -0,0 +1,87 @@
+import fixtures
+import pytest
+
+from anixartpy import ColumnarSink, enums, models
+
+np = pytest.importorskip("numpy")
+pa = pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def articles():
+    items = [fixtures.article(i) for i in range(20)]
+    items[4]["vote"] = None
+    sink = ColumnarSink("articles", batch_size=7)
+    assert sink.write(items) == 20
+    return sink
+
+
+def test_rows_split_into_batches(articles):
+    assert len(articles) == 20
+    assert [batch.num_rows for batch in articles.iter_arrow()] == [7, 7, 6]
+    assert [len(batch) for batch in articles.iter_numpy()] == [7, 7, 6]
+
+
+def test_arrow_table(articles):
+    table = articles.to_arrow()
+    assert table.schema == articles.arrow_schema()
+    assert table.num_rows == 20
+    assert table.column("id").to_pylist() == list(range(20))
+    # репост есть только у статей с id кратным 5
+    assert table.column("repost_article_id").null_count == 16
+    assert table.column("repost_article_id").to_pylist()[5] == 5 + 1000000
+    assert table.column("vote").to_pylist()[3:6] == [2, None, 2]
+    assert table.column("is_deleted").type == pa.bool_()
+    assert table.column("creation_date").type == pa.timestamp("s")
+
+
+def test_numpy_fills_nulls(articles):
+    array = articles.to_numpy()
+    assert array.dtype == articles.numpy_dtype()
+    assert array["id"].tolist() == list(range(20))
+    assert array["vote"][4] == -1
+    assert array["is_deleted"].dtype == np.bool_
+    assert not np.isnat(array["creation_date"]).any()
+
+
+def test_numpy_null_timestamps_are_nat():
+    sink = ColumnarSink("members")
+    sink.write([fixtures.channel_member(i) for i in range(5)])
+    assert sink.to_arrow().column("block_expire_date").null_count == 5
+    assert np.isnat(sink.to_numpy()["block_expire_date"]).all()
+
+
+def test_parquet_round_trip(articles, tmp_path):
+    parquet = pytest.importorskip("pyarrow.parquet")
+    path = str(tmp_path / "articles.parquet")
+    articles.write_parquet(path)
+    # Parquet хранит секундные метки времени в миллисекундах, поэтому сравниваются значения
+    assert parquet.read_table(path).to_pylist() == articles.to_arrow().to_pylist()
+    assert parquet.ParquetFile(path).num_row_groups == 3
+
+
+def test_models_are_written_from_raw_data():
+    sink = ColumnarSink("votes")
+    sink.write([models.UserVote(fixtures.user_vote(i)) for i in range(5)])
+    assert sink.to_arrow().column("id").to_pylist() == sink.to_numpy()["id"].tolist() == list(range(5))
+    assert len(sink) == 5
+
+
+def test_empty_sink():
+    sink = ColumnarSink("members")
+    assert sink.to_arrow().num_rows == 0
+    assert sink.to_numpy().dtype == sink.numpy_dtype()
+
+
+def test_unknown_schema():
+    with pytest.raises(ValueError):
+        ColumnarSink("comments")
+
+
+def test_paginator_into_sink(api, server):
+    total = server.pages * server.per_page
+    votes = ColumnarSink("votes", batch_size=4)
+    assert api.get_article(5).get_votes(enums.Sorting.NEW, raw=True).into(votes) == total
+    members = ColumnarSink("members")
+    assert api.get_channel(1).get_members(raw=True).into(members) == total
+    assert votes.to_arrow().num_rows == members.to_numpy().size == total
@@ -0,0 +1,52 @@
+import fixtures
+
+from anixartpy import enums, models
+from anixartpy.models.base import MAX_DECODERS, BaseModel, lazy
+
+
+def make_model():
+    class Sample(BaseModel):
+        __slots__ = ("id", "count")
+        _converters = {"count": int}
+
+        @lazy
+        def title(self, data):
+            return data["title"].upper()
+
+    return Sample
+
+
+def test_compiled_decoder_matches_generic_path():
+    Sample = make_model()
+    first = Sample({"id": 1, "count": "2", "title": "a"})
+    assert len(Sample._decoders) == 1
+    second = Sample({"id": 1, "count": "2", "title": "a"})
+    assert second._fields() == first._fields() == {"id": 1, "count": 2}
+    assert second.title == "A"
+
+
+def test_other_key_sets_fall_back():
+    Sample = make_model()
+    Sample({"id": 1, "count": 1, "title": "a"})
+    # тот же размер, другой ключ: декодер отказывается через KeyError
+    other = Sample({"id": 2, "count": 3, "extra": True})
+    assert other.extra is True and other.count == 3
+    assert len(Sample._decoders) == 2
+    odd = Sample({"id": 3, "not-an-identifier": 1})
+    assert getattr(odd, "not-an-identifier") == 1
+    assert len(Sample._decoders) == 2
+
+
+def test_decoder_count_is_capped():
+    Sample = make_model()
+    for index in range(MAX_DECODERS + 2):
+        Sample({"id": index, f"key{index}": index})
+    assert len(Sample._decoders) == MAX_DECODERS
+    assert getattr(Sample({"id": 0, "key9": 9}), "key9") == 9
+
+
+def test_converters_apply_on_both_paths():
+    votes = [models.UserVote(fixtures.user_vote(i)) for i in range(3)]
+    assert all(vote.vote is enums.Vote(2) for vote in votes)
+    members = [models.ChannelMember(fixtures.channel_member(i), None) for i in range(3)]
+    assert all(isinstance(member.permission, enums.ChannelMemberPermission) for member in members)
@@ -0,0 +1,54 @@
+import gc
+
+import fixtures
+import pytest
+
+from anixartpy import AnixartAPI, models
+
+
+@pytest.fixture
+def mapped(server):
+    return AnixartAPI(base_url=server.url, rate_limit=False, identity_map=True)
+
+
+def test_same_entity_shares_instance(mapped):
+    article = mapped.get_article(5)
+    assert mapped.get_article(5) is article
+    assert any(item is article for item in mapped.get_channel(1).get_articles())
+    assert article.channel is mapped.get_channel(1)
+
+
+def test_disabled_by_default(api):
+    assert api.identity_map is None
+    assert api.get_article(5) is not api.get_article(5)
+
+
+def test_partial_is_not_registered(mapped):
+    partial = mapped.get_article(5, fields=("vote_count",))
+    assert len(mapped.identity_map) == 0
+    article = mapped.get_article(5)
+    assert partial is not article
+    assert mapped.get_article(5, fields=("vote_count",)) is not article
+    assert mapped.identity_map.get(models.Article, 5) is article
+    assert article.vote_count == fixtures.article(5)["vote_count"]
+
+
+def test_repeated_entity_refreshes_instance():
+    identity_map = models.IdentityMap()
+    data = fixtures.article(5)
+    article = identity_map.resolve(models.Article, data, None)
+    assert article.channel.id == 1
+    updated = dict(data, vote_count=500, channel=dict(data["channel"], id=2))
+    assert identity_map.resolve(models.Article, updated, None) is article
+    assert article.vote_count == 500
+    # lazy-поле декодируется заново из новых данных
+    assert article.channel.id == 2
+
+
+def test_entries_are_weak():
+    identity_map = models.IdentityMap()
+    article = identity_map.resolve(models.Article, fixtures.article(5), None)
+    assert identity_map.get(models.Article, 5) is article
+    del article
+    gc.collect()
+    assert len(identity_map) == 0
@@ -0,0 +1,47 @@
+import json
+
+import pytest
+
+from anixartpy import AnixartAPI, errors, jsonlib
+
+
+def test_decoder_selection(monkeypatch):
+    assert jsonlib.get_decoder("json")(b'{"code": 0}') == {"code": 0}
+    assert jsonlib.get_decoder(len) is len
+    with pytest.raises(ValueError):
+        jsonlib.get_decoder("simdjson")
+    if jsonlib.orjson is not None:
+        assert jsonlib.get_decoder() is jsonlib.orjson.loads
+        assert jsonlib.get_decoder("orjson") is jsonlib.orjson.loads
+
+    monkeypatch.setattr(jsonlib, "orjson", None)
+    assert jsonlib.get_decoder()(b'{"title": "\xd0\xba"}') == {"title": "к"}
+    with pytest.raises(ImportError):
+        jsonlib.get_decoder("orjson")
+
+
+def test_client_uses_configured_decoder(server):
+    bodies = []
+
+    def loads(body):
+        bodies.append(body)
+        return json.loads(body)
+
+    api = AnixartAPI(base_url=server.url, json_decoder=loads)
+    assert api.get_channel(1).id == 1
+    assert len(bodies) == 1 and isinstance(bodies[0], bytes)
+
+
+def test_raw_bytes_skip_decoding_and_cache(server):
+    def broken(body):
+        raise ValueError("не JSON")
+
+    api = AnixartAPI(base_url=server.url, json_decoder=broken, retry=False, cache=True)
+    body = api.request_raw("GET", "/channel/1")
+    assert isinstance(body, bytes)
+    assert json.loads(body)["channel"]["id"] == 1
+    assert api.request_raw("GET", "/channel/1") == body
+    assert server.hits["GET /channel/{id}"] == 2
+    with pytest.raises(errors.RequestError) as info:
+        api._get("/channel/1")
+    assert info.value.error_code == errors.RequestError.INVALID_RESPONSE
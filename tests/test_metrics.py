@@ -0,0 +1,95 @@
+import pytest
+
+from anixartpy import AnixartAPI
+from anixartpy.metrics import Hooks, LatencyHistogram, MetricsCollector, RequestEvent
+
+
+def make_event(path, status=200, code=0, total=0.01, error=None, retry=False):
+    event = RequestEvent("api", "GET", path)
+    event.status = status
+    event.complete({"code": code} if code is not None else None, error, retry)
+    event.total, event.ttfb = total, None
+    event.bytes_in = 100
+    return event
+
+
+def test_hooks_run_in_subscription_order():
+    hooks, calls = Hooks(), []
+    first = hooks.subscribe(lambda payload: calls.append(("first", payload)))
+
+    @hooks.subscribe
+    def broken(payload):
+        raise RuntimeError(payload)
+
+    hooks.subscribe(lambda payload: calls.append(("last", payload)))
+    with pytest.warns(RuntimeWarning):
+        hooks.emit("request", 1)
+    assert calls == [("first", 1), ("last", 1)]
+
+    hooks.unsubscribe(first)
+    hooks.unsubscribe(broken)
+    hooks.emit("request", 2)
+    hooks.emit("other", 3)
+    assert calls[2:] == [("last", 2)]
+
+
+def test_client_emits_one_event_per_attempt(api, server):
+    events = []
+    api.hooks.subscribe(events.append)
+    api.get_channel(1)
+    api.get_article(5)
+    assert [(event.method, event.endpoint, event.status, event.code) for event in events] == [
+        ("GET", "/channel/{id}", 200, 0),
+        ("POST", "/article/{id}", 200, 0),
+    ]
+    assert all(event.total is not None and event.bytes_in > 0 for event in events)
+
+
+def test_histogram_buckets_bound_relative_error():
+    # до 2**SUB_BUCKET_BITS микросекунд у каждого значения своя корзина
+    small = 2 ** LatencyHistogram.SUB_BUCKET_BITS
+    assert len({LatencyHistogram._index(micros) for micros in range(small)}) == small
+    for micros in (1000, 12345, 987654, 45000000):
+        value = LatencyHistogram._value(LatencyHistogram._index(micros)) * 1e6
+        assert abs(value - micros) / micros <= 2 ** -(LatencyHistogram.SUB_BUCKET_BITS - 1)
+
+
+def test_histogram_percentiles():
+    histogram = LatencyHistogram()
+    assert histogram.percentile(50) is None
+    for millis in range(1, 101):
+        histogram.record(millis / 1000)
+    assert histogram.count == 100 and histogram.min == 0.001 and histogram.max == 0.1
+    assert histogram.percentile(50) == pytest.approx(0.05, rel=0.02)
+    assert histogram.percentile(99) == pytest.approx(0.099, rel=0.02)
+    assert histogram.percentile(100) <= histogram.max
+
+
+def test_to_prometheus_output():
+    collector = MetricsCollector()
+    collector(make_event("/channel/1", total=0.25))
+    collector(make_event("/channel/2", total=0.25))
+    collector(make_event("/article/all/3", status=502, code=None, error="status", retry=True))
+    lines = collector.to_prometheus().splitlines()
+    channel = 'source="api",method="GET",endpoint="/channel/{id}"'
+    page = 'source="api",method="GET",endpoint="/article/all/{page}"'
+    assert "# TYPE anixart_requests_total counter" in lines
+    assert f'anixart_requests_total{{{channel},status="200",code="0"}} 2' in lines
+    assert f'anixart_requests_total{{{page},status="502",code=""}} 1' in lines
+    assert f'anixart_request_errors_total{{{page},error="status"}} 1' in lines
+    assert f"anixart_request_retries_total{{{page}}} 1" in lines
+    assert f"anixart_response_bytes_total{{{channel}}} 200" in lines
+    assert "# TYPE anixart_request_duration_seconds summary" in lines
+    assert f'anixart_request_duration_seconds{{{channel},quantile="0.5"}} 0.250000' in lines
+    assert f"anixart_request_duration_seconds_sum{{{channel}}} 0.500000" in lines
+    assert f"anixart_request_duration_seconds_count{{{channel}}} 2" in lines
+    # без ttfb сводка по времени до первого байта пустая
+    assert not any(line.startswith("anixart_request_ttfb_seconds{") for line in lines)
+    assert collector.percentile("/channel/{id}", 50) == 0.25
+
+
+def test_client_metrics_option(server):
+    api = AnixartAPI(base_url=server.url, metrics=True)
+    api.get_channel(1)
+    assert 'endpoint="/channel/{id}",status="200",code="0"} 1' in api.metrics.to_prometheus()
+    assert AnixartAPI(base_url=server.url).metrics is None
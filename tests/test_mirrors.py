@@ -0,0 +1,62 @@
+import time
+
+from anixartpy import AnixartAPI, MirrorPool
+
+DEAD = "http://127.0.0.1:9"
+COOLDOWN = 0.05
+
+
+def test_unknown_latency_ranks_after_measured_mirror():
+    pool = MirrorPool(["http://a", "http://b"], probe_interval=None)
+    pool.record("http://b", 0.2, True)
+    assert pool.candidates() == ["http://b", "http://a"]
+
+
+def test_preference_order_while_latencies_unknown():
+    pool = MirrorPool(["http://a", "http://b", "http://c"], probe_interval=None)
+    assert pool.candidates() == ["http://a", "http://b", "http://c"]
+
+
+def test_failed_mirror_not_promoted_after_cooldown():
+    pool = MirrorPool([DEAD, "http://good"], probe_interval=None, cooldown=COOLDOWN)
+    pool.record(DEAD, None, False)
+    pool.record("http://good", 0.3, True)
+    assert pool.candidates() == ["http://good", DEAD]
+    time.sleep(COOLDOWN)
+    assert pool.candidates() == ["http://good", DEAD]
+    assert pool.score(pool.mirrors[0]) > pool.score(pool.mirrors[1])
+
+
+def test_recovered_mirror_competes_again():
+    pool = MirrorPool(["http://a", "http://b"], probe_interval=None, cooldown=COOLDOWN)
+    pool.record("http://a", 0.01, True)
+    pool.record("http://a", None, False)
+    pool.record("http://b", 0.5, True)
+    time.sleep(COOLDOWN)
+    assert pool.best() == "http://b"
+    pool.record("http://a", 0.01, True)
+    assert pool.best() == "http://a"
+
+
+def test_client_skips_dead_mirror_after_cooldown(server):
+    pool = MirrorPool([DEAD, server.url], probe_interval=None, cooldown=COOLDOWN)
+    api = AnixartAPI(base_url=server.url, rate_limit=False, mirrors=pool)
+    assert api.get_channel(1).id == 1
+    assert pool.failovers == 1
+    time.sleep(COOLDOWN)
+    assert api.get_channel(2).id == 2
+    assert pool.failovers == 1
+    assert pool.stats["mirrors"][DEAD]["requests"] == 1
+
+
+def test_failover_decisions():
+    pool = MirrorPool(["https://a", "https://b"], probe_interval=None)
+    assert pool.record_error("https://a", is_last=False, is_write=False, not_sent=False)
+    assert not pool.record_error("https://a", is_last=False, is_write=True, not_sent=False)
+    assert pool.record_error("https://a", is_last=False, is_write=True, not_sent=True)
+    assert not pool.record_error("https://b", is_last=True, is_write=False, not_sent=True)
+    assert pool.record_reply("https://a", 502, 0.1, is_last=False, is_write=False)
+    assert not pool.record_reply("https://a", 502, 0.1, is_last=False, is_write=True)
+    assert not pool.record_reply("https://b", 200, 0.1, is_last=False, is_write=False)
+    assert pool.failovers == 3
+    assert pool.stats["mirrors"]["https://b"]["latency"] == 0.1
@@ -0,0 +1,88 @@
+import fixtures
+import pytest
+
+from anixartpy import models
+from anixartpy.models.base import BaseModel, lazy
+from anixartpy.store import raw_data
+
+
+def test_badge_is_decoded_once_and_assignable():
+    vote = models.UserVote(dict(fixtures.user_vote(1), badge_id=7, badge_name="топ"))
+    badge = vote.badge
+    assert vote.badge is badge
+    assert (badge.id, badge.name) == (7, "топ")
+    vote.badge = None
+    assert vote.badge is None
+    member = models.ChannelMember(fixtures.channel_member(1), None)
+    assert member.badge is member.badge
+    assert member.badge.id is None
+
+
+def test_badge_does_not_keep_response():
+    vote = models.UserVote(fixtures.user_vote(1))
+    assert not hasattr(vote, "_data")
+    vote.badge
+    assert "badge" not in raw_data(vote)
+    vote._refresh(dict(fixtures.user_vote(1), badge_name="новый"))
+    assert vote.badge.name == "новый"
+
+
+def counting_model():
+    class Sample(BaseModel):
+        __slots__ = ("id",)
+        decoded = []
+
+        @lazy
+        def title(self, data):
+            self.decoded.append(data["title"])
+            return data["title"].upper()
+
+    return Sample
+
+
+def test_lazy_field_decodes_on_first_access_only():
+    Sample = counting_model()
+    sample = Sample({"id": 1, "title": "a"})
+    assert Sample.decoded == []
+    assert "title" not in sample.__dict__
+    assert sample.title == sample.title == "A"
+    assert Sample.decoded == ["a"]
+    with pytest.raises(AttributeError):
+        Sample({"id": 2}).title
+
+
+def test_refresh_resets_lazy_fields():
+    Sample = counting_model()
+    sample = Sample({"id": 1, "title": "a"})
+    sample.title
+    sample._refresh({"id": 1, "title": "b"})
+    assert "title" not in sample.__dict__
+    assert sample.title == "B"
+    assert Sample.decoded == ["a", "b"]
+
+    article = models.Article(fixtures.article(3), None)
+    payload = article.payload
+    article._refresh(fixtures.article(3), None)
+    assert article.payload is not payload
+
+
+def test_annotations_become_slots():
+    assert set(models.UserVote.__slots__) == {
+        "id", "vote", "avatar", "login", "is_online", "is_verified", "is_sponsor",
+        "badge_id", "badge_name", "badge_type", "badge_url",
+    }
+    # поля базового класса и lazy не дублируются в __slots__ наследника
+    assert "badge" not in models.UserVote.__slots__
+    assert "_data" not in models.UserVote.__slots__
+    vote = models.UserVote(fixtures.user_vote(1))
+    assert vote.__dict__ == {}
+    assert raw_data(vote) == fixtures.user_vote(1)
+
+
+def test_unknown_keys_fall_back_to_dict():
+    data = dict(fixtures.user_vote(1), new_field=[1, 2])
+    vote = models.UserVote(data)
+    assert vote.__dict__ == {"new_field": [1, 2]}
+    assert vote.new_field == [1, 2]
+    assert vote.login == data["login"]
+    assert raw_data(vote) == data
@@ -0,0 +1,138 @@
+import asyncio
+import json
+
+import pytest
+
+from anixartpy import MemoryCheckpointStore, PageCursor, enums, utils
+
+PER_PAGE = 40
+PAGES = [[page * PER_PAGE + i + 1 for i in range(PER_PAGE)] for page in range(4)]
+ALL = [item for page in PAGES for item in page]
+
+
+def fetcher(fail_at=None, calls=None):
+    def fetch(page):
+        if calls is not None:
+            calls.append(page)
+        if page == fail_at:
+            raise RuntimeError("boom")
+        return (PAGES[page] if page < len(PAGES) else []), len(PAGES)
+    return fetch
+
+
+def paginator(fetch=None, prefetch=0):
+    return utils.paginate(fetch or fetcher(), None, prefetch, "/items", {"sort": enums.Sorting.NEW})
+
+
+class ListSink:
+    def __init__(self):
+        self.items = []
+
+    def write(self, items, **context):
+        self.items.extend(items)
+        return len(items)
+
+
+def test_cursor_roundtrip_mid_page():
+    pages = paginator()
+    consumed = [next(pages) for _ in range(43)]
+    cursor = pages.cursor
+    assert (cursor.page, cursor.offset, cursor.total_pages) == (1, 3, 4)
+    assert cursor.key == "cursor:/items?sort=1"
+    state = json.loads(json.dumps(cursor.to_dict()))
+    assert consumed + list(paginator().resume(state)) == ALL
+
+
+def test_cursor_survives_close():
+    pages = paginator()
+    for _ in range(5):
+        next(pages)
+    pages.close()
+    assert (pages.cursor.page, pages.cursor.offset) == (0, 5)
+
+
+def test_resume_rejects_other_query():
+    with pytest.raises(ValueError):
+        utils.paginate(fetcher(), None, 0, "/other", None).resume(PageCursor("/items", {"sort": 1}, 1, 0))
+
+
+@pytest.mark.parametrize("prefetch", [0, 2])
+def test_resume_then_into_skips_consumed_items(prefetch):
+    sink = ListSink()
+    written = paginator(prefetch=prefetch).resume({"endpoint": "/items", "params": {"sort": 1}, "page": 1, "offset": 3}).into(sink)
+    assert written == len(ALL) - PER_PAGE - 3
+    assert sink.items[0] == PER_PAGE + 4
+    assert sink.items == ALL[PER_PAGE + 3:]
+
+
+def test_resume_then_pages():
+    pages = list(paginator().resume(PageCursor("/items", {"sort": 1}, 2, 10)).pages())
+    assert pages[0] == PAGES[2][10:]
+    assert pages[1:] == PAGES[3:]
+
+
+def test_checkpoint_retries_failed_page():
+    store = MemoryCheckpointStore()
+    first = list(paginator(fetcher(fail_at=2)).checkpoint(store, every=1))
+    assert first == ALL[:2 * PER_PAGE]
+    assert store.load("cursor:/items?sort=1")["page"] == 2
+    calls = []
+    rest = list(paginator(fetcher(calls=calls)).checkpoint(store))
+    assert first + rest == ALL
+    assert calls == [2, 3]
+    assert store.load("cursor:/items?sort=1") is None
+
+
+def test_checkpoint_with_block_redelivers_item_on_error(tmp_path):
+    path = str(tmp_path / "cursor.json")
+    seen = []
+    with pytest.raises(KeyboardInterrupt):
+        with paginator().checkpoint(path, every=100) as pages:
+            for item in pages:
+                if item == 50:
+                    raise KeyboardInterrupt
+                seen.append(item)
+    with paginator().checkpoint(path) as pages:
+        seen.extend(pages)
+    assert seen == ALL
+
+
+def test_into_checkpoints_only_written_batches():
+    class FailingSink(ListSink):
+        fail = True
+
+        def write(self, items, **context):
+            if self.fail and items[0] > 2 * PER_PAGE:
+                raise RuntimeError("disk full")
+            return super().write(items)
+
+    store = MemoryCheckpointStore()
+    sink = FailingSink()
+    with pytest.raises(RuntimeError):
+        paginator().checkpoint(store).into(sink, batch_size=PER_PAGE)
+    assert store.load("cursor:/items?sort=1")["page"] == 2
+    sink.fail = False
+    paginator().checkpoint(store).into(sink, batch_size=PER_PAGE)
+    assert sink.items == ALL
+
+
+def test_async_resume_then_into_skips_consumed_items():
+    async def fetch(page):
+        return fetcher()(page)
+
+    async def main():
+        sink = ListSink()
+        pages = utils.async_paginate(fetch, None, 0, "/items", {"sort": 1}).resume(PageCursor("/items", {"sort": 1}, 1, 3))
+        await pages.into(sink)
+        return sink.items
+
+    assert asyncio.run(main()) == ALL[PER_PAGE + 3:]
+
+
+def test_getter_cursor_resume(api):
+    channel = api.get_channel(1)
+    members = channel.get_members()
+    first = [next(members).id for _ in range(7)]
+    assert members.cursor.key == "cursor:/channel/1/subscriber/all"
+    rest = [member.id for member in channel.get_members().resume(members.cursor)]
+    assert first + rest == [member.id for member in channel.get_members()]
@@ -0,0 +1,92 @@
+import asyncio
+
+import fixtures
+import pytest
+
+from anixartpy import enums, utils
+from anixartpy.aio import AsyncAnixartAPI
+from anixartpy.models.base import Partial
+
+
+def test_projector_keeps_ids_and_nested_paths():
+    project = utils.projector(("vote_count", "channel.title", "payload.blocks.type", "repost_article"))
+    data = fixtures.article(5)
+    result = project(data)
+    assert isinstance(result, Partial)
+    assert set(result) == {"id", "vote_count", "channel", "payload", "repost_article"}
+    assert result["channel"] == {"id": data["channel"]["id"], "title": data["channel"]["title"]}
+    assert [set(block) for block in result["payload"]["blocks"]] == [{"id", "type"}] * len(data["payload"]["blocks"])
+    assert result["repost_article"] == data["repost_article"]
+
+
+def test_no_fields_means_no_projection():
+    assert utils.projector(None) is None
+
+
+def test_paginated_getter_with_fields(api, server):
+    articles = list(api.get_channel(1).get_articles(fields=("vote_count", "channel.title")))
+    assert len(articles) == server.pages * server.per_page
+    article = articles[0]
+    assert article.vote_count == fixtures.article(article.id)["vote_count"]
+    assert article.channel.title == fixtures.article(article.id)["channel"]["title"]
+    with pytest.raises(AttributeError):
+        article.payload
+
+
+def test_raw_items_with_fields(api):
+    items = list(api.get_channel(1).get_articles(raw=True, fields=("creation_date",)))
+    assert all(set(item) == {"id", "creation_date"} for item in items)
+
+
+def test_factory_receives_projected_dict(api):
+    ids = list(api.get_channel(1).get_articles(factory=lambda item: tuple(item), fields=("vote_count",)))
+    assert set(ids) == {("id", "vote_count")}
+
+
+def test_get_article_with_fields(api):
+    article = api.get_article(5, fields=("vote_count",))
+    assert article.id == 5
+    assert article.vote_count == fixtures.article(5)["vote_count"]
+
+
+GETTERS = [
+    ("channel", "get_articles", ()),
+    ("channel", "get_suggestions", ()),
+    ("channel", "get_members", ()),
+    ("channel", "get_administrators", ()),
+    ("channel", "get_blocked_members", ()),
+    ("article", "get_votes", (enums.Sorting.NEW,)),
+    ("article", "get_reposts", (enums.Sorting.NEW,)),
+    ("article", "get_comments", (enums.Sorting.NEW,)),
+]
+
+
+def owner(api, kind):
+    return api.get_channel(1) if kind == "channel" else api.get_article(5)
+
+
+@pytest.mark.parametrize("kind, name, args", GETTERS)
+def test_getter_raw_and_factory(api, kind, name, args):
+    getter = getattr(owner(api, kind), name)
+    models_page = getter(*args, page=0)
+    raw_page = getter(*args, page=0, raw=True)
+    assert raw_page and all(type(item) is dict for item in raw_page)
+    assert [item["id"] for item in raw_page] == [item.id for item in models_page]
+    assert getter(*args, page=0, factory=lambda item: ("built", item["id"])) == [("built", item["id"]) for item in raw_page]
+    with pytest.raises(ValueError):
+        getter(*args, page=0, raw=True, factory=dict)
+
+
+@pytest.mark.parametrize("kind, name, args", GETTERS)
+def test_async_getter_raw_and_factory(server, kind, name, args):
+    async def main():
+        async with AsyncAnixartAPI(base_url=server.url, rate_limit=False) as api:
+            parent = await (api.get_channel(1) if kind == "channel" else api.get_article(5))
+            getter = getattr(parent, name)
+            raw_items = await getter(*args, page=0, raw=True)
+            built = await getter(*args, page=0, factory=lambda item: item["id"])
+            return raw_items, built
+
+    raw_items, built = asyncio.run(main())
+    assert raw_items and all(type(item) is dict for item in raw_items)
+    assert built == [item["id"] for item in raw_items]
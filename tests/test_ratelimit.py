@@ -0,0 +1,66 @@
+import asyncio
+
+import pytest
+
+from anixartpy import AnixartAPI, RateLimiter, TokenBucket, ratelimit
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(ratelimit.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_burst_then_wait(clock):
+    bucket = TokenBucket(rate=2, burst=3)
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.reserve() == pytest.approx(0.5)
+    # очередь справедливая: следующий запрос ждёт следующего слота
+    assert bucket.reserve() == pytest.approx(1.0)
+    assert bucket.waits == 2
+
+
+def test_refill_is_capped_by_burst(clock):
+    bucket = TokenBucket(rate=2, burst=3)
+    for _ in range(3):
+        bucket.reserve()
+    clock[0] += 1.0
+    assert [bucket.reserve() for _ in range(2)] == [0.0, 0.0]
+    assert bucket.reserve() > 0
+    clock[0] += 60
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.reserve() > 0
+
+
+def test_unlimited_bucket():
+    bucket = TokenBucket(None)
+    assert all(bucket.reserve() == 0.0 for _ in range(1000))
+    asyncio.run(bucket.acquire_async())
+
+
+@pytest.mark.parametrize("method, endpoint, group", [
+    ("GET", "/channel/1", "read"),
+    ("POST", "/article/all/0", "read"),
+    ("GET", "/channel/1/editor/available", "editor"),
+    ("POST", "/article/create/1", "write"),
+    ("POST", "/channel/1/block/manage", "write"),
+    ("GET", "/article/vote/1/2", "write"),
+    ("POST", "/profile/preference/avatar/edit", "write"),
+])
+def test_group_routing(method, endpoint, group):
+    assert ratelimit.endpoint_group(method, endpoint) == group
+    assert RateLimiter().group_for(method, endpoint) == group
+
+
+def test_default_group_and_budgets():
+    limiter = RateLimiter({"read": None}, default_group="write")
+    assert limiter.group_for("GET", "/channel/1") == "write"
+    assert limiter.bucket("read").rate is None
+    assert limiter.bucket("write").rate == RateLimiter.DEFAULT_BUDGETS["write"][0]
+    limiter.acquire("unknown")
+
+
+def test_disabled_by_default(server):
+    assert AnixartAPI(base_url=server.url).rate_limiter is None
+    assert isinstance(AnixartAPI(base_url=server.url, rate_limit=True).rate_limiter, RateLimiter)
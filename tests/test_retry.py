@@ -0,0 +1,183 @@
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+
+import aiohttp
+import pytest
+import requests
+
+from anixartpy import AnixartAPI, Hooks, errors
+from anixartpy.aio import AsyncAnixartAPI
+from anixartpy.retry import CircuitBreaker, CircuitBreakers, RequestAttempts, RequestStats, RetryPolicy
+
+RESET = 0.05
+
+
+def test_breaker_transitions():
+    breaker = CircuitBreaker("host", failure_threshold=2, reset_timeout=RESET)
+    breaker.record_failure()
+    assert breaker.state == "closed"
+    breaker.record_failure()
+    assert breaker.state == "open"
+    with pytest.raises(errors.CircuitOpenError) as info:
+        breaker.before_request()
+    assert info.value.error_code == errors.RequestError.CIRCUIT_OPEN != errors.RequestError.CONNECTION
+    time.sleep(RESET)
+    assert breaker.state == "half-open"
+    breaker.before_request()
+    with pytest.raises(errors.CircuitOpenError):
+        breaker.before_request()  # Пробный запрос только один
+    breaker.record_failure()
+    assert breaker.state == "open"
+    time.sleep(RESET)
+    breaker.before_request()
+    breaker.record_success()
+    assert breaker.state == "closed"
+
+
+def test_breaker_release_allows_new_trial():
+    breaker = CircuitBreaker("host", failure_threshold=1, reset_timeout=RESET)
+    breaker.record_failure()
+    time.sleep(RESET)
+    breaker.before_request()
+    breaker.release()
+    breaker.before_request()
+
+
+def failing_request(session, *failures):
+    real = session.request
+    queue = list(failures)
+
+    def request(*args, **kwargs):
+        if queue:
+            raise queue.pop(0)
+        return real(*args, **kwargs)
+    return request
+
+
+def test_trial_broken_response_does_not_wedge_breaker(server):
+    api = AnixartAPI(base_url=server.url, rate_limit=False, retry=False,
+                     circuit_breaker=CircuitBreakers(failure_threshold=1, reset_timeout=RESET))
+    api.session.request = failing_request(api.session, requests.ConnectionError("down"),
+                                          requests.exceptions.ChunkedEncodingError("cut"))
+    with pytest.raises(errors.RequestError):
+        api.get_channel(1)
+    time.sleep(RESET)
+    with pytest.raises(errors.RequestError) as info:
+        api.get_channel(1)
+    assert not isinstance(info.value, errors.CircuitOpenError)
+    assert isinstance(info.value.__cause__, requests.exceptions.ChunkedEncodingError)
+    time.sleep(RESET)
+    assert api.get_channel(1).id == 1
+    assert api.breakers[server.url].state == "closed"
+
+
+def test_broken_response_is_retried(server):
+    api = AnixartAPI(base_url=server.url, rate_limit=False, retry=RetryPolicy(backoff=0))
+    api.session.request = failing_request(api.session, requests.exceptions.ContentDecodingError("bad gzip"))
+    assert api.get_channel(1).id == 1
+    assert api.request_stats.retries == 1
+
+
+class _BrokenResponse:
+    async def __aenter__(self):
+        raise aiohttp.ClientPayloadError("cut")
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+def test_async_trial_broken_response_does_not_wedge_breaker(server):
+    async def main():
+        async with AsyncAnixartAPI(base_url=server.url, rate_limit=False, retry=False,
+                                   circuit_breaker=CircuitBreakers(failure_threshold=1, reset_timeout=RESET)) as api:
+            session = await api._get_session()
+            real = session.request
+            failures = [aiohttp.ClientConnectionError("down"), None]
+
+            def request(*args, **kwargs):
+                if failures:
+                    failure = failures.pop(0)
+                    if failure is not None:
+                        raise failure
+                    return _BrokenResponse()
+                return real(*args, **kwargs)
+            session.request = request
+            with pytest.raises(errors.RequestError):
+                await api.get_channel(1)
+            await asyncio.sleep(RESET)
+            with pytest.raises(errors.RequestError) as info:
+                await api.get_channel(1)
+            assert isinstance(info.value.__cause__, aiohttp.ClientPayloadError)
+            await asyncio.sleep(RESET)
+            assert (await api.get_channel(1)).id == 1
+            assert api.breakers[server.url].state == "closed"
+
+    asyncio.run(main())
+
+
+def attempts_for(method, endpoint, retry=RetryPolicy(backoff=0)):
+    client = SimpleNamespace(retry=retry, request_stats=RequestStats(), hooks=Hooks(), loads=json.loads)
+    return RequestAttempts(client, method, endpoint)
+
+
+def test_attempts_retry_read_server_error():
+    attempts = attempts_for("GET", "/channel/1")
+    attempts.start()
+    assert not attempts.completed(502, b"<html>", None)
+    assert attempts.error.error_code == 502
+    assert attempts.retry_delay() == 0
+    attempts.start()
+    assert attempts.completed(200, b'{"code": 0}', None)
+    assert attempts.result == {"code": 0}
+    assert attempts.stats.as_dict()["retries"] == 1
+
+
+def test_attempts_do_not_retry_sent_write():
+    attempts = attempts_for("GET", "/article/vote/1/2")
+    assert attempts.is_write
+    attempts.failed(requests.ConnectionError("reset"), timeout=False, not_sent=False)
+    assert attempts.retry_delay() is None
+    assert attempts.error.error_code == errors.RequestError.CONNECTION
+    attempts.failed(requests.ConnectionError("refused"), timeout=False, not_sent=True)
+    assert attempts.retry_delay() == 0
+
+
+def test_attempts_invalid_json_and_retry_after():
+    attempts = attempts_for("POST", "/article/1")
+    assert not attempts.completed(200, b"not json", None)
+    assert attempts.error.error_code == errors.RequestError.INVALID_RESPONSE
+    assert isinstance(attempts.cause, ValueError)
+    assert not attempts.completed(429, b"{}", "7")
+    assert attempts.retry_delay() == 7.0
+    assert attempts_for("GET", "/channel/1", retry=None).retry_delay() is None
+
+
+def fail_first(server):
+    failures = [True]
+    server._delay_and_fail = lambda: bool(failures and failures.pop())
+
+
+def test_both_clients_share_retry_decisions(server):
+    policy = RetryPolicy(backoff=0)
+
+    def recorder(api):
+        events = []
+        api.hooks.subscribe(lambda event: events.append((event.attempt, event.status, event.error, event.retry)))
+        return events
+
+    fail_first(server)
+    api = AnixartAPI(base_url=server.url, rate_limit=False, retry=policy)
+    sync_events = recorder(api)
+    assert api.get_channel(1).id == 1
+
+    async def main():
+        async with AsyncAnixartAPI(base_url=server.url, rate_limit=False, retry=policy) as api:
+            events = recorder(api)
+            assert (await api.get_channel(1)).id == 1
+            return events
+
+    fail_first(server)
+    async_events = asyncio.run(main())
+    assert sync_events == async_events == [(0, 502, "status", True), (1, 200, None, False)]
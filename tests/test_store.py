@@ -0,0 +1,63 @@
+import pytest
+
+from anixartpy import SQLiteStore, enums
+
+
+@pytest.fixture
+def store(tmp_path):
+    with SQLiteStore(str(tmp_path / "anixart.db")) as db:
+        yield db
+
+
+def test_crawl_into_store(api, server, store):
+    channel = api.get_channel(1)
+    article = api.get_article(5)
+    total = server.pages * server.per_page
+    assert channel.get_articles().into(store) == total
+    assert article.get_comments(enums.Sorting.NEW, page=None).into(store) == total
+    assert article.get_votes(enums.Sorting.NEW).into(store, article_id=article.id) == total
+    assert channel.get_members().into(store, channel_id=channel.id) == total
+    counts = store.counts()
+    assert counts["votes"] == counts["channel_members"] == counts["comments"] == total
+    assert counts["payload_blocks"] == 3 * counts["articles"]
+    top = store.top_articles(1, limit=3)
+    assert [row["vote_count"] for row in top] == sorted((row["vote_count"] for row in top), reverse=True)
+    assert store.article_blocks(5)[0]["type"] == "header"
+
+
+def test_partial_article_keeps_stored_columns_and_blocks(api, store):
+    store.upsert_articles([api.get_article(5)])
+    before = store.query("SELECT * FROM articles WHERE id = 5")[0]
+    blocks = store.article_blocks(5)
+    assert blocks
+
+    store.upsert_articles([api.get_article(5, fields=("vote_count",))])
+    after = store.query("SELECT * FROM articles WHERE id = 5")[0]
+    assert after == before
+    assert store.article_blocks(5) == blocks
+
+
+def test_partial_article_updates_projected_columns(api, store):
+    store.upsert_articles([api.get_article(5)])
+    partial = api.get_article(5, fields=("vote_count",))
+    partial._data["vote_count"] = 1000
+    store.upsert_articles([partial])
+    row = store.query("SELECT vote_count, author_id FROM articles WHERE id = 5")[0]
+    assert row == {"vote_count": 1000, "author_id": 1}
+
+
+def test_full_article_replaces_blocks(store):
+    import fixtures
+    data = fixtures.article(5)
+    store.upsert_articles([data])
+    data["payload"]["blocks"] = data["payload"]["blocks"][:1]
+    store.upsert_articles([data])
+    assert len(store.article_blocks(5)) == 1
+
+
+def test_partial_members_keep_stored_columns(api, store):
+    channel = api.get_channel(1)
+    channel.get_members().into(store, channel_id=1)
+    before = store.query("SELECT * FROM channel_members ORDER BY profile_id")
+    channel.get_members(fields=("login",)).into(store, channel_id=1)
+    assert store.query("SELECT * FROM channel_members ORDER BY profile_id") == before
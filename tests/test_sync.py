@@ -0,0 +1,47 @@
+import json
+
+import fixtures
+
+from anixartpy import ChannelCheckpoint, models
+
+
+def article_pages(server) -> int:
+    return sum(count for template, count in server.hits.items() if "/article/all/" in template)
+
+
+def test_sync_saves_checkpoint_and_returns_only_new(api, server, tmp_path):
+    path = str(tmp_path / "checkpoints.json")
+    channel = api.get_channel(1)
+
+    fresh, checkpoint = channel.sync_articles(store=path)
+    assert [article.id for article in fresh] == list(range(15, 0, -1))
+    assert article_pages(server) == server.pages
+    with open(path, encoding="utf-8") as file:
+        assert ChannelCheckpoint.key(1) in json.load(file)
+
+    fresh, _ = channel.sync_articles(store=path)
+    assert fresh == []
+    assert article_pages(server) == server.pages + 1
+
+    server.pages = 4
+    fresh, checkpoint = channel.sync_articles(store=path)
+    assert [article.id for article in fresh] == list(range(20, 15, -1))
+    assert len(checkpoint) == 20
+
+
+def test_changed_article_is_returned():
+    checkpoint = ChannelCheckpoint(1)
+    checkpoint.update({5: fixtures.article(5)["last_update_date"], 4: fixtures.article(4)["last_update_date"]})
+    edited = dict(fixtures.article(5), last_update_date=1800000000)
+    page = [models.Article(edited, None), models.Article(fixtures.article(4), None)]
+    assert [article.id for article in checkpoint.diff(page, {})] == [5]
+
+
+def test_window_keeps_newest_articles():
+    checkpoint = ChannelCheckpoint(1, max_articles=3)
+    checkpoint.update({article_id: 0 for article_id in range(1, 6)})
+    assert sorted(checkpoint.articles) == [3, 4, 5]
+    assert checkpoint.floor == 3
+    assert checkpoint.is_known(1, None)
+    assert not checkpoint.is_known(6, 0)
+    assert ChannelCheckpoint.from_dict(checkpoint.to_dict()).articles == checkpoint.articles
@@ -0,0 +1,139 @@
+import asyncio
+
+from anixartpy import errors
+from anixartpy.aio import AsyncAnixartAPI
+
+
+def flaky_latest(api, failing_calls):
+    real = api.get_latest_article_id
+    calls = []
+
+    def latest(use_cache=True):
+        calls.append(use_cache)
+        if len(calls) in failing_calls:
+            raise errors.RequestError(errors.RequestError.CONNECTION)
+        return real(use_cache=use_cache)
+    return latest
+
+
+def test_watcher_yields_new_articles_once_in_order(api, server):
+    watcher = api.watch_articles(since=10, min_interval=0.01, max_interval=0.05)
+    ids = []
+    for article in watcher:
+        ids.append(article.id)
+        if article.id == 15:
+            server.pages = 4
+        if article.id == 20:
+            break
+    assert ids == list(range(11, 21))
+
+
+def test_watcher_survives_poll_errors(api, server):
+    api.get_latest_article_id = flaky_latest(api, {2, 3})
+    watcher = api.watch_articles(since=10, min_interval=0.01, max_interval=0.05)
+    ids = []
+    for article in watcher:
+        ids.append(article.id)
+        if article.id == 15:
+            server.pages = 4
+        if article.id == 20:
+            break
+    assert ids == list(range(11, 21))
+    assert watcher.poll_errors == 2
+
+
+def test_watcher_starts_after_failed_first_poll(api, server):
+    latest = flaky_latest(api, {1})
+
+    def growing_latest(use_cache=True):
+        article_id = latest(use_cache)
+        server.pages = 4
+        return article_id
+
+    api.get_latest_article_id = growing_latest
+    watcher = api.watch_articles(min_interval=0.01, max_interval=0.05)
+    for article in watcher:
+        assert article.id == 16
+        break
+    else:
+        raise AssertionError("watcher stopped")
+
+
+def test_async_watcher_survives_poll_errors(server):
+    async def main():
+        async with AsyncAnixartAPI(base_url=server.url, rate_limit=False) as api:
+            real = api.get_latest_article_id
+            calls = []
+
+            async def latest(use_cache=True):
+                calls.append(use_cache)
+                if len(calls) in (2, 3):
+                    raise errors.RequestError(errors.RequestError.TIMEOUT)
+                return await real(use_cache=use_cache)
+
+            api.get_latest_article_id = latest
+            watcher = api.watch_articles(since=10, min_interval=0.01, max_interval=0.05)
+            ids = []
+            async for article in watcher:
+                ids.append(article.id)
+                if article.id == 15:
+                    server.pages = 4
+                if article.id == 20:
+                    break
+            return ids, watcher.poll_errors
+
+    assert asyncio.run(main()) == (list(range(11, 21)), 2)
+
+
+
+def test_watcher_survives_api_error_codes(api, server):
+    real = api.get_latest_article_id
+    calls = []
+
+    def latest(use_cache=True):
+        # второй и третий опрос получают от сервера code != 0
+        calls.append(use_cache)
+        if len(calls) in (2, 3):
+            server.recorded["GET /article/latest"] = {"code": 2}
+        try:
+            return real(use_cache=False)
+        finally:
+            server.recorded.pop("GET /article/latest", None)
+
+    api.get_latest_article_id = latest
+    watcher = api.watch_articles(since=10, min_interval=0.01, max_interval=0.05)
+    ids = []
+    for article in watcher:
+        ids.append(article.id)
+        if article.id == 15:
+            server.pages = 4
+        if article.id == 20:
+            break
+    assert ids == list(range(11, 21))
+    assert watcher.poll_errors == 2
+
+
+def test_async_watcher_survives_api_error_codes(server):
+    async def main():
+        async with AsyncAnixartAPI(base_url=server.url, rate_limit=False) as api:
+            real = api.get_latest_article_id
+            calls = []
+
+            async def latest(use_cache=True):
+                calls.append(use_cache)
+                if len(calls) == 2:
+                    raise errors.AnixartError(2, "Не удалось получить ID последнего поста.")
+                return await real(use_cache=use_cache)
+
+            api.get_latest_article_id = latest
+            watcher = api.watch_articles(since=10, min_interval=0.01, max_interval=0.05)
+            ids = []
+            async for article in watcher:
+                ids.append(article.id)
+                if article.id == 15:
+                    server.pages = 4
+                if article.id == 20:
+                    break
+            return ids, watcher.poll_errors
+
+    assert asyncio.run(main()) == (list(range(11, 21)), 1)